@@ -3,8 +3,7 @@ from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import numpy as np
-import threading, queue, time
-from collections import deque
+import threading, queue, time, re, binascii
 import serial 
 
 # ----------------------------- Utilities -----------------------------
@@ -13,24 +12,233 @@ def _from_rgb(rgb):
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
+def _decimate_minmax(y, target):
+    """
+    Reduce y to about target samples for plotting: split into equal blocks and
+    keep each block's min and max, so spikes survive the downsampling.
+    """
+    m = len(y)
+    if m <= target:
+        return y
+    stride = -(-2 * m // target)   # ceil(2m / target): two outputs per block
+    nb = m // stride
+    blocks = y[:nb * stride].reshape(nb, stride)
+    out = np.empty(2 * nb, dtype=y.dtype)
+    out[0::2] = blocks.min(axis=1)
+    out[1::2] = blocks.max(axis=1)
+    return out
+
+
+class RingBuffer:
+    """
+    Fixed-size float32 ring for the rolling time series (replaces deque + list copies).
+    - append(y): block copy of a whole frame, wrapping at most once
+    - last(k):   newest k samples, oldest first (a view when they don't wrap)
+    """
+    def __init__(self, size=10000):
+        self.data = np.empty(size, dtype=np.float32)
+        self.size = size
+        self.head = 0    # next write position
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def append(self, y):
+        y = np.asarray(y, dtype=np.float32)
+        m = len(y)
+        if m >= self.size:
+            # frame alone fills the ring: keep its tail
+            self.data[:] = y[-self.size:]
+            self.head = 0
+            self.count = self.size
+            return
+        end = self.head + m
+        if end <= self.size:
+            self.data[self.head:end] = y
+        else:
+            split = self.size - self.head
+            self.data[self.head:] = y[:split]
+            self.data[:end - self.size] = y[split:]
+        self.head = end % self.size
+        self.count = min(self.count + m, self.size)
+
+    def last(self, k):
+        k = min(k, self.count)
+        start = self.head - k
+        if start >= 0:
+            return self.data[start:self.head]
+        return np.concatenate((self.data[start:], self.data[:self.head]))
+
+
+class TimeSeries:
+    """
+    Rolling time series for ax2 plus its stats, updated on the serial thread so
+    the Tk thread only has to draw.
+    push(y) -> (yv, std, counts): the last `window` samples (a copy), their std
+    and their histogram counts over `bins`.
+    """
+    def __init__(self, size=10000, points_per_frame=256, bins=None):
+        self.ring = RingBuffer(size)
+        self.points_per_frame = points_per_frame  # longer frames are min/max decimated
+        self.bins = np.linspace(-12, 12, 21) if bins is None else bins
+        self.window = 2000          # samples shown; set from the GUI time scale
+        self._clear = False
+
+    def request_clear(self):
+        """Empty the buffer before the next push (safe to call from the GUI thread)."""
+        self._clear = True
+
+    def push(self, y):
+        if self._clear:
+            self.ring.clear()
+            self._clear = False
+        self.ring.append(_decimate_minmax(y, self.points_per_frame))
+        yv = self.ring.last(self.window).copy()
+        std = float(np.std(yv)) if len(yv) else 0.0
+        counts, _ = np.histogram(yv, bins=self.bins)
+        return yv, std, counts
+
+
+class SPSCRing:
+    """
+    Bounded single-producer / single-consumer ring (lock-free on the hot path).
+    - put() only from the producer thread; get()/get_nowait() only from the consumer.
+    - head is written only by the producer, tail only by the consumer, so plain
+      int stores (atomic under the GIL) are enough; the Event only wakes get().
+    Raises queue.Full / queue.Empty like queue.Queue so callers read the same.
+    """
+    def __init__(self, size=1024):
+        self.size = size + 1            # one slot kept empty to tell full from empty
+        self.slots = [None] * self.size
+        self.head = 0
+        self.tail = 0
+        self.evt = threading.Event()
+
+    def __len__(self):
+        # lets consumers drain with `while q:` instead of catching queue.Empty
+        return (self.head - self.tail) % self.size
+
+    def put(self, item):
+        head = self.head
+        nxt = (head + 1) % self.size
+        if nxt == self.tail:
+            raise queue.Full
+        self.slots[head] = item
+        self.head = nxt                 # publish after the slot is written
+        self.evt.set()
+
+    def get_nowait(self):
+        tail = self.tail
+        if tail == self.head:
+            raise queue.Empty
+        item = self.slots[tail]
+        self.slots[tail] = None
+        self.tail = (tail + 1) % self.size
+        return item
+
+    def get(self, timeout=None):
+        if self.tail == self.head:
+            self.evt.clear()
+            # re-check after clear so a put() racing with us can't be missed
+            if self.tail == self.head:
+                self.evt.wait(timeout)
+        return self.get_nowait()
+
+    def wake(self):
+        """Release a consumer blocked in get() (it sees queue.Empty), e.g. on shutdown."""
+        self.evt.set()
+
+
+# Frame headers are ASCII, so they are matched as bytes (no UTF-8 decode):
+# one regex for the head word (+ optional OK), one findall for KEY=VALUE pairs
+_HDR_RE = re.compile(rb'^\s*(LINE|POINT|OK|ERR)\b(?:\s+(OK)\b)?', re.IGNORECASE)
+_KV_RE = re.compile(rb'(\w+)=(\S+)')
+# resync: a data header preceded by leftover payload bytes on the same "line"
+_HDR_SYNC_RE = re.compile(rb'(?:LINE|POINT)\s+OK\b', re.IGNORECASE)
+
+
+def _hdr_line(kv):
+    return {"kind": "line",
+            "N": int(kv.get(b"N", b"0")),
+            "IDX": int(kv.get(b"IDX", b"0")),
+            "DIR": int(kv.get(b"DIR", b"+1")),
+            "BIN": kv.get(b"BIN", b"0") == b"1",
+            "ENC": kv.get(b"ENC", b"").lower()}
+
+
+def _hdr_point(kv):
+    return {"kind": "point",
+            "COUNT": int(kv.get(b"COUNT", b"0")),
+            "BIN": kv.get(b"BIN", b"0") == b"1"}
+
+
+_HDR_DATA = {b"LINE": _hdr_line, b"POINT": _hdr_point}
+
+
 class SerialIO(threading.Thread):
     """
-    Thread that handles both TX (commands) and RX (frames).
+    Thread that handles RX (frames); TX (commands) runs in its own helper thread
+    so a burst of writes never starves the reader.
     - in_q:  commands (strings) from GUI to device
-    - out_q: parsed frames to GUI: ('line', y, idx, dir) or ('point', y)
+    - out_q: parsed frames to GUI: ('line', y, idx, dir, ts) or ('point', y, ts),
+             ts = series.push(y), i.e. the ready-to-plot (yv, std, hist counts)
     """
-    def __init__(self, port, baud, in_q: queue.Queue, out_q: queue.Queue, stop_event: threading.Event):
+    def __init__(self, port, baud, in_q: SPSCRing, out_q: SPSCRing, stop_event: threading.Event,
+                 series: TimeSeries):
         super().__init__(daemon=True)
         self.port = port
         self.baud = baud
         self.in_q = in_q
         self.out_q = out_q
         self.stop = stop_event
+        self.series = series
         self.ser = None
-        self.buf = b""
+        self.tx_thread = None
+        # RX buffer: append-only bytearray + read cursor; consumed bytes are
+        # only dropped (compacted) once the cursor passes BUF_COMPACT
+        self.buf = bytearray()
+        self.pos = 0
+
+    BUF_COMPACT = 8192
 
     def _open(self):
-        self.ser = serial.Serial(self.port, self.baud, timeout=0.1)
+        # reads return as soon as any byte arrives; the timeout only bounds idle waits
+        self.ser = serial.Serial(self.port, self.baud, timeout=0.5)
+
+    def _tx_loop(self):
+        """Send queued commands as they arrive (runs in self.tx_thread)."""
+        while not self.stop.is_set():
+            try:
+                # sleeps on the ring's Event until _send() puts (or wake() on close)
+                cmds = [self.in_q.get()]
+            except queue.Empty:
+                continue
+            # take everything else already queued (e.g. START + BIAS + LINE) ...
+            while self.in_q:
+                cmds.append(self.in_q.get_nowait())
+            chunks = []
+            for cmd in cmds:
+                if not cmd.endswith("\n"):
+                    cmd += "\n"
+                chunks.append(cmd.encode("utf-8"))
+            # ... and send it with a single write
+            self.ser.write(b"".join(chunks))
+            for cmd in cmds:
+                print(f"SENT CMD: {cmd.strip()}")
+
+    def _emit(self, frame):
+        """Hand a parsed frame to the GUI; if the ring is full, wait for it to drain."""
+        while not self.stop.is_set():
+            try:
+                self.out_q.put(frame)
+                return
+            except queue.Full:
+                time.sleep(0.005)
 
     def _readline(self):
         """
@@ -38,91 +246,148 @@ class SerialIO(threading.Thread):
         Handles CRLF and multiple lines per read.
         """
         # fast path: already have a newline in buffer
-        for sep in (b"\r\n", b"\n"):
-            idx = self.buf.find(sep)
-            if idx >= 0:
-                line = self.buf[:idx]
-                self.buf = self.buf[idx+len(sep):]
-                return line
-
-        # read more
-        chunk = self.ser.read(1024)
+        line = self._pop_line()
+        if line is not None:
+            return line
+
+        # read more: drain whatever the OS/USB buffer already holds in one syscall,
+        # or block (up to timeout) for a single byte when it's empty
+        n = self.ser.in_waiting
+        chunk = self.ser.read(n if n else 1)
         if chunk:
-            self.buf += chunk
+            self.buf.extend(chunk)
             # try again
-            for sep in (b"\r\n", b"\n"):
-                idx = self.buf.find(sep)
-                if idx >= 0:
-                    line = self.buf[:idx]
-                    self.buf = self.buf[idx+len(sep):]
-                    return line
+            return self._pop_line()
         return None
 
+    def _pop_line(self):
+        """Take one complete line from self.buf (starting at self.pos), or None."""
+        # one memchr-backed scan for LF; a CR before it (CRLF) is trimmed from the line
+        idx = self.buf.find(b"\n", self.pos)
+        if idx < 0:
+            return None
+        end = idx - 1 if idx > self.pos and self.buf[idx - 1] == 0x0D else idx
+        line = bytes(self.buf[self.pos:end])
+        self.pos = idx + 1
+        if self.pos > self.BUF_COMPACT:
+            del self.buf[:self.pos]
+            self.pos = 0
+        return line
+
+    def _readline_wait(self, timeout=1.0):
+        """
+        Like _readline, but keep reading until a full line arrives (used for the
+        payload after a header, which may span several reads). None on timeout/stop.
+        """
+        deadline = time.time() + timeout
+        while not self.stop.is_set():
+            line = self._readline()
+            if line is not None or time.time() > deadline:
+                return line
+        return None
+
+    def _readexact(self, n, timeout=1.0):
+        """
+        Return exactly n raw bytes (binary payload after a BIN=1 header) as a
+        bytearray; None on timeout/stop.
+        """
+        deadline = time.time() + timeout
+        while len(self.buf) - self.pos < n:
+            if self.stop.is_set() or time.time() > deadline:
+                # drop the partial payload so it isn't read as text; any rest of it
+                # that arrives later is skipped by _parse_header's resync
+                del self.buf[self.pos:]
+                return None
+            need = n - (len(self.buf) - self.pos)
+            chunk = self.ser.read(max(self.ser.in_waiting, need))
+            if chunk:
+                self.buf.extend(chunk)
+        raw = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        if self.pos > self.BUF_COMPACT:
+            del self.buf[:self.pos]
+            self.pos = 0
+        return raw
+
+    def _read_payload(self, hdr, count):
+        """Read the payload that follows a LINE/POINT header → float32 array or None."""
+        if hdr["BIN"]:
+            # count little-endian float32s, no text parsing at all
+            raw = self._readexact(4 * count)
+            if raw is None:
+                return None
+            return np.frombuffer(raw, dtype='<f4')
+        pl = self._readline_wait()
+        if pl is None:
+            return None
+        if hdr.get("ENC") == b"b64u16":
+            return self._parse_b64u16(pl, count)
+        return self._parse_csv_floats(pl, count)
+
+    @staticmethod
+    def _parse_b64u16(pl, count):
+        """ENC=b64u16 payload: base64 of raw uint16 LE ADC codes → float32 heights, or None."""
+        try:
+            codes = np.frombuffer(binascii.a2b_base64(pl), dtype='<u2')
+        except (binascii.Error, ValueError):
+            return None
+        if codes.size != count:
+            return None
+        # same scaling the device uses for its float replies
+        return (codes.astype(np.float32) - 32768.0) * (1.0 / 4096.0)
+
     @staticmethod
     def _parse_header(hline: bytes):
         """
         Parse header like:
           b'LINE OK N=256 IDX=0 DIR=+1'
+          b'LINE OK N=256 IDX=0 DIR=+1 BIN=1'   (payload: N*4 bytes float32 LE)
           b'POINT OK COUNT=200'
           b'OK MSG="..."'
           b'ERR CODE=... MSG="..."'
         Returns a dict: {'kind': 'line'/'point'/'ok'/'err', ...}
         """
         try:
+            m = _HDR_RE.match(hline)
+            if m is None:
+                s = _HDR_SYNC_RE.search(hline)
+                if s is not None:
+                    hline = hline[s.start():]
+                    m = _HDR_RE.match(hline)
+            head = m.group(1).upper() if m else None
+            build = _HDR_DATA.get(head)
+            if build is not None and m.group(2) is not None:
+                kv = {k.upper(): v for k, v in _KV_RE.findall(hline, m.end())}
+                return build(kv)
+            # status/unknown lines are rare: decode for logging only
             txt = hline.decode("utf-8", errors="replace").strip()
-            parts = txt.split()
-            if not parts:
+            if not txt:
                 return None
-            head = parts[0].upper()
-            kv = {}
-            for p in parts[1:]:
-                if '=' in p:
-                    k, v = p.split('=', 1)
-                    kv[k.upper()] = v
-            if head == "LINE" and parts[1].upper() == "OK":
-                return {"kind": "line",
-                        "N": int(kv.get("N", "0")),
-                        "IDX": int(kv.get("IDX", "0")),
-                        "DIR": int(kv.get("DIR", "+1"))}
-            elif head == "POINT" and parts[1].upper() == "OK":
-                return {"kind": "point",
-                        "COUNT": int(kv.get("COUNT", "0"))}
-            elif head == "OK":
-                return {"kind": "ok", "raw": txt}
-            elif head == "ERR":
-                return {"kind": "err", "raw": txt}
-            else:
-                return {"kind": "unknown", "raw": txt}
+            if head in (b"OK", b"ERR"):
+                return {"kind": head.decode().lower(), "raw": txt}
+            return {"kind": "unknown", "raw": txt}
         except Exception:
             return None
 
     @staticmethod
     def _parse_csv_floats(line: bytes, expected: int | None):
         try:
-            arr = [float(t) for t in line.decode("utf-8").strip().split(",") if t]
+            # parsed in C by numpy (text mode), no per-token Python float()
+            arr = np.fromstring(line, dtype=np.float32, sep=",")
             if expected is not None and len(arr) != expected:
                 # allow mismatch but still return whatever we got
                 pass
-            return np.array(arr, dtype=float)
+            return arr
         except Exception:
             return None
 
     def run(self):
         self._open()
+        self.tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self.tx_thread.start()
         try:
             while not self.stop.is_set():
-                # 1) writes: send all pending commands
-                try:
-                    while True:
-                        cmd = self.in_q.get_nowait()
-                        if not cmd.endswith("\n"):
-                            cmd += "\n"
-                        self.ser.write(cmd.encode("utf-8"))
-                        print(f"SENT CMD: {cmd.strip()}")
-                except queue.Empty:
-                    pass
-
-                # 2) reads: try to get a header line
+                # reads: try to get a header line (writes happen in tx_thread)
                 h = self._readline()
                 print(f"GOT LINE: {h}")
                 if h is None:
@@ -133,23 +398,17 @@ class SerialIO(threading.Thread):
                     continue
 
                 if hdr["kind"] == "line":
-                    # read one CSV payload line
-                    pl = self._readline()
-                    if pl is None:
-                        continue
-                    y = self._parse_csv_floats(pl, hdr["N"])
+                    # read one payload (CSV line or N*4 binary bytes)
+                    y = self._read_payload(hdr, hdr["N"])
                     if y is None:
                         continue
-                    self.out_q.put(("line", y, hdr["IDX"], hdr["DIR"]))
+                    self._emit(("line", y, hdr["IDX"], hdr["DIR"], self.series.push(y)))
 
                 elif hdr["kind"] == "point":
-                    pl = self._readline()
-                    if pl is None:
-                        continue
-                    y = self._parse_csv_floats(pl, hdr["COUNT"])
+                    y = self._read_payload(hdr, hdr["COUNT"])
                     if y is None:
                         continue
-                    self.out_q.put(("point", y))
+                    self._emit(("point", y, self.series.push(y)))
 
                 else:
                     # OK/ERR/unknown → you can log or ignore
@@ -157,6 +416,7 @@ class SerialIO(threading.Thread):
                     pass
 
         finally:
+            self.tx_thread.join(timeout=0.5)
             try:
                 if self.ser and self.ser.is_open:
                     self.ser.close()
@@ -171,11 +431,13 @@ class SimSerial(threading.Thread):
     Simulated microscope "serial" device. Listens for commands on cmd_q and
     posts frames to out_q. When idle, emits 'point' frames for stability tuning.
     """
-    def __init__(self, cmd_q: queue.Queue, out_q: queue.Queue, stop_event: threading.Event):
+    def __init__(self, cmd_q: queue.Queue, out_q: queue.Queue, stop_event: threading.Event,
+                 series: TimeSeries):
         super().__init__(daemon=True)
         self.cmd_q = cmd_q
         self.out_q = out_q
         self.stop = stop_event
+        self.series = series
         self.t = 0.0  # phase for stable demo signal
 
     def _make_line(self, n, line_idx, direction):
@@ -205,7 +467,7 @@ class SimSerial(threading.Thread):
                 # idle: emit a small "point" packet sometimes so GUI keeps updating
                 if time.time() >= next_idle_emit:
                     y = self._make_point(200)
-                    self.out_q.put(("point", y))
+                    self.out_q.put(("point", y, self.series.push(y)))
                     next_idle_emit = time.time() + 0.15
                     self.t += 0.05
                 continue
@@ -217,12 +479,12 @@ class SimSerial(threading.Thread):
                 # emulate scan time
                 time.sleep(min(0.002*n, 0.3))
                 y = self._make_line(n, idx, direction)
-                self.out_q.put(("line", y, idx, direction))
+                self.out_q.put(("line", y, idx, direction, self.series.push(y)))
                 self.t += 0.02
 
             elif cmd["cmd"] == "point":
                 y = self._make_point(200)
-                self.out_q.put(("point", y))
+                self.out_q.put(("point", y, self.series.push(y)))
                 self.t += 0.02
 
 
@@ -237,16 +499,19 @@ class STMApp:
         #self.cmd_q = queue.Queue()      # GUI -> device
         #self.data_q = queue.Queue()     # device -> GUI
         #self.stop_ev = threading.Event()
-        self.tx_q   = queue.Queue()   # GUI -> device (string commands)
-        self.data_q = queue.Queue()   # device -> GUI (parsed frames)
+        self.tx_q   = SPSCRing(256)   # GUI -> device (string commands)
+        self.data_q = SPSCRing(1024)  # device -> GUI (parsed frames)
         self.stop_ev = threading.Event()
+        self.series = TimeSeries()    # ax2 buffer + stats, filled on the serial thread
 
         # --- Serial config: set your Pico port ---
         PORT = "COM8"            # Windows example; on Linux: "/dev/ttyACM0" or "/dev/ttyUSB0"
         BAUD = 115200
+        self.binary_frames = True  # ask for float32 payloads (BIN=1); False -> CSV text
+        self.line_enc = "b64u16"   # LINE payload as base64 uint16 ADC codes; None -> binary_frames
 
         # Start real serial I/O
-        self.serial = SerialIO(PORT, BAUD, self.tx_q, self.data_q, self.stop_ev)
+        self.serial = SerialIO(PORT, BAUD, self.tx_q, self.data_q, self.stop_ev, self.series)
         self.serial.start()
 
         # Start polling
@@ -263,7 +528,13 @@ class STMApp:
         self.scanning = False
         self.line_idx = 0
         self.direction = +1             # +1 left->right, -1 right->left (device tells us; GUI mirrors it)
-        self.y_buffer = deque(maxlen=10000)  # rolling time-series buffer for ax2
+        self.min_redraw_interval = 0.1  # s; full canvas redraws are capped at 10 Hz
+        self._last_full_redraw = 0.0
+        self._redraw_pending = None     # Tk after() id of a deferred redraw
+        self._widget_opts = {}          # last options pushed to Tk per widget (see _config_if_changed)
+        self._interp_cache = {}         # (len(y), N) -> (x_new, x_old) grids for line resampling
+        self._xv_key = None             # (K, display_duration) of the cached ax2 time base
+        self._xv = None
 
         # ----------------- LAYOUT -----------------------
         self.side_bar = Frame(self.m, bg='lightgrey', relief='sunken', borderwidth=2)
@@ -282,17 +553,33 @@ class STMApp:
         # Top image: start blank; filled at scan start
         self.topo = None
         self.im = None  # created in reset_topography()
+        self._bg1 = None  # ax1/ax2 backgrounds for blitting, cached on every full draw
+        self._bg2 = None
 
         # Bottom plot setup
         self.ax2.grid()
         self.ax2.set_ylim(-12, 12)
         self.ax2.set_xlim(-self.display_duration, 0)
-        (self.line2,) = self.ax2.plot([], [], label="y vs time")  # data set later
-        self.update_histogram(np.array([]), norm_max=5)
+        # animated: left out of full draws and blitted on top of the cached ax2 background
+        (self.line2,) = self.ax2.plot([], [], label="y vs time", animated=True)  # data set later
+
+        # Histogram: fixed bins over the ax2 y-range, drawn as one horizontal step
+        # patch whose values are replaced in a single set_data (animated, blitted like line2)
+        self.hist_bins = self.series.bins
+        self.hist_step = self.ax2_hist.stairs(
+            np.zeros(len(self.hist_bins) - 1), self.hist_bins, orientation="horizontal",
+            fill=True, alpha=0.7, color="tab:red", animated=True
+        )
+        self.ax2_hist.set_xlim(0, 5)
+        self.ax2_hist.xaxis.set_visible(False)
+        self.ax2_hist.set_ylim(self.ax2.get_ylim())
+        self.hist_every = 5   # histogram refresh every Nth time-series update
+        self._hist_tick = 0
 
         self.fig.tight_layout(pad=0.0)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.main_area)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.toolbar = NavigationToolbar2Tk(self.canvas, self.main_area)
         self.toolbar.update()
@@ -383,69 +670,128 @@ class STMApp:
 
     # ----------------- Plot helpers -----------------
     def reset_topography(self, N):
-        # Blank image (NaNs): show nothing until lines arrive
-        self.topo = np.full((N, N), np.nan, dtype=np.float32)
-        self.ax1.clear()
-        self.ax1.set_aspect('equal', adjustable='box')
-        # Use imshow: faster to update than pcolormesh; NaNs can be made transparent
-        #cmap = self.fig.colormaps.get_cmap('viridis').copy()
-        #cmap.set_bad(alpha=0.0)
-        self.im = self.ax1.imshow(self.topo, origin='lower', interpolation='nearest', cmap='viridis', vmin=-6, vmax=6)
-        self.fig.tight_layout(pad=0.0)
+        # Blank image (NaNs): show nothing until lines arrive.
+        # Buffer and image artist are reused; only a new N reallocates the array.
+        if self.topo is not None and self.topo.shape == (N, N):
+            self.topo.fill(np.nan)
+        else:
+            self.topo = np.full((N, N), np.nan, dtype=np.float32)
+        if self.im is None:
+            # Use imshow: faster to update than pcolormesh; NaNs can be made transparent
+            #cmap = self.fig.colormaps.get_cmap('viridis').copy()
+            #cmap.set_bad(alpha=0.0)
+            self.im = self.ax1.imshow(self.topo, origin='lower', interpolation='nearest', cmap='viridis', vmin=-6, vmax=6)
+            self.fig.tight_layout(pad=0.0)
+        else:
+            self.im.set_data(self.topo)
+            self.im.set_extent((-0.5, N - 0.5, -0.5, N - 0.5))
+        self.redraw()  # full draw also re-caches the blit background
 
     def update_topography_line(self, y, line_idx, direction):
+        self.update_topography_lines([(y, line_idx, direction)])
+
+    def update_topography_lines(self, lines):
+        """Write a batch of (y, line_idx, direction) rows into topo, then repaint once."""
         N = self.topo.shape[0]
-        if len(y) != N:
-            # Resize received line to current N if device differs slightly
-            y = np.interp(np.linspace(0, len(y)-1, N), np.arange(len(y)), y)
-        row = line_idx
-        if direction >= 0:
-            self.topo[row, :] = y
-        else:
-            self.topo[row, :] = y[::-1]
+        lines = [l for l in lines if 0 <= l[1] < N]
+        if not lines:
+            return
+        rows = []
+        for y, _, direction in lines:
+            if len(y) != N:
+                # Resize received line to current N if device differs slightly
+                x_new, x_old = self._interp_grid(len(y), N)
+                y = np.interp(x_new, x_old, y)
+            rows.append(y if direction >= 0 else y[::-1])
+        idxs = np.fromiter((l[1] for l in lines), dtype=np.intp, count=len(lines))
+        self.topo[idxs, :] = np.stack(rows)
         self.im.set_data(self.topo)
+        self._blit_topo()
+
+    def _interp_grid(self, n, N):
+        """Cached x-grids for resampling an n-sample line onto N pixels."""
+        grid = self._interp_cache.get((n, N))
+        if grid is None:
+            # should not happen in a normal scan (the device echoes our N); log once per size
+            print(f"LINE has {n} samples, expected {N}: resampling")
+            grid = (np.linspace(0, n-1, N), np.arange(n))
+            self._interp_cache[(n, N)] = grid
+        return grid
+
+    def _on_draw(self, event):
+        """After every full draw (resize, zoom, draw_idle) re-cache the blit background."""
+        if event is not None and (event.canvas is not self.canvas or self.canvas.is_saving()):
+            return  # savefig render (other dpi/canvas); it also draws animated artists itself
+        self._bg1 = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self._bg2 = self.canvas.copy_from_bbox(self.ax2.bbox)
+        # animated artists are skipped by the full draw; paint them on top now
+        self._draw_ax2_artists()
+
+    def _blit_topo(self):
+        """Repaint only ax1 with the updated image instead of the whole figure."""
+        if self._bg1 is None or self.im is None:
+            return
+        self.canvas.restore_region(self._bg1)
+        self.ax1.draw_artist(self.im)
+        self.canvas.blit(self.ax1.bbox)
+
+    def _draw_ax2_artists(self):
+        self.ax2_hist.draw_artist(self.hist_step)
+        self.ax2.draw_artist(self.line2)
 
-    def append_time_series(self, y):
-        # Append to rolling buffer and update ax2
-        self.y_buffer.extend(y.tolist())
-        n = len(self.y_buffer)
-        if n == 0:
+    def _blit_ax2(self):
+        """Repaint only ax2 with the updated time-series line and histogram."""
+        if self._bg2 is None:
+            return
+        self.canvas.restore_region(self._bg2)
+        self._draw_ax2_artists()
+        self.canvas.blit(self.ax2.bbox)
+
+    def show_time_series(self, ts):
+        # ts = (yv, std, counts) as computed by TimeSeries.push on the serial thread
+        yv, std, counts = ts
+        if len(yv) == 0:
             self.line2.set_data([], [])
+            self._blit_ax2()
             return
         # Build x as a linear time base over the selected window
         # We display last K points (sample-based). K proportional to duration.
-        K = min(n, int(200*self.display_duration))  # ~200 Hz visual density
-        yv = np.array(list(self.y_buffer)[-K:], dtype=float)
-        xv = np.linspace(-self.display_duration, 0, K)
-        self.line2.set_data(xv, yv)
+        K = len(yv)
+        if self._xv_key != (K, self.display_duration):
+            # only changes while the buffer fills or the time scale moves
+            self._xv = np.linspace(-self.display_duration, 0, K)
+            self._xv_key = (K, self.display_duration)
+        self.line2.set_data(self._xv, yv)
         self.ax2.set_xlim(-self.display_duration, 0)
         # (keep fixed y-limits you set earlier)
-        self.update_histogram(yv, norm_max=5)
-        self.update_zstab_label(float(np.std(yv)))
-
-    def update_histogram(self, y, norm_max=5):
-        self.ax2_hist.cla()
-        if y is None or len(y) == 0:
-            self.ax2_hist.set_xlim(0, norm_max)
-            self.ax2_hist.xaxis.set_visible(False)
-            self.ax2_hist.set_ylim(self.ax2.get_ylim())
-            return
-        counts, bins, patches = self.ax2_hist.hist(
-            y, bins=20, orientation="horizontal", alpha=0.7, color="tab:red"
-        )
-        max_count = max(counts.max(), 1.0)
-        scale = float(norm_max) / max_count
-        for rect in patches:
-            rect.set_width(rect.get_width() * scale)
-        self.ax2_hist.set_xlim(0, norm_max)
-        self.ax2_hist.xaxis.set_visible(False)
-        self.ax2_hist.set_ylim(self.ax2.get_ylim())
+        self._hist_tick += 1
+        if self._hist_tick % self.hist_every == 0:
+            self.update_histogram(counts, norm_max=5)
+        self._blit_ax2()
+        self.update_zstab_label(std)
+
+    def update_histogram(self, counts, norm_max=5):
+        # Reuse the step patch from __init__: tallest bin == norm_max, one vectorised update
+        scale = float(norm_max) / max(counts.max(), 1)
+        self.hist_step.set_data(counts * scale)
 
     def redraw(self, tight=False):
         if tight:
             self.fig.tight_layout(pad=0.0)
+        # Rate-limit full redraws (line/topo updates are blitted in between);
+        # a throttled call becomes one trailing redraw so nothing is left stale
+        wait = self.min_redraw_interval - (time.time() - self._last_full_redraw)
+        if wait > 0 and not tight:
+            if self._redraw_pending is None:
+                self._redraw_pending = self.m.after(int(wait * 1000) + 1, self._deferred_redraw)
+            return
+        self._last_full_redraw = time.time()
         self.canvas.draw_idle()
 
+    def _deferred_redraw(self):
+        self._redraw_pending = None
+        self.redraw()
+
     # ----------------- UI callbacks -----------------
     def on_bias_change(self, val):
         print(f"[CB] Bias -> {float(val):.2f} V")
@@ -464,11 +810,13 @@ class STMApp:
 
     def on_time_scale_drag(self, val):
         self.display_duration = float(val)
+        self.series.window = int(200*self.display_duration)  # ~200 Hz visual density
         self.ax2.set_xlim(-self.display_duration, 0)
         self.canvas.draw_idle()
 
     def on_time_scale_change(self):
         self.display_duration = float(self.time_scale.get())
+        self.series.window = int(200*self.display_duration)
         self.redraw()
 
     '''def toggle_scan(self):
@@ -492,35 +840,48 @@ class STMApp:
         if not self.scanning:
             self.scanning = True
             self.start_button.config(text='Stop Scan', bg='red')
-            self.progress_bar['value'] = 0
+            self._set_progress(0)
             self.line_idx = 0
             self.direction = +1
             self.reset_topography(self.linear_size)
-            self.y_buffer.clear()
+            self.series.request_clear()
             self._request_start()
             self._request_next_line()
         else:
             self.scanning = False
             self.start_button.config(text='Start Scan', bg='green')
             self.progress_bar.stop()
-            self.progress_bar['value'] = 0
+            self._set_progress(0)
 
     # ----------------- Status/labels -----------------
     def update_scan_label(self):
         zoom = int(self.zoom_var.get())
         res = int(self.resolution_var.get())
         self.linear_size = max(1, 65536 // (zoom * res))
-        self.scan_label.config(text=f"Scan Size: {self.linear_size} x {self.linear_size}")
+        self._config_if_changed(self.scan_label, text=f"Scan Size: {self.linear_size} x {self.linear_size}")
 
         time_per_pixel_ms = 0.01  # ms
         total_seconds = int(((self.linear_size ** 2) * time_per_pixel_ms) // 1000)
         minutes, seconds = divmod(total_seconds, 60)
-        self.time_label.config(text=f"Estimated Scan Time: {minutes} min {seconds} s")
+        self._config_if_changed(self.time_label, text=f"Estimated Scan Time: {minutes} min {seconds} s")
         self.redraw()
 
+    def _config_if_changed(self, widget, **opts):
+        """widget.config(**opts), skipping options whose value is unchanged (each config is a Tcl round trip)."""
+        last = self._widget_opts.setdefault(widget, {})
+        changed = {k: v for k, v in opts.items() if last.get(k) != v}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+
     def update_zstab_label(self, std):
-        self.zstab_label.config(text=f"Z-Stability: {std:.2f}")
-        self.zstab_label.config(fg='green' if std < 0.5 else 'red')
+        # called on every poll: one config() call, and only when text/colour change
+        self._config_if_changed(self.zstab_label, text=f"Z-Stability: {std:.2f}",
+                                fg='green' if std < 0.5 else 'red')
+
+    def _set_progress(self, percent):
+        # the bar only needs whole-percent resolution
+        self._config_if_changed(self.progress_bar, value=int(percent))
 
     # ----------------- Device polling & requests -----------------
     #def _poll_device(self):
@@ -566,42 +927,37 @@ class STMApp:
         self.m.after(30, self._poll_device)'''
 
     def _poll_device(self):
-        """Poll parsed frames from serial and update plots."""
-        last_line = None
-        last_point = None
-        try:
-            while True:
-                frame = self.data_q.get_nowait()
-                kind = frame[0]
-                if kind == "line":
-                    _, y, idx, direction = frame
-                    last_line = (y, idx, direction)
-                elif kind == "point":
-                    _, y = frame
-                    last_point = y
-        except queue.Empty:
-            pass
-
-        if last_line is not None:
-            y, idx, direction = last_line
-            if self.topo is not None and 0 <= idx < self.topo.shape[0]:
-                self.update_topography_line(y, idx, direction)
-            self.append_time_series(y)
-            self.progress_bar['value'] = 100.0 * (idx + 1) / self.linear_size
-            self.redraw()
+        """Poll parsed frames from serial and update plots (all pending frames, one redraw)."""
+        lines = []
+        ts = None       # newest time-series snapshot; it already covers older frames
+        while self.data_q:
+            frame = self.data_q.get_nowait()
+            kind = frame[0]
+            if kind == "line":
+                _, y, idx, direction, ts = frame
+                lines.append((y, idx, direction))
+            elif kind == "point":
+                ts = frame[2]
+
+        if lines:
+            idx = max(l[1] for l in lines)
+            if self.topo is not None:
+                self.update_topography_lines(lines)
+            self.show_time_series(ts)
+            self._set_progress(100.0 * (idx + 1) / self.linear_size)
+            # topo, line and histogram are blitted above: no full redraw needed
 
             if self.scanning:
                 if idx + 1 < self.linear_size:
-                    self.direction = -self.direction  # keep zig-zag shadow state (GUI doesn’t enforce)
+                    self.direction = -lines[-1][2]  # keep zig-zag shadow state (GUI doesn’t enforce)
                     self.line_idx = idx + 1
                     print(f"ENQ NEXT LINE: IDX={self.line_idx}")  # <-- log
                     self._request_next_line()
                 else:
                     self.toggle_scan()
 
-        elif last_point is not None and not self.scanning:
-            self.append_time_series(last_point)
-            self.redraw()
+        elif ts is not None and not self.scanning:
+            self.show_time_series(ts)
 
         # If idle, ask for new POINT burst every ~150 ms
         #if not self.scanning:
@@ -614,8 +970,12 @@ class STMApp:
 
 
     def _send(self, s: str):
-        """Enqueue a text command to the device."""
-        self.tx_q.put(s)
+        """Enqueue a text command to the device (dropped if the TX ring is full)."""
+        try:
+            self.tx_q.put(s)
+        except queue.Full:
+            # TX thread stalled (e.g. port gone): don't raise into the Tk callback
+            print(f"TX queue full, dropped command: {s}")
 
     def _request_start(self):
         # Declare a new frame; also ensure bias is set
@@ -623,10 +983,15 @@ class STMApp:
         self._send(f"BIAS CODE={20000}")  # TODO: wire to your bias UI if needed
 
     def _request_next_line(self):
-        self._send(f"LINE N={self.linear_size} IDX={self.line_idx}")
+        if self.line_enc:
+            opt = f" ENC={self.line_enc}"
+        else:
+            opt = " BIN=1" if self.binary_frames else ""
+        self._send(f"LINE N={self.linear_size} IDX={self.line_idx}{opt}")
 
     def _request_point(self, count=200):
-        self._send(f"POINT COUNT={count}")
+        bin_opt = " BIN=1" if self.binary_frames else ""
+        self._send(f"POINT COUNT={count}{bin_opt}")
 
     # ----------------- Shutdown -----------------
     '''def _on_close(self):
@@ -638,6 +1003,7 @@ class STMApp:
         self.m.destroy()'''
     def _on_close(self):
         self.stop_ev.set()
+        self.tx_q.wake()
         try:
             self.serial.join(timeout=0.5)
         except Exception:
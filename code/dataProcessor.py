@@ -4,6 +4,10 @@ from scipy.ndimage import gaussian_filter
 
 data = [[25345, 25601, 25520, 25435, 25380, 25238, 25141, 25100, 25129, 25101, 25061, 25093, 25125, 25087, 25035, 24892, 24995, 24877, 24643, 24773, 24727, 24705, 24811, 24790, 24819, 25175, 24998, 25029, 24984, 25169, 25256, 25197, 25277, 25043, 24911, 25136, 25269, 25405, 24976, 25183, 25567, 25511, 25272, 25149, 25242, 25306, 25402, 25189, 25301, 25371, 25303, 25349, 25225, 25214, 25161, 25118, 25189, 25149, 25347, 25448, 25157, 25185, 25043, 25055, 25015, 24903, 24935, 24861, 24774, 24708, 24748, 24763, 24645, 24781, 24837, 24899, 24931, 24997, 25048, 25078, 25071, 25059, 24931, 25117, 25023, 25067, 25068, 25113, 25162, 25223, 25117, 25229, 25237, 25399, 25305, 25419, 25145, 25226, 25293, 25306, 25288, 25229, 25271, 25239, 25190, 25258, 25199, 25138, 25208, 25307, 25335, 25399, 25345, 25269, 25170, 25019, 25045, 24935, 24779, 25093, 25129, 25049, 25071, 25011, 24693, 24871, 24959, 24975], [25051, 24948, 25089, 25185, 25077, 25106, 25045, 25047, 25100, 24859, 25003, 24957, 25081, 25086, 25097, 25011, 24995, 24940, 25003, 24935, 25161, 25173, 25093, 25287, 25383, 25304, 25325, 25325, 25297, 25185, 25326, 25277, 25197, 25265, 25293, 25253, 25327, 25440, 25187, 25318, 25154, 25229, 25221, 25185, 25131, 25351, 25357, 25281, 25230, 25071, 24851, 25043, 25014, 24951, 25071, 25221, 25181, 25487, 25459, 25447, 25511, 25399, 25211, 25149, 25367, 25325, 25262, 25483, 25092, 25297, 25495, 25415, 25424, 25391, 25547, 25407, 25331, 25437, 25602, 25585, 25455, 25671, 25694, 25689, 25718, 25721, 25621, 25761, 25713, 25697, 25747, 25975, 26098, 26136, 26162, 26038, 25964, 25835, 25793, 25850, 25845, 25867, 25841, 25955, 25825, 25826, 25949, 25947, 25953, 25961, 25601, 25547, 25617, 25385, 25285, 25375, 25247, 25387, 25610, 25741, 25797, 25748, 25625, 25511, 25488, 25551, 25551, 25670, 25723, 25773, 25709, 25519, 25563, 25643, 25575, 25589, 25815, 25949, 25950, 25689, 25738, 25681, 25708, 25828, 25763, 25833, 25861, 25519, 25593, 25683, 25717, 25777, 25885, 25851, 25868, 25638, 25709, 25657, 25693, 25842, 25745, 25665, 25741, 25919, 25780, 25689, 25681, 25757, 25709, 25617, 25641, 25740, 25729, 25657, 25586, 25585, 25640, 25576, 25678, 25463, 25631, 25709, 25709, 25849, 25818, 25745, 25690, 25737, 25773, 25838, 25350, 25395, 25961, 26005, 25923, 26031, 26025, 25987, 25921, 26059, 26033, 25780, 25909, 26025, 25977, 26262, 26111, 26284, 26126, 25849, 25985, 26100, 26019, 25979, 26018, 25965, 25897, 25957, 25921, 25877, 25769, 25761, 25689, 25815, 25705, 25699, 25713, 25745, 25777, 25635, 25619, 25584, 25520, 25519, 25561, 25536, 25492, 25547, 25689, 25682, 25607, 25407, 25367, 25266, 25349, 25544, 25745, 25809, 25801, 25626, 25625, 25612, 25721, 25785, 25753, 25867], [25929, 26004, 25951, 26054, 26013, 26033, 25977, 25939, 25905, 26065, 26240, 26256, 26094, 25585, 25894, 25839, 26097, 26300, 25929, 26188, 25817, 25902, 25854, 25867, 25905, 25857, 25809, 25633, 25650, 25893, 26041, 25757, 25803, 25771, 25913, 26244, 26168, 26168, 26001, 26065, 25982, 26061, 26065, 26017, 25927, 25949, 25957, 25945, 25955, 25869, 25757, 25921, 25898, 25923, 26045, 25978, 25981, 26006, 26001, 26089, 25938, 25953, 26162, 26156, 26214, 26220, 26177, 26204, 26276, 26304, 26285, 26168, 26188, 26136, 26090, 26148, 26240, 26220, 26196, 26215, 26037, 25993, 26126, 26184, 26336, 26172, 26061, 26083, 26093, 25973, 26025, 25927, 25987, 25951, 25915, 25977, 25925, 25850, 25801, 25825, 25785, 25705, 25865, 25965, 25868, 25877, 25789, 25749, 25610, 25689, 25719, 25657, 25483, 25519, 25567, 25681, 25821, 25858, 25890, 25937, 25953, 25921, 25931, 25931, 25961, 25973, 25999, 26037, 25998, 25895, 25839, 25881, 25888, 25900, 25941, 25985, 26041, 25966, 25929, 25979, 26005, 26017, 26029, 26049, 26081, 25993, 26036, 26026, 25918, 25842, 25934, 25941, 25873, 25745, 25751, 25769, 25825, 25772, 25697, 25626, 25523, 25589, 25777, 25841, 25729, 25815, 25815, 25825, 25837, 25733, 25729, 25805, 25815, 25828, 25840, 25889, 25873, 25865, 25729, 25713, 25753, 25858, 25746, 25955, 26074, 25923, 25987, 25881, 25801, 25685, 25785, 25785, 25908, 26003, 25850, 25677, 25725, 25834, 25785, 25697, 25673, 25678, 25761, 25678, 25644, 25660, 25777, 25689, 25698, 25646, 25605, 25559, 25594, 25729, 25681, 25630, 25595, 25555, 25757, 25681, 25641, 25649, 25721, 25697, 25705, 25812, 25761, 25681, 25700, 25770, 25729, 25692, 25809, 25793, 25849, 25747, 25718, 25721, 25710, 25749, 25821, 25858, 25737, 25835, 25835, 25925, 25821, 25841, 25657, 25741, 25599, 25882, 25893, 25945, 25857, 25938], [25918, 25869, 25867, 25852, 25938, 25961, 25841, 25801, 25785, 25801, 25833, 25667, 25677, 25621, 25613, 25551, 25519, 25673, 25777, 25725, 25689, 25556, 25411, 25448, 25561, 25585, 25637, 25578, 25567, 25586, 25551, 25521, 25544, 25609, 25667, 25755, 25777, 25811, 25801, 25794, 25818, 25813, 25793, 25769, 25780, 25821, 25806, 25769, 25753, 25809, 25803, 25833, 25835, 25869, 25849, 25852, 25861, 25897, 25937, 25977, 25932, 26004, 25962, 25857, 25797, 25815, 25825, 25764, 25779, 25802, 25801, 25850, 25771, 25899, 25939, 25947, 25937, 25929, 25945, 25985, 25889, 25930, 25853, 25818, 25809, 25817, 25849, 25801, 25788, 25821, 25835, 25825, 25795, 25794, 25785, 25841, 25945, 26021, 26025, 26051, 26071, 26067, 26002, 25957, 25989, 25949, 26035, 26073, 26153, 26220, 26248, 26154, 26094, 26013, 25899, 25809, 25795, 25779, 25853, 25845, 25705, 25793, 25953, 25938, 25793, 25884, 25891, 25805, 25762, 25818, 25819, 25754, 25711, 25762, 25801, 25849, 25793, 25741, 25814, 25689, 25659, 25507, 25471, 25535, 25569, 25551, 25563, 25659, 25423, 25349, 25407, 25487, 25551, 25621, 25747, 25701, 25693, 25721, 25697, 25625, 25698, 25729, 25677, 25827, 25857, 25787, 25780, 25897, 25961, 25781, 25705, 25841, 25950, 25610, 25456, 25721, 25833, 25618, 25547, 25583, 25555, 25567, 25593, 25649, 25685, 25649, 25689, 25644, 25709, 25746, 25777, 25757, 25699, 25757, 25734, 25545, 25613, 25519, 25443, 25567, 25779, 25814, 25757, 25689, 25713, 25707, 25713, 25713, 25721, 25725, 25691, 25682, 25749, 25805, 25815, 25825, 25827, 25825, 25780, 25857, 25852, 25882, 25845, 25881, 25834, 25925, 25964, 25901, 25849, 25821, 25717, 25543, 25561, 25584, 25305, 25565, 25657, 25363, 25306, 25347, 25308, 25039, 25553, 25749, 25841, 25543, 25891, 25777, 25828, 25858, 25914, 26027, 25797, 25695, 25309, 25046], [25499, 25427, 25221, 25393, 25463, 25455, 25487, 25558, 25636, 25593, 25683, 25729, 25630, 25689, 25762, 25841, 25862, 25884, 25905, 25809, 25873, 25721, 25597, 25503, 25569, 25535, 25809, 25837, 25577, 25741, 25769, 25630, 25346, 25393, 25504, 25556, 25660, 25729, 25707, 25689, 25660, 25666, 25676, 25475, 25443, 25447, 25201, 25455, 25922, 26017, 25945, 25721, 25639, 25579, 25609, 25609, 25615, 25545, 25575, 25753, 25909, 25813, 25677, 25583, 25575, 25492, 25331, 25399, 25487, 25425, 25435, 25343, 25451, 25439, 25404, 25427, 25463, 25448, 25367, 25431, 25437, 25359, 25450, 25543, 25710, 25685, 25559, 25570, 25625, 25681, 25811, 25955, 26009, 25962, 25789, 25723, 25758, 25737, 25829, 25674, 25796, 25661, 25732, 25858, 25750, 25649, 25694, 25582, 25627, 25705, 25741, 25777, 25745, 25773, 25826, 25819, 25753, 25667, 25671, 25682, 25603, 25575, 25519, 25551, 25531, 25567, 25615, 25535, 25560, 25737, 25649, 25789, 25584, 25701, 25666, 25701, 25668, 25595, 25661, 26100, 26238, 26136, 26077, 26033, 26123, 26264, 26222, 26300, 26216, 26172, 26049, 26050, 26027, 25985, 26054, 25985, 25909, 25841, 25771, 25826, 25818, 25813, 25885, 25804, 25867, 25837, 25780, 25701, 25669, 25651, 25657, 25716, 25537, 25317, 25373, 25261, 25282, 25270, 25519, 25535, 25459, 25663, 25889, 25801, 25463, 25567, 25609, 25644, 25678, 25662, 25723, 25805, 25946, 25902, 25905, 25826, 25853, 26009, 26014, 25973, 25978, 25771, 25697, 25745, 25729, 25650, 25745, 25737, 25731, 25737, 25747, 25769, 25861, 25885, 25814, 25407, 25609, 25585, 25553, 25729, 25905, 25804, 25729, 25709, 25657, 25634, 25643, 25633, 25495, 25427, 25379, 25407, 25495, 25505, 25481, 25354, 25309, 25253, 25269, 25305, 25317, 25270, 25317, 25369, 25297, 25463, 25503, 25560, 25567, 25547, 25537, 25563, 25556, 25587, 25617, 25625], [25605, 25602, 25569, 25601, 25593, 25585, 25580, 25596, 25633, 25669, 25727, 25751, 25571, 25551, 25487, 25556, 25645, 25681, 25633, 25596, 25607, 25607, 25674, 25593, 25563, 25459, 25491, 25419, 25286, 25312, 25285, 25261, 25325, 25384, 25347, 25383, 25325, 25254, 25211, 25231, 25181, 25107, 25105, 25133, 25139, 25200, 25213, 25227, 25086, 25073, 24819, 25105, 25325, 25423, 25427, 25387, 25359, 25403, 25173, 25087, 25127, 25197, 25199, 25306, 25327, 25335, 25395, 25335, 25395, 25435, 25395, 25369, 25384, 25403, 25531, 25483, 25499, 25472, 25043, 24514, 24466, 24563, 24574, 24727, 24729, 24878, 24787, 24514, 24819, 24819, 24803, 25181, 25373, 25048, 25087, 25113, 25094, 25027, 25129, 24915, 24554, 24643, 24939, 25097, 24949, 25035, 25085, 25089, 25007, 24971, 25007, 25071, 25075, 24907, 24811, 24560, 24679, 24677, 24709, 24803, 24727, 24787, 24751, 24963, 25077, 24583, 24466, 24991, 25239, 24819, 24555, 24987, 25229, 25293, 24887, 24896, 24895, 24843, 24885, 24933, 24959, 24972, 24932, 24827, 24709, 24490, 24805, 24981, 25075, 25136, 25125, 25101, 25044, 25088, 25003, 24907, 24891, 24815, 24811, 25175, 24789, 24667, 24647, 24715, 24794, 24795, 24843, 24849, 24840, 24891, 25013, 25005, 24997, 24989, 25019, 24972, 24963, 24903, 24950, 24963, 25035, 25103, 25117, 24987, 25086, 25194, 25173, 25019, 24878, 25023, 24792, 24862, 24799, 24844, 24807, 24840, 24904, 24961, 25013, 25071, 25085, 24933, 24859, 24899, 24829, 24823, 24896, 24879, 24989, 25023, 25052, 24919, 24883, 24943, 24903, 24865, 24845, 24904, 24861, 24981, 25035, 24851, 24719, 24867, 24971, 24855, 24863, 24876, 24875, 24935, 24959, 24979, 24981, 24928, 24957, 24887, 24851, 25011, 24841, 24948, 25003, 25027, 25035, 25069, 25129, 25039, 24910, 24787, 24995, 25027, 25173, 25121, 25185, 25347, 25257, 25301], [25209, 25425, 25556, 25149, 25151, 25078, 25261, 25146, 25091, 25071, 25015, 25075, 25249, 25303, 25393, 25357, 25329, 25403, 25495, 25439, 25584, 25705, 25563, 25511, 25631, 25601, 25497, 25428, 25521, 25507, 25449, 25392, 25440, 25451, 25479, 25455, 25441, 25331, 25138, 25249, 25141, 24877, 25135, 25459, 25495, 25435, 25399, 25247, 25347, 25318, 25097, 25121, 25229, 25325, 25325, 25385, 25503, 25356, 25481, 25553, 25613, 25615, 25589, 25439, 25487, 25513, 25579, 25701, 25471, 25567, 25347, 25367, 25355, 25273, 25201, 25285, 25618, 25093, 25021, 25019, 25023, 24983, 25035, 25125, 25137, 25149, 25126, 25215, 25142, 25233, 25249, 25237, 25261, 25295, 25359, 25077, 25217, 25169, 25189, 25455, 25495, 25596, 25929, 26033, 25515, 25495, 25597, 25884, 25961, 25865, 25402, 25527, 25649, 25793, 25837, 25749, 25837, 25731, 25809, 25559, 25670, 25769, 25761, 25650, 25737, 25741, 25646, 25585, 25519, 25464, 25436, 25235, 25417, 25424, 25376, 25447, 25287, 25305, 25369, 25313, 25417, 25338, 25495, 25547, 25613, 25620, 25869, 25925, 25957, 25940, 25961, 25895, 25809, 25785, 25837, 25852, 25856, 25865, 25713, 25658, 25745, 25801, 25627, 25690, 25779, 25757, 25753, 25771, 25801, 25843, 25803, 25793, 25785, 25761, 25576, 25651, 25489, 25479, 25551, 25628, 25657, 25503, 25448, 25463, 25472, 24995, 24952, 24971, 25197, 25005, 25022, 24991, 25158, 25279, 25384, 25363, 25407, 25579, 25845, 25492, 25255, 25191, 25341, 25511, 25741, 25756, 25724, 25725, 25659, 25706, 25543, 25407, 25503, 25596, 25713, 25645, 25583, 25531, 25503, 25379, 25427, 25543, 25577, 25453, 25567, 25653, 25746, 25725, 25584, 25611, 25555, 25551, 25519, 25519, 25551, 25659, 25731, 25745, 25733, 25809, 25817, 25789, 25721, 25709, 25642, 25645, 25483, 25472, 25511, 25543, 25521, 25556, 25431, 25464, 25415, 25379], [25405, 25370, 25360, 25403, 25459, 25439, 25451, 25391, 25433, 25424, 25381, 25353, 25425, 25527, 25359, 25367, 25321, 25317, 25290, 25357, 25523, 25507, 25543, 25585, 25638, 25659, 25689, 25689, 25658, 25555, 25733, 25785, 25795, 25847, 25813, 25745, 25689, 25593, 25586, 25543, 25625, 25793, 25723, 25694, 25741, 25699, 25757, 25746, 25756, 25827, 25754, 25694, 25672, 25679, 25692, 25621, 25459, 25585, 25610, 25559, 25603, 25637, 25313, 25269, 25157, 25361, 25515, 25515, 25521, 25487, 25503, 25497, 25515, 25527, 25567, 25572, 25495, 25551, 25625, 25621, 25689, 25753, 25791, 25685, 25705, 25777, 25737, 25729, 25633, 25597, 25547, 25383, 25511, 25307, 25529, 25465, 25543, 25205, 25229, 25364, 24967, 25270, 25266, 25075, 25329, 25747, 25813, 25699, 25616, 25463, 25521, 25492, 25537, 25393, 25405, 25373, 25467, 25503, 25428, 25375, 25336, 25085, 25139, 25242, 25222, 25200, 25173, 25174, 25277, 25399, 25339, 25131, 25134, 25233, 25125, 25175, 25192, 25223, 25173, 25173, 25181, 25081, 25067, 25198, 25098, 25233, 25197, 25269, 24983, 25295, 25341, 25309, 25278, 25327, 25297, 25293, 25255, 25207, 25225, 25149, 25209, 25213, 25167, 25210, 25193, 25309, 25311, 25207, 25185, 25133, 25197, 25243, 25293, 25320, 25285, 25343, 25193, 25237, 25249, 25138, 25225, 25277, 25261, 25113, 25076, 25143, 25132, 25126, 25102, 25167, 25262, 25273, 25237, 25167, 25195, 25241, 25360, 25455, 25441, 25426, 25285, 25301, 25335, 25391, 25342, 25079, 25071, 25107, 25233, 25237, 25258, 25317, 25269, 25309, 25156, 25170, 25173, 25254, 25407, 25484, 25467, 25367, 25336, 25335, 25317, 25286, 25198, 25223, 25221, 25234, 25265, 25269, 25215, 25043, 25167, 25261, 25321, 25392, 25439, 25423, 25303, 25237, 25342, 25468, 25474, 25535, 25357, 25335, 25331, 25217, 25229, 25359, 25378, 25363, 25363, 25345], [25405, 25503, 25351, 25277, 25318, 25374, 25371, 25459, 25545, 25479, 25519, 25395, 25451, 25519, 25567, 25465, 25335, 25367, 25420, 25435, 25456, 25335, 25175, 25150, 25085, 25215, 25141, 25067, 25184, 25029, 25134, 25117, 25237, 25005, 25145, 25076, 24711, 24803, 24955, 25011, 24955, 24927, 24955, 24947, 24915, 24864, 24895, 24801, 24897, 24879, 24865, 24875, 24864, 24943, 24952, 24935, 24859, 24891, 25035, 25217, 25207, 25335, 25547, 25617, 25682, 25551, 25559, 25557, 25465, 25467, 25399, 25325, 25325, 25222, 25318, 25249, 25093, 25075, 25173, 24991, 24940, 25383, 25531, 25575, 25650, 25421, 25229, 25068, 25247, 25331, 25439, 25527, 25415, 25190, 25059, 24957, 24823, 24879, 24991, 24959, 24849, 25045, 25059, 25043, 25028, 25051, 24779, 24791, 24984, 25011, 24877, 24827, 25239, 25451, 25117, 24817, 24891, 24979, 24781, 24923, 25123, 25347, 24916, 24975, 24995, 25205, 25221, 25335, 25129, 24870, 25091, 25102, 25555, 25543, 25444, 25379, 25391, 25336, 25241, 25617, 25653, 25585, 24995, 25193, 25081, 24859, 24956, 24955, 25293, 25435, 25146, 25253, 25145, 25193, 25207, 25181, 25371, 25415, 25455, 25320, 25269, 25313, 25335, 25375, 25285, 25317, 25293, 25326, 25399, 25455, 25424, 25384, 25285, 25271, 25367, 25523, 25391, 25352, 25369, 25247, 25231, 25214, 25144, 25037, 25059, 25145, 25109, 25289, 24979, 25265, 25003, 24779, 25343, 25427, 25085, 25117, 25511, 25415, 25331, 25273, 25367, 25423, 25391, 25339, 25317, 25285, 25304, 25317, 25321, 25363, 25309, 25221, 25262, 25185, 25122, 25079, 25031, 24671, 24675, 24635, 24864, 25218, 25381, 25355, 25325, 25327, 25245, 25213, 25303, 25287, 25303, 25309, 25341, 25347, 25312, 25379, 25431, 25301, 25341, 25431, 25463, 25417, 25329, 25229, 25235, 25223, 25253, 25159, 25169, 25168, 25239, 25225, 25246, 25253, 25197, 25335], [25122, 25071, 24432, 24763, 24863, 24876, 24931, 25153, 25301, 24827, 24675, 25028, 25027, 24819, 25045, 25021, 25024, 25003, 25051, 25045, 24923, 25021, 24887, 24693, 24727, 24773, 24859, 24899, 25023, 24917, 24969, 25130, 25043, 25021, 24981, 24935, 24987, 24960, 24987, 24991, 24916, 24915, 24971, 25055, 25071, 25015, 24979, 25007, 24957, 24955, 24935, 24963, 25047, 25114, 24931, 24971, 24979, 25113, 25043, 24979, 24763, 24819, 24771, 24982, 24957, 24860, 24781, 24839, 24851, 24875, 24819, 24659, 24290, 24450, 24354, 24290, 24179, 24063, 24059, 23970, 24117, 23943, 23931, 24052, 24047, 24003, 24122, 24179, 24102, 24106, 24104, 23911, 23895, 24130, 24474, 24314, 24196, 24198, 24126, 24258, 24182, 24122, 24399, 24298, 24477, 25221, 25593, 25575, 25471, 25339, 25313, 25375, 25304, 25229, 25287, 25221, 25152, 25130, 25339, 25104, 24968, 24977, 24747, 24741, 24758, 24739, 24840, 24903, 24916, 24715, 24506, 24693, 24817, 24823, 24909, 24975, 25019, 25019, 25077, 25077, 25039, 25045, 25051, 25109, 24924, 24880, 24862, 24925, 24923, 24971, 24963, 25071, 25000, 25052, 25055, 25011, 24865, 24935, 25157, 25075, 25100, 25077, 25102, 24992, 25051, 24955, 25135, 25189, 25072, 25048, 25019, 25035, 24787, 24638, 24827, 24843, 24793, 24775, 24911, 24912, 24877, 24675, 24883, 24975, 25039, 25035, 25020, 25027, 24943, 24877, 24851, 24893, 24812, 24819, 24901, 25076, 24831, 24709, 24787, 24893, 24883, 24803, 24887, 24516, 24571, 24885, 25051, 25035, 25019, 24939, 24927, 24919, 24997, 24979, 25017, 24938, 24953, 24943, 24995, 24900, 24908, 25003, 24927, 24926, 24939, 24883, 24923, 24921, 24891, 24747, 24751, 24783, 24759, 24833, 24775, 24835, 24859, 24860, 24837, 24780, 24498, 24571, 24615, 24567, 24908, 24942, 24933, 24967, 24859, 24903, 24845, 24877, 24900, 24891, 24867, 24878], [24935, 24972, 24955, 24981, 24498, 24684, 24723, 24739, 24927, 24819, 24571, 24615, 24526, 24556, 24474, 24451, 24443, 24599, 24732, 24747, 24827, 24803, 24845, 24768, 24728, 24759, 24717, 24703, 24704, 24671, 24727, 24820, 24804, 24773, 24739, 24839, 24903, 24912, 24824, 24811, 24366, 24667, 24474, 24643, 24675, 24421, 24604, 24490, 24506, 24310, 24500, 24611, 24654, 24564, 24422, 24422, 24446, 24351, 24274, 24514, 24603, 24583, 24694, 24571, 24330, 24279, 24350, 24409, 24402, 24277, 24499, 24613, 24667, 24708, 24715, 24649, 24603, 24595, 24651, 24546, 24695, 24655, 24506, 24560, 24787, 24691, 24632, 24642, 24607, 24727, 24881, 24931, 24915, 25007, 24908, 25023, 25085, 24831, 24647, 24789, 24867, 24715, 24671, 24700, 24975, 25061, 24983, 24984, 24901, 24900, 24956, 24985, 24939, 24964, 24900, 25011, 25137, 25039, 25059, 25067, 24991, 25149, 25173, 25161, 24926, 24878, 25027, 25011, 25047, 25086, 25079, 25075, 25027, 24767, 25036, 25075, 25099, 24919, 24979, 25146, 25117, 25011, 25007, 24792, 24879, 24851, 24891, 24763, 24699, 24808, 24875, 24885, 24861, 24803, 24915, 24815, 24624, 24791, 24851, 24627, 24787, 24931, 24747, 24827, 24827, 24989, 24967, 24899, 25011, 25019, 25101, 24915, 25134, 25093, 25075, 25141, 25035, 25035, 25027, 25082, 25085, 25077, 25007, 24867, 24955, 24995, 24923, 24867, 24820, 24881, 24923, 25005, 24859, 24987, 24887, 24843, 24925, 24827, 24939, 24859, 24757, 24883, 24907, 24855, 24911, 24815, 24971, 25011, 25007, 25089, 24871, 24964, 24963, 25097, 25097, 25081, 25163, 25095, 25149, 24821, 24891, 24907, 24928, 24987, 25062, 24951, 25086, 25161, 25077, 24983, 25003, 24948, 24975, 25019, 24919, 24915, 24935, 24791, 24711, 24727, 24787, 24795, 24767, 24811, 24731, 24765, 24783, 24779, 24651, 24948, 24875, 24899, 24695, 24645, 24631, 24627], [24973, 24949, 24964, 24987, 24867, 24723, 24689, 24747, 24751, 24851, 24771, 24699, 24628, 24667, 24299, 24340, 24434, 24444, 24422, 24532, 24472, 24384, 24591, 24371, 24514, 24631, 24771, 25205, 25201, 25197, 25261, 25169, 25182, 25043, 25150, 25097, 25231, 25048, 25051, 25112, 25123, 24952, 25077, 24939, 25103, 25129, 25003, 25231, 25145, 24929, 24967, 24700, 24835, 24929, 24851, 24647, 24739, 24863, 24859, 24804, 25003, 24987, 24940, 24975, 25111, 24947, 24958, 24919, 24887, 24843, 24827, 24851, 24758, 24716, 24893, 24955, 24741, 24715, 24792, 24852, 24678, 24843, 25035, 24843, 24887, 24863, 24772, 24613, 24611, 24571, 24667, 24571, 24514, 24491, 24647, 24755, 24764, 24571, 24703, 24677, 24813, 24799, 24891, 24787, 24771, 24819, 24851, 24633, 24739, 25109, 24955, 25011, 24884, 24943, 24963, 25059, 25003, 25095, 25169, 25161, 25003, 24849, 24941, 24897, 24709, 24843, 24849, 24771, 24915, 24723, 24755, 24535, 24568, 24699, 24760, 24703, 24609, 24691, 24628, 24691, 24763, 24667, 24635, 24595, 24436, 24615, 24731, 24707, 24751, 24712, 24789, 24771, 24779, 24767, 24789, 24755, 24749, 24735, 24748, 24783, 24731, 24675, 24735, 24767, 24795, 24835, 24771, 24735, 24663, 24669, 24719, 24755, 24859, 24837, 24827, 24830, 24865, 24891, 24803, 24723, 24728, 24719, 24629, 24705, 24804, 24583, 24616, 24799, 24667, 24659, 24635, 24632, 24691, 24655, 24652, 24676, 24571, 24615, 24574, 24637, 24653, 24629, 24522, 24534, 24394, 24418, 24402, 24470, 24392, 24498, 24434, 24318, 24378, 24314, 24302, 24458, 24475, 24522, 24458, 24274, 24305, 24247, 24372, 24330, 24546, 24672, 24667, 24561, 24526, 24514, 24552, 24596, 24562, 24530, 24514, 24446, 24446, 24434, 24515, 24538, 24507, 24587, 24514, 24636, 24755, 24901, 24764, 24506, 24779, 25029, 24859, 24827, 24771, 24703, 24795, 24719], [24717, 24739, 24703, 24423, 24346, 24347, 24451, 24514, 24611, 24516, 24562, 24617, 24450, 24374, 24404, 24474, 24334, 24450, 24500, 24498, 24491, 24499, 24490, 24498, 24262, 24230, 24242, 24347, 24346, 24315, 24338, 24447, 24346, 24583, 24707, 24703, 24576, 24466, 24490, 24410, 24399, 24397, 24435, 24438, 24446, 24406, 24378, 24065, 24122, 24290, 24234, 24196, 24330, 24352, 24335, 24390, 24741, 24676, 24510, 24366, 24743, 24450, 24142, 24246, 24178, 24118, 24302, 24282, 24534, 24567, 24490, 24372, 24411, 24339, 24306, 24187, 24258, 24371, 24531, 24561, 24502, 24367, 24406, 24410, 24410, 24428, 24462, 24414, 24392, 24462, 24560, 24620, 24610, 24546, 24590, 24546, 24373, 24422, 24506, 24566, 24475, 24403, 24387, 24553, 24587, 24715, 24560, 24234, 24178, 24322, 24571, 24590, 24468, 24158, 24404, 24444, 24222, 24266, 24348, 24254, 24362, 24479, 24443, 24362, 24442, 24474, 24394, 24314, 24310, 24304, 24250, 24303, 24507, 24111, 24134, 24378, 24486, 24561, 24402, 24482, 24410, 24502, 24653, 24363, 24402, 24395, 24386, 24395, 24298, 24370, 24560, 24571, 24446, 24368, 24424, 24446, 24458, 24378, 24250, 24418, 24050, 24155, 24194, 24358, 24669, 24667, 24375, 24579, 24792, 24560, 24422, 24434, 24342, 24370, 24435, 24446, 24470, 24437, 24292, 24090, 24284, 24186, 24266, 24190, 24259, 24094, 24049, 24031, 24085, 24165, 24346, 24074, 24122, 23988, 23988, 24039, 24299, 24346, 24508, 24683, 24546, 24667, 24234, 24240, 24188, 24202, 24364, 24546, 24314, 24330, 24338, 24124, 24120, 24146, 24266, 24186, 24382, 24338, 24451, 24976, 24366, 24531, 24687, 24571, 24719, 24589, 24657, 24591, 24587, 24621, 24618, 24567, 24467, 24522, 24607, 24992, 24691, 24827, 24707, 24644, 24873, 24787, 24859, 24895, 24756, 24835, 24803, 24992, 24869, 24763, 24290, 24476, 24571, 24556, 24572, 24498], [24500, 24514, 24446, 24362, 24154, 24382, 24331, 24131, 24291, 23913, 24043, 24050, 24410, 24416, 24664, 24707, 24675, 24530, 24554, 24681, 24571, 24478, 24510, 24522, 24603, 24560, 24510, 24526, 24641, 24656, 24580, 24611, 24437, 24278, 24514, 24560, 24434, 24490, 24458, 24522, 24538, 24571, 24462, 24394, 24556, 24380, 24362, 24418, 24381, 24516, 24259, 24484, 24530, 24484, 24474, 24501, 24546, 24455, 24591, 24508, 24498, 24390, 24514, 24419, 24420, 24354, 24143, 24238, 24132, 24116, 24210, 24390, 24466, 24498, 24466, 24418, 24314, 24454, 24537, 24811, 24732, 24731, 24523, 24210, 24621, 24740, 24615, 24631, 24502, 24687, 24765, 24453, 24474, 24370, 24443, 24402, 24139, 24138, 24214, 24242, 24290, 24122, 24190, 24274, 24170, 24298, 24205, 24239, 24707, 24450, 24394, 24396, 24576, 24522, 24603, 24506, 24647, 24526, 24290, 24319, 24358, 24679, 24659, 24723, 24659, 24597, 24585, 24661, 24300, 24460, 24500, 24498, 24530, 24322, 24442, 24284, 24186, 24290, 24242, 24182, 24032, 24242, 24163, 24258, 24166, 24260, 24315, 24483, 24410, 24402, 24220, 24186, 24216, 24222, 24286, 24398, 24182, 24334, 24230, 24290, 23995, 23992, 24174, 24304, 24362, 24290, 24215, 24394, 24338, 24348, 24346, 24179, 24208, 24422, 24462, 24386, 24382, 24266, 24140, 24106, 24001, 24154, 24086, 24060, 24183, 24214, 24158, 24162, 23959, 24186, 24183, 24102, 24168, 24170, 24228, 24058, 24408, 24405, 24532, 24484, 24584, 24562, 24458, 24669, 24603, 24440, 24478, 24439, 24362, 24406, 24358, 24458, 24506, 24478, 24446, 24576, 24567, 24386, 24514, 24452, 24372, 24564, 24338, 24518, 24414, 24366, 24426, 24410, 24306, 24365, 24274, 24218, 24178, 24163, 24203, 24387, 24354, 24122, 24086, 24342, 24422, 24314, 24227, 24212, 24198, 24218, 24279, 24262, 24359, 24450, 24510, 24450, 24419, 24218, 24278, 24258], [23779, 23834, 23915, 23899, 23901, 23991, 24070, 23979, 23943, 23976, 23967, 24083, 24573, 24492, 24414, 24335, 24354, 24082, 24258, 24583, 24571, 24524, 24474, 24332, 24347, 24242, 24262, 24266, 24398, 24402, 24342, 24390, 24392, 24216, 24394, 24406, 24365, 24410, 24394, 24475, 24315, 24290, 24322, 24220, 24334, 24180, 24475, 24514, 24514, 24459, 24579, 24326, 24254, 24258, 24178, 24266, 24033, 24025, 24039, 23959, 23975, 24048, 23895, 24015, 24114, 24103, 24079, 24007, 24114, 24100, 24170, 24158, 24144, 24135, 24186, 24234, 24216, 24318, 24148, 24070, 24252, 24234, 24015, 24147, 24187, 24180, 24158, 24541, 24514, 24314, 24032, 24108, 24194, 24152, 24079, 23967, 24098, 24212, 24347, 24342, 24330, 24322, 24362, 24290, 23839, 24294, 24082, 24054, 24002, 23790, 24130, 23857, 23634, 24228, 24354, 24474, 24538, 24300, 24298, 24637, 24663, 24406, 24397, 24364, 24359, 24364, 24442, 24307, 24346, 24366, 24556, 24442, 24396, 24436, 24234, 24314, 24422, 24450, 24395, 24458, 24542, 24446, 24583, 24434, 24514, 24510, 24571, 24403, 24552, 24571, 24560, 24571, 24514, 24388, 24418, 24410, 24437, 24374, 24310, 24261, 24380, 24166, 24298, 24330, 24302, 24276, 24283, 24446, 24242, 24406, 24354, 24394, 24386, 24282, 24450, 24363, 24508, 24410, 24374, 24454, 24535, 24363, 24354, 24412, 24522, 24627, 24571, 24446, 24542, 24538, 24546, 24452, 24506, 24522, 24490, 24495, 24458, 24471, 24525, 24659, 24779, 24758, 24803, 24887, 24735, 24819, 24871, 24813, 24847, 24693, 24883, 24967, 25100, 25169, 24883, 24805, 24791, 24789, 24779, 24795, 24787, 24667, 24803, 24772, 24775, 24723, 24591, 24561, 24764, 24815, 24893, 24820, 24799, 24997, 24695, 24827, 24844, 24779, 24787, 24808, 24919, 24899, 24834, 24873, 24917, 24911, 25113, 24923, 25029, 24611, 24950, 24859, 24773, 24917, 24971, 25137], [24915, 25129, 24915, 24883, 24759, 24896, 24859, 24735, 24759, 24615, 24675, 24624, 24763, 24679, 24851, 24984, 24895, 24927, 24972, 24859, 24871, 24952, 24875, 24851, 24931, 24830, 24819, 24827, 24915, 24799, 24927, 25129, 25027, 24927, 25075, 24958, 24987, 25117, 24971, 24991, 25117, 25109, 25023, 25173, 24971, 24845, 24893, 25165, 25012, 25208, 25325, 25247, 25149, 25020, 25081, 24899, 25075, 25125, 24855, 25134, 25085, 25039, 25005, 25071, 25242, 25263, 25186, 25219, 25181, 25145, 25125, 25075, 25140, 25073, 25142, 25181, 25145, 25131, 25072, 25153, 25189, 25205, 25077, 25125, 25020, 24896, 24867, 24939, 24987, 25077, 24975, 25027, 24919, 24989, 24879, 24869, 24903, 24859, 25059, 24865, 24899, 24851, 24853, 24989, 24872, 25069, 25015, 24861, 25124, 24924, 25099, 24997, 25215, 25071, 25121, 25003, 24739, 25181, 24960, 25023, 24835, 24819, 24901, 24886, 25043, 25134, 25181, 24984, 25071, 25110, 25043, 24963, 24950, 24973, 24877, 24883, 24815, 24907, 24933, 24911, 24923, 24899, 24871, 24875, 24917, 24933, 24935, 24971, 25068, 25092, 24749, 24723, 24875, 24816, 24811, 24707, 24779, 24799, 24691, 24852, 24898, 24876, 24967, 24851, 24987, 24885, 24920, 24971, 25035, 25048, 25003, 24944, 25019, 25051, 24980, 24959, 24907, 25062, 24855, 25059, 24917, 24805, 24787, 24839, 24971, 24909, 24898, 24865, 24763, 24759, 24843, 24823, 24773, 24864, 25215, 25305, 25270, 25043, 24997, 25104, 25075, 25174, 25301, 25249, 25325, 25270, 25020, 25165, 25367, 25355, 25193, 25125, 24972, 24947, 24951, 24871, 24829, 24887, 24915, 24871, 24917, 25019, 25121, 24971, 25161, 25113, 25113, 25055, 25111, 25121, 25035, 24987, 25035, 25043, 25059, 25035, 24949, 24859, 24851, 24739, 24891, 24839, 24772, 24813, 24873, 24892, 24985, 25059, 25029, 25015, 24891, 24919, 25039, 25035, 25071, 25039], [24771, 24935, 24833, 24827, 24855, 24875, 24899, 24989, 24739, 24811, 24771, 24859, 24733, 24709, 24791, 24775, 24855, 24819, 24823, 24755, 24876, 24751, 24755, 24771, 24773, 24751, 24747, 24803, 24641, 24741, 24984, 25067, 25048, 25055, 24943, 24995, 25067, 25217, 25077, 25059, 25157, 24940, 25016, 25075, 24936, 24915, 25007, 24963, 24967, 25013, 25075, 24971, 24939, 24955, 24961, 24973, 24839, 24827, 24819, 24771, 24771, 24613, 24565, 24587, 24656, 24699, 24763, 24725, 24735, 24739, 24747, 24699, 24636, 24603, 24649, 24669, 24727, 24755, 24723, 24739, 24607, 24763, 24797, 24850, 24819, 24763, 24763, 24664, 24626, 24780, 24791, 24741, 24651, 24575, 24651, 24619, 24671, 24659, 24643, 24699, 24751, 24811, 24771, 24789, 24791, 24739, 24715, 24807, 24827, 24731, 24687, 24667, 24635, 24486, 24562, 24573, 24460, 24526, 24452, 24446, 24302, 24467, 24454, 24759, 24771, 24791, 24620, 24940, 24879, 24560, 24482, 24687, 24787, 24760, 24579, 24510, 24533, 24466, 24514, 24454, 24510, 24482, 24467, 24474, 24517, 24466, 24520, 24595, 24643, 24673, 24567, 24508, 24534, 24591, 24603, 24671, 24594, 24783, 24632, 24589, 24803, 24883, 24679, 24700, 24747, 24792, 24819, 24620, 24603, 24707, 24747, 24695, 24667, 24709, 24783, 24691, 24672, 24442, 24386, 24438, 24458, 24472, 24799, 24877, 24819, 24792, 24655, 24740, 24683, 24615, 24556, 24659, 24506, 24619, 24694, 24683, 24685, 24502, 24859, 24863, 24710, 24740, 24739, 24719, 24587, 24450, 24501, 24494, 24460, 24735, 24949, 24727, 24607, 24606, 24422, 24263, 24583, 24787, 24625, 24422, 24562, 24593, 24527, 24450, 24284, 24306, 24331, 24290, 24460, 24391, 24427, 24274, 24378, 24280, 24343, 24391, 24422, 24378, 24391, 24451, 24426, 24500, 24486, 24502, 24567, 24540, 24560, 24435, 24468, 24414, 24490, 24530, 24370, 24361, 24405, 24414], [24532, 24450, 24406, 24386, 24434, 24199, 24218, 24486, 24579, 24507, 24424, 24430, 24410, 24404, 24536, 24491, 24478, 24342, 24372, 24388, 24286, 24317, 24290, 24190, 24235, 24178, 24254, 24231, 24146, 24410, 24303, 24298, 24262, 24290, 24307, 24307, 24134, 24187, 24196, 24140, 24126, 24122, 24227, 24158, 24467, 24611, 24382, 24379, 24478, 24514, 24442, 24379, 24442, 24530, 24452, 24402, 24482, 24533, 24556, 24522, 24563, 24584, 24522, 24552, 24404, 24354, 24326, 24323, 24308, 24422, 24579, 24695, 24362, 24526, 24421, 24643, 24595, 24469, 24444, 24546, 24543, 24595, 24582, 24603, 24623, 24723, 24563, 24609, 24530, 24526, 24514, 24533, 24655, 24679, 24691, 24723, 24506, 24554, 24466, 24471, 24554, 24579, 24611, 24619, 24470, 24571, 24498, 24419, 24450, 24447, 24462, 24492, 24543, 24625, 24484, 24679, 24723, 24747, 24771, 24639, 24563, 24359, 24326, 24398, 24542, 24530, 24331, 24474, 24446, 24530, 24306, 24336, 24460, 24412, 24298, 24531, 24587, 24427, 24336, 24333, 24692, 24700, 24678, 24653, 24603, 24162, 24190, 24258, 24387, 24426, 24384, 24358, 24358, 24439, 24446, 24338, 24336, 24370, 24310, 24434, 24571, 24637, 24621, 24579, 24579, 24518, 24411, 24482, 24490, 24522, 24368, 24422, 24522, 24422, 24390, 24518, 24621, 24510, 24454, 24231, 24170, 24334, 24442, 24418, 24281, 24500, 24446, 24492, 24250, 24482, 24530, 24455, 24426, 24466, 24295, 24252, 24247, 24146, 24315, 24450, 24370, 24435, 24258, 24530, 24648, 24655, 24624, 24435, 24352, 24450, 24365, 24462, 24406, 24338, 24306, 24342, 24254, 24206, 24394, 24206, 24186, 24346, 24270, 24258, 24146, 24154, 24210, 24338, 24290, 24210, 24238, 24282, 24214, 24411, 24158, 24472, 24382, 24444, 24186, 24198, 24245, 24436, 24015, 24058, 24192, 24506, 24707, 24671, 24483, 24719, 24622, 24643, 24323, 24278, 24210, 24302], [24358, 24314, 24446, 24094, 24100, 24370, 24611, 24548, 24560, 24657, 24557, 24510, 24712, 24715, 24767, 24675, 24779, 24693, 24379, 24663, 24675, 24238, 24589, 24410, 24290, 24218, 24276, 24319, 24387, 24290, 23999, 24178, 24460, 24645, 24741, 24599, 24576, 24418, 24522, 24680, 24546, 24506, 24717, 24827, 24883, 24796, 24788, 24813, 24807, 24775, 24679, 24695, 24715, 24583, 24442, 24435, 24595, 24491, 24660, 24747, 24619, 24553, 24607, 24460, 24619, 24603, 24592, 24510, 24495, 24518, 24436, 24454, 24474, 24442, 24391, 24470, 24506, 24535, 24638, 24540, 24635, 24571, 24490, 24330, 24410, 24438, 24330, 24429, 24526, 24186, 24090, 24070, 23992, 24190, 24001, 24212, 24174, 24190, 24158, 24302, 24258, 24298, 24280, 24350, 24321, 24210, 24306, 24278, 24194, 24302, 24346, 24269, 24254, 24252, 24182, 24190, 24275, 24266, 24218, 24070, 23991, 24107, 24387, 24254, 24262, 24378, 24310, 24629, 24466, 24621, 24692, 24560, 24597, 24670, 24628, 24597, 24640, 24591, 24691, 24716, 24643, 24636, 24839, 25039, 25003, 24788, 24763, 24703, 24571, 24516, 24571, 24571, 24631, 24979, 24931, 24924, 24851, 24799, 24819, 24725, 24885, 24751, 24595, 24791, 24849, 24767, 24751, 24667, 24827, 24720, 24723, 24676, 24695, 24755, 24783, 24667, 24755, 24767, 24805, 24767, 24755, 24796, 24751, 24771, 24771, 24670, 24741, 24803, 24771, 24747, 24591, 24615, 24708, 24724, 24747, 24743, 24695, 24672, 24670, 24791, 24803, 24803, 24819, 24741, 24668, 24711, 24671, 24717, 24703, 24629, 24652, 24609, 24659, 24635, 24631, 24532, 24576, 24643, 24571, 24647, 24647, 24567, 24442, 24518, 24675, 24855, 24943, 24699, 24766, 24677, 24635, 24715, 24771, 24683, 24685, 24723, 24771, 24667, 24655, 24635, 24613, 24571, 24631, 24661, 24630, 24731, 24630, 24560, 24609, 24652, 24667, 24675, 24635, 24667, 24715, 24579], [24451, 24616, 24651, 24603, 24308, 24250, 24306, 24338, 24358, 24250, 24306, 24276, 24234, 24140, 24226, 24039, 23887, 24186, 24227, 24031, 24132, 24307, 24310, 24039, 24095, 24126, 24124, 23963, 23976, 23955, 23898, 23847, 23914, 24087, 23951, 24134, 24178, 24291, 24302, 24298, 24236, 24242, 24108, 23971, 24070, 24103, 24039, 24079, 24019, 24043, 24083, 24104, 24074, 24262, 24392, 24196, 24031, 24106, 24106, 24119, 24091, 24126, 24194, 24210, 24134, 24118, 24098, 24150, 24049, 23975, 24122, 24267, 24364, 24310, 24280, 24147, 24166, 24139, 24100, 24130, 24212, 24226, 24178, 24048, 24058, 24064, 24041, 23941, 24063, 24019, 24043, 24070, 24033, 24027, 24116, 24141, 23954, 24060, 24234, 24463, 24723, 24276, 24342, 24767, 24482, 24759, 24876, 24799, 24903, 24851, 24657, 24715, 24661, 24683, 24792, 24679, 24651, 24246, 24559, 24763, 24779, 24643, 24629, 24470, 24350, 24478, 24395, 24460, 24414, 24438, 24430, 24282, 24214, 24021, 24243, 24482, 24516, 24422, 24136, 24202, 24114, 24142, 24190, 24366, 24386, 24330, 24300, 24226, 24195, 24154, 24306, 24236, 24238, 24047, 24048, 24001, 23999, 24021, 24039, 23977, 23977, 23917, 23847, 24270, 24771, 24831, 24811, 24779, 24757, 24546, 24462, 24647, 24715, 24596, 24414, 24394, 24438, 24388, 24418, 24435, 24398, 24347, 24346, 24258, 24286, 24299, 24039, 23972, 24234, 24354, 24274, 24446, 24442, 24466, 24446, 24362, 24346, 24383, 24587, 24623, 24454, 24406, 24498, 24546, 24428, 24450, 24384, 24420, 24318, 24314, 24347, 24492, 24514, 24498, 24491, 24560, 24623, 24571, 24330, 24244, 24270, 23758, 23884, 23927, 24095, 23992, 24210, 24279, 24058, 24033, 24068, 24338, 24015, 24242, 24398, 24167, 24266, 24242, 24135, 24294, 24214, 24299, 24280, 24274, 24131, 24344, 24198, 24061, 24082, 24140, 24122, 24134, 24002, 23771, 23920, 23771], [24007, 24182, 24066, 24158, 24302, 24318, 24352, 24298, 24142, 24138, 24250, 24142, 24167, 24170, 24042, 23833, 23979, 24095, 24086, 24086, 23897, 23866, 23995, 24350, 24619, 24526, 24336, 24336, 24394, 24384, 24290, 24338, 24352, 24362, 24378, 24346, 24368, 24426, 24476, 24539, 24446, 24274, 24227, 24215, 24049, 24174, 24215, 24270, 24314, 24258, 24298, 24430, 24284, 24346, 24216, 24170, 24298, 24206, 24366, 24274, 24314, 24398, 24349, 24352, 24281, 24221, 24183, 24218, 24194, 23646, 23626, 23895, 24422, 24250, 24442, 24522, 24579, 24583, 24474, 24390, 24274, 24047, 23943, 23975, 24427, 24464, 23929, 24082, 24074, 23959, 23881, 24252, 24338, 24441, 24490, 24492, 24426, 24478, 24270, 24330, 24410, 24494, 24607, 24667, 24675, 24383, 24379, 24436, 24254, 24021, 24235, 24386, 24763, 24595, 24458, 24292, 24031, 24189, 24147, 24095, 23967, 23897, 24019, 24370, 24410, 24419, 24139, 24162, 24180, 24168, 24266, 24309, 24298, 24282, 24210, 24236, 24189, 24186, 24194, 24234, 24195, 24158, 24176, 24290, 24202, 23990, 24243, 24102, 24016, 24298, 24158, 24274, 24194, 24216, 24290, 24326, 24234, 24015, 24114, 24131, 24166, 24260, 24278, 24426, 24470, 24279, 24410, 24258, 24310, 24293, 24074, 24136, 24060, 24106, 24254, 24573, 24332, 24212, 24350, 24410, 24482, 24274, 24237, 24370, 24218, 24106, 24050, 24123, 24167, 24322, 24117, 24032, 24170, 24074, 24122, 24020, 24126, 24226, 24330, 24298, 24380, 24246, 24326, 24198, 24114, 24206, 24090, 24414, 24202, 24086, 24091, 24564, 24415, 24363, 24699, 24482, 24314, 24036, 23999, 24430, 24498, 24585, 24567, 24651, 24571, 24530, 24524, 24442, 24378, 24434, 24462, 24402, 24535, 24454, 24456, 24486, 24371, 24442, 24498, 24242, 24490, 24563, 24414, 24226, 24191, 24328, 24435, 24506, 24434, 24506, 24502, 24428, 24419, 24498, 24445, 24410], [24262, 24516, 24436, 24739, 24607, 24771, 24627, 24603, 24266, 24733, 24725, 24707, 24675, 24615, 24446, 24434, 24535, 24579, 24692, 24514, 24458, 24378, 24453, 24333, 24290, 24402, 24274, 24514, 24482, 24427, 24573, 24599, 24463, 24469, 24384, 24576, 24548, 24346, 24310, 24546, 24652, 24306, 24290, 24482, 24402, 24354, 24556, 24703, 24530, 24583, 24635, 24651, 24667, 24663, 24482, 24382, 24434, 24420, 24378, 24542, 24535, 24389, 24355, 24298, 24234, 24210, 24546, 24617, 24599, 24348, 24448, 24421, 24450, 24414, 24370, 24396, 24314, 24407, 24174, 24380, 24274, 24338, 24372, 24362, 24346, 24278, 24386, 24292, 24336, 24314, 24306, 24291, 24390, 24267, 24309, 24334, 24314, 24314, 24240, 24334, 24499, 24571, 24458, 24302, 24567, 24715, 24655, 24643, 24811, 24709, 24615, 24660, 24603, 24654, 24499, 24546, 24418, 24458, 24640, 24579, 24546, 24580, 24476, 24571, 24691, 24561, 24609, 24463, 24530, 24738, 24595, 24751, 24896, 24843, 24827, 24866, 24799, 24897, 24885, 24723, 24783, 24606, 24741, 24354, 24498, 24731, 24685, 24716, 24748, 24875, 24848, 24861, 24979, 24924, 24839, 24835, 24851, 24843, 24935, 24855, 24803, 24733, 24554, 24719, 24725, 24661, 24605, 24727, 24613, 24522, 24695, 24557, 24831, 24897, 24933, 24875, 24793, 24839, 24918, 24923, 24851, 24735, 24346, 24627, 24579, 24561, 24608, 24760, 24829, 24591, 24522, 24685, 24789, 24779, 24648, 24611, 24429, 24484, 24595, 24567, 24591, 24595, 24526, 24771, 24502, 24306, 24344, 24398, 24450, 24414, 24546, 24402, 24350, 24486, 24370, 24556, 24450, 24470, 24426, 24306, 24524, 24538, 24500, 24526, 24607, 24466, 24484, 24564, 24129, 24246, 24399, 24039, 24306, 24367, 24041, 24134, 24166, 24114, 24090, 24094, 24691, 24659, 24703, 24458, 24592, 24530, 24583, 24679, 24727, 24991, 24955, 24891, 24734, 24908, 25077, 24821], [24503, 24451, 24575, 24415, 24623, 24534, 24538, 24823, 24987, 24554, 24577, 24459, 24484, 24847, 24763, 24979, 24789, 24716, 24859, 24871, 24828, 24763, 24711, 24747, 24797, 24935, 24863, 24839, 24815, 24731, 24719, 24795, 24659, 24620, 24538, 24715, 24679, 24683, 24679, 24715, 24677, 24498, 24464, 24494, 24438, 24434, 24450, 24530, 24655, 24581, 24571, 24552, 24498, 24538, 24585, 24438, 24378, 24458, 24434, 24644, 24575, 24514, 24400, 24381, 24340, 24387, 24305, 24278, 24340, 24354, 24538, 24324, 24333, 24336, 24270, 24353, 24361, 24306, 24419, 24436, 24639, 24614, 24596, 24812, 24973, 24637, 24749, 24514, 24717, 24815, 24821, 24963, 24985, 24935, 24851, 25029, 24844, 25003, 25087, 24811, 24709, 24875, 24779, 24819, 24779, 24933, 25043, 24828, 24862, 24820, 24715, 24915, 24936, 24869, 24506, 24384, 24426, 24506, 24731, 24628, 25035, 24831, 24526, 24677, 24859, 24995, 25077, 24955, 24984, 24971, 24947, 24897, 24872, 24853, 24956, 24939, 24567, 24635, 24687, 24799, 24923, 24948, 24907, 24931, 24891, 24846, 24703, 24827, 24859, 24805, 24795, 24472, 24747, 24830, 24807, 24613, 24663, 24779, 24522, 24727, 24851, 24907, 24859, 24811, 24846, 24820, 24815, 24859, 24791, 24739, 24709, 24755, 24763, 24756, 24677, 24755, 24803, 24763, 24779, 24867, 24823, 24873, 24815, 24725, 24613, 24699, 24783, 24659, 24546, 24514, 24699, 24748, 24670, 24615, 24526, 24628, 24612, 24667, 24811, 24668, 24815, 24709, 24711, 24585, 24498, 24575, 24667, 24606, 24577, 24530, 24577, 24446, 24298, 24411, 24350, 24538, 24636, 24523, 24575, 24595, 24506, 24661, 24535, 24418, 24727, 24815, 24154, 24430, 24474, 24707, 24679, 24715, 24639, 24651, 24595, 24675, 24803, 24743, 24647, 24640, 24590, 24686, 24693, 24669, 24631, 24647, 24655, 24691, 24628, 24556, 24427, 24420, 24234, 24306, 24314, 24342], [24540, 24555, 24611, 24593, 24683, 24773, 24561, 24617, 24599, 24559, 24530, 24579, 24358, 24383, 24414, 24546, 24490, 24577, 24374, 24490, 24523, 24420, 24454, 24555, 24444, 24466, 24478, 24466, 24410, 24404, 24388, 24284, 24396, 24394, 24418, 24208, 24227, 24434, 24298, 24455, 24378, 24346, 24422, 24490, 24314, 24033, 24192, 23943, 23919, 23915, 23884, 23935, 24157, 23923, 24031, 24086, 24054, 24146, 24134, 24082, 24031, 24063, 23962, 24106, 24216, 24180, 23969, 23895, 23853, 23835, 23897, 23971, 23831, 23714, 23766, 23690, 23746, 23774, 23706, 23959, 24130, 24260, 24204, 24218, 24100, 24162, 24083, 24075, 23881, 23952, 24150, 24143, 24015, 24130, 24039, 24048, 24143, 24139, 24034, 24043, 23992, 24047, 23911, 23920, 23905, 24168, 24244, 24212, 24066, 24047, 24122, 24217, 24092, 23899, 23975, 23863, 23921, 23891, 23989, 23855, 23782, 23819, 23844, 23804, 23698, 23728, 23813, 23705, 23799, 23758, 23884, 23919, 23792, 23727, 23562, 23542, 23558, 23283, 23623, 23696, 23831, 24122, 24262, 24043, 24144, 24115, 24268, 24048, 24015, 23991, 24061, 24051, 23900, 23899, 24018, 23968, 23903, 24090, 23979, 24018, 24110, 24202, 23963, 24138, 24027, 24106, 24274, 24330, 24270, 24126, 24154, 24235, 23888, 23500, 23614, 23666, 23750, 23786, 23771, 23727, 23819, 23762, 23776, 23799, 23792, 23887, 23985, 23807, 23723, 23736, 23662, 23620, 23542, 23977, 24452, 24498, 24118, 24093, 24018, 23979, 23935, 23599, 23569, 23271, 23445, 23572, 23626, 23501, 23411, 23635, 23599, 23606, 23574, 23656, 23602, 23752, 24230, 24091, 23863, 23996, 23947, 24194, 24127, 24130, 24023, 23951, 24039, 24016, 24090, 24126, 23973, 23799, 23975, 23887, 24051, 23751, 24045, 24062, 24170, 24430, 24334, 24348, 24332, 24248, 24245, 24210, 24174, 24204, 24116, 24045, 24112, 24090, 24106, 24107, 24074, 24266], [24096, 24076, 24107, 23979, 23975, 23941, 23843, 23760, 23889, 23676, 23856, 23913, 23712, 23786, 23519, 23759, 23996, 24092, 24196, 24058, 24194, 23970, 23750, 23750, 23735, 23795, 23786, 23855, 23851, 24050, 23911, 23816, 23831, 23710, 23582, 23587, 23663, 23674, 23630, 23702, 23618, 23658, 23811, 23799, 23735, 23726, 23533, 23708, 23841, 24070, 24300, 24314, 23999, 23712, 23943, 24011, 23889, 23914, 24007, 23915, 24063, 23879, 23947, 23972, 23835, 23847, 23941, 23999, 23931, 23992, 23869, 23869, 23572, 23743, 23943, 23750, 23499, 23826, 23835, 23873, 23734, 23658, 23590, 23511, 23619, 23377, 23339, 23284, 23492, 23594, 23988, 23891, 23983, 24047, 24122, 24007, 23959, 23967, 24011, 23712, 23815, 23812, 23804, 23758, 23895, 23863, 23916, 24031, 23711, 23662, 23766, 23768, 23871, 23714, 23801, 23874, 23835, 23999, 24051, 24170, 24071, 24078, 24126, 24107, 24166, 24134, 24001, 24054, 23815, 24060, 23927, 24027, 24031, 24031, 23574, 23920, 23804, 23602, 23782, 23662, 23815, 24123, 24198, 24007, 24064, 24120, 24090, 24104, 24050, 24080, 23814, 23957, 24007, 24076, 23880, 23953, 24080, 23927, 23961, 23967, 23951, 24046, 23883, 23935, 23951, 23903, 23991, 23967, 23983, 23999, 23943, 23860, 23913, 23927, 23903, 23985, 23823, 23766, 23758, 23782, 23845, 23776, 23824, 23836, 23867, 23895, 23865, 23922, 23940, 23903, 23663, 23694, 23726, 24023, 23873, 23819, 24162, 24024, 24039, 24058, 24186, 24082, 24054, 23949, 24047, 24230, 24140, 24178, 24015, 24007, 24050, 23985, 23932, 24003, 24011, 23895, 23979, 24187, 23999, 23923, 23944, 23779, 23791, 23835, 23975, 23953, 24011, 23977, 24004, 23929, 23908, 23851, 23904, 23940, 23867, 23823, 23970, 23811, 23795, 23887, 23913, 23799, 23734, 23714, 23976, 24082, 24000, 23845, 23744, 23919, 24066, 23999, 23938, 23880, 23876, 23843], [23889, 23815, 23911, 24015, 23670, 23782, 23586, 23907, 23852, 23696, 23580, 23959, 24074, 24012, 23943, 23939, 23856, 23755, 23863, 23943, 23841, 23868, 23811, 23889, 23909, 23923, 23984, 23790, 23792, 23770, 23790, 23762, 23884, 23691, 23663, 23652, 23698, 23790, 23821, 23875, 23840, 23848, 23778, 23807, 23879, 23844, 23790, 23762, 23767, 23844, 23868, 23746, 23679, 23710, 23696, 23803, 23670, 23852, 23967, 23967, 23846, 23770, 23721, 23719, 24062, 24196, 24236, 23892, 23778, 24002, 23877, 24060, 24007, 24062, 24058, 24078, 24027, 23968, 24052, 24047, 24076, 24041, 24031, 23987, 23975, 23920, 23750, 23899, 23903, 23933, 23782, 23958, 23871, 23808, 23840, 23807, 23784, 23743, 23808, 23895, 23742, 23746, 23635, 23912, 23678, 23726, 23730, 23791, 23726, 23816, 23799, 23814, 23690, 23638, 23375, 23444, 23550, 23590, 23603, 23608, 23652, 23650, 23630, 23515, 23546, 23622, 23520, 23582, 23610, 23734, 23654, 23784, 23831, 23704, 23824, 23739, 23799, 23818, 23882, 23808, 23833, 23831, 23876, 23979, 23911, 23818, 23714, 23951, 24058, 23805, 23901, 23831, 24070, 23662, 23152, 23211, 23135, 23164, 23195, 23361, 23555, 23280, 23307, 23415, 24138, 24290, 24203, 23925, 24062, 24130, 24226, 24094, 24050, 24003, 24049, 24110, 23999, 24090, 24122, 24202, 24090, 24003, 23983, 23959, 24075, 24122, 24142, 24058, 24049, 24074, 24001, 24009, 24025, 24007, 23995, 24106, 24112, 23932, 23891, 23864, 23916, 24024, 23904, 23929, 23940, 23940, 23967, 23871, 23831, 23905, 23896, 23905, 24015, 23703, 23630, 23907, 24034, 23672, 23695, 23991, 24088, 23969, 23999, 24090, 24190, 23943, 23863, 24050, 23758, 23883, 23711, 24015, 23999, 24072, 24047, 24086, 24136, 24062, 24027, 24110, 23807, 23694, 23947, 24001, 23903, 23475, 23723, 23614, 23467, 23467, 23487, 23678, 24206, 24383, 24270, 24286], [24206, 24162, 24032, 23927, 24033, 24023, 24001, 24122, 24094, 24102, 24112, 23827, 23927, 23686, 24098, 24274, 24228, 23999, 24194, 24211, 24158, 24182, 24138, 24001, 23975, 23807, 23777, 23804, 23694, 23782, 24060, 23813, 23761, 23844, 23815, 24011, 24122, 24198, 23698, 23742, 23738, 23447, 23543, 23622, 23586, 23698, 23752, 23896, 24112, 24178, 24258, 24118, 24095, 24058, 24118, 23941, 23678, 23758, 23662, 23885, 23784, 24278, 24706, 24720, 24619, 24580, 24506, 24552, 24612, 24619, 24563, 24751, 24526, 24647, 24530, 24442, 24451, 24483, 24430, 24490, 24423, 24434, 24486, 24342, 24617, 24583, 24557, 24478, 24587, 24390, 24502, 24639, 24645, 24595, 24532, 24503, 24494, 24574, 24621, 24655, 24484, 24482, 24483, 24577, 24523, 24448, 24329, 24386, 24381, 24321, 24370, 24254, 24603, 24567, 24291, 24450, 24202, 24102, 24166, 24482, 24190, 23995, 24086, 24162, 23991, 24180, 23758, 24041, 24090, 23863, 23699, 24003, 24219, 23911, 24158, 23643, 23975, 23849, 23999, 24051, 24370, 24261, 24044, 24157, 24426, 24546, 24651, 24591, 24162, 24334, 24298, 24282, 24364, 24499, 24530, 24442, 24267, 24603, 24609, 24542, 24138, 24228, 23971, 23915, 24090, 24182, 24286, 24636, 24420, 24486, 24588, 24628, 24576, 24530, 24435, 24431, 24502, 24486, 24475, 24572, 24579, 24552, 24506, 24394, 24585, 24615, 24500, 24482, 24434, 24274, 24198, 24398, 24460, 24526, 24371, 24389, 24347, 24280, 24162, 24254, 24198, 24138, 23976, 24274, 24054, 24172, 24132, 24173, 24118, 24090, 24039, 23924, 24031, 24064, 23817, 23978, 24108, 24202, 24292, 24251, 24202, 24226, 24182, 24226, 24243, 24120, 24199, 24210, 24228, 24143, 24219, 24214, 24222, 24180, 24252, 24210, 24218, 24094, 24266, 24235, 24178, 24242, 24141, 24114, 24092, 23772, 23987, 23947, 23889, 23766, 23835, 23898, 23993, 24051, 23991, 23953], [23986, 24041, 23975, 23907, 23927, 23656, 23869, 23770, 23919, 24228, 24157, 23991, 23968, 23872, 23794, 23828, 23927, 24047, 24045, 23975, 24007, 23967, 24226, 24190, 24298, 24428, 24394, 24306, 23790, 23614, 24107, 24141, 23615, 23606, 23646, 23656, 23953, 23601, 23472, 23523, 23722, 23457, 23799, 23734, 23879, 24058, 24095, 24007, 24181, 24260, 24243, 24290, 24363, 24340, 24413, 24306, 24186, 24202, 24326, 24070, 23967, 23932, 23895, 24017, 23964, 24070, 24051, 24031, 24094, 23849, 24172, 24203, 24280, 24226, 24149, 23999, 23943, 24128, 24094, 23986, 23908, 23943, 23967, 23848, 23790, 23562, 23895, 23995, 23831, 23541, 23646, 23704, 23889, 24066, 23849, 23946, 23798, 23589, 23512, 23421, 23718, 23790, 23686, 23431, 23540, 23680, 23766, 23795, 23596, 23692, 23652, 23626, 23730, 23626, 23315, 23536, 23782, 24019, 24162, 23956, 23883, 23888, 23923, 23808, 23620, 23451, 23301, 23327, 22989, 23431, 23642, 23662, 23531, 23546, 23562, 23598, 23342, 23533, 23680, 23455, 23443, 23421, 23436, 23564, 23531, 23328, 23283, 23235, 23172, 23131, 23235, 23284, 23103, 23341, 23128, 23227, 23197, 23347, 23261, 23323, 23407, 23459, 23471, 23604, 23684, 23639, 23626, 23594, 23566, 23646, 23648, 23750, 23710, 23702, 23752, 23767, 23774, 23622, 23702, 23698, 23790, 23710, 23795, 23811, 23682, 23671, 23670, 23762, 23704, 23618, 23602, 23646, 23704, 23689, 23415, 23736, 23792, 23846, 23823, 23834, 23790, 23742, 23525, 23723, 23872, 23863, 23809, 23847, 23823, 23896, 23807, 23790, 23912, 23875, 23847, 23863, 23993, 23897, 23867, 23744, 23963, 24027, 23714, 23989, 24082, 24254, 23956, 24156, 24250, 24167, 23742, 24074, 24154, 24159, 24058, 24023, 24198, 24234, 24098, 23947, 23479, 23389, 23716, 23815, 23718, 23678, 23598, 23782, 24274, 24110, 23866, 24130, 24310, 24112, 24063, 23903], [23988, 24150, 24258, 23903, 24074, 24007, 23963, 23927, 24007, 23975, 23927, 24025, 24075, 24090, 24039, 24071, 24139, 24279, 24106, 24047, 24094, 24007, 24035, 23971, 23881, 24194, 24222, 24122, 24114, 24114, 24128, 24078, 24082, 24142, 24200, 24298, 24286, 24260, 24194, 24066, 24060, 24070, 24098, 24091, 24210, 24156, 24106, 24157, 24258, 24270, 24114, 24126, 24031, 23929, 24050, 24116, 23975, 24109, 24259, 24274, 24364, 24326, 24276, 24202, 24222, 23999, 23987, 24001, 24087, 24110, 24074, 24106, 24106, 24138, 24174, 24082, 24031, 24064, 23959, 23795, 23847, 23707, 23831, 23970, 23999, 23931, 23750, 23762, 23607, 23678, 24011, 24106, 24180, 24050, 24104, 24045, 24070, 24146, 24102, 24125, 24094, 24202, 24051, 23877, 23891, 23832, 24112, 24074, 24025, 24244, 24280, 24172, 24064, 24195, 24180, 23838, 24290, 23911, 24149, 23833, 24047, 23763, 24048, 24210, 24122, 23614, 24035, 24174, 24218, 24001, 24007, 24093, 24242, 24226, 24194, 24166, 24198, 24242, 24178, 24278, 24306, 24155, 23871, 23786, 23871, 23945, 23920, 23935, 24130, 24154, 23811, 23835, 23911, 23968, 23887, 23995, 23968, 23746, 23785, 23742, 23845, 23828, 23682, 23845, 23832, 23769, 23566, 23459, 23519, 23575, 23853, 23802, 23936, 23940, 23507, 23952, 23805, 23604, 23275, 23678, 23812, 23832, 23329, 22913, 23251, 23419, 23251, 23275, 23751, 23435, 23461, 23574, 23534, 23718, 23816, 23713, 23554, 23131, 22945, 23207, 23232, 23443, 23017, 23303, 23461, 22921, 23075, 23187, 23279, 23451, 23762, 23153, 23133, 23576, 23874, 24019, 24314, 24314, 24280, 24174, 24114, 24141, 24103, 24027, 23734, 23730, 23468, 23533, 23643, 23582, 23558, 23678, 22870, 23116, 23112, 23038, 23134, 22957, 23199, 23213, 23359, 23496, 23219, 23287, 23333, 23604, 23782, 23662, 23758, 23670, 23895, 23975, 23790, 23495, 23667, 23562], [23632, 23686, 23583, 23599, 23355, 23415, 23483, 23500, 23531, 23503, 23600, 23695, 23686, 23618, 23804, 23873, 23847, 23742, 23782, 23746, 23678, 23786, 24043, 24048, 23839, 23774, 23598, 23670, 23626, 23596, 23616, 23726, 23936, 23895, 23838, 23907, 23888, 23879, 23831, 23879, 23847, 23918, 23888, 23999, 23939, 23921, 23928, 23908, 23967, 23951, 23887, 23876, 23920, 23817, 23874, 23891, 22969, 23542, 23602, 23723, 23895, 24102, 24134, 23975, 24094, 23931, 24040, 24143, 23954, 24001, 24130, 24094, 24024, 23917, 23851, 23539, 23799, 23871, 23662, 23811, 23849, 24027, 24020, 23943, 23927, 23839, 23958, 23774, 23710, 23891, 23670, 23805, 23867, 23574, 23600, 23851, 23566, 23662, 23742, 23935, 24260, 24190, 24027, 24090, 24058, 24146, 24094, 24085, 24170, 24150, 24054, 23964, 23987, 24088, 23963, 23963, 23932, 23943, 23834, 23766, 23823, 23811, 23837, 23710, 23564, 23638, 23737, 23712, 24112, 24054, 24196, 24162, 23588, 23801, 23907, 23872, 23851, 23670, 23774, 23899, 23698, 23759, 23887, 23598, 23785, 24031, 24048, 24015, 24012, 24028, 24040, 23901, 24244, 24243, 24174, 23853, 24154, 24142, 24147, 24154, 24162, 24166, 24170, 23856, 23859, 23792, 23726, 23847, 23798, 23874, 23904, 24047, 24170, 24218, 24138, 24074, 23987, 23954, 24047, 23975, 23921, 23919, 23854, 23919, 23988, 24039, 24096, 24066, 24094, 24167, 24154, 24132, 24031, 23823, 23953, 23925, 23533, 23742, 23630, 23622, 23778, 23871, 24039, 23929, 23901, 23794, 23738, 23823, 23846, 23834, 23813, 24222, 24522, 24535, 24587, 24404, 24354, 24414, 24501, 24434, 24234, 24535, 24530, 24442, 24367, 24411, 24560, 24554, 24574, 23967, 24314, 24259, 24234, 24110, 24090, 24143, 24026, 24048, 24234, 23952, 24017, 24039, 24274, 24294, 24302, 24324, 24354, 24283, 24350, 24262, 24186, 24330, 24336, 24266, 24222, 24195], [24164, 24007, 23871, 23961, 24082, 24015, 24138, 24174, 24306, 24302, 24298, 24278, 24274, 24182, 24284, 24304, 24317, 24282, 24270, 24466, 24386, 24250, 24320, 24314, 24290, 24390, 24276, 24198, 24276, 24353, 24230, 24187, 23814, 23656, 23799, 23999, 23766, 23968, 23959, 23904, 23948, 24122, 24031, 24226, 24162, 24188, 24142, 23847, 24252, 24354, 24250, 24524, 24306, 24266, 24214, 24278, 24305, 24314, 24360, 24382, 24466, 24363, 24358, 24275, 24130, 24172, 24276, 24328, 24290, 24317, 24443, 24362, 24338, 24330, 24268, 24220, 24178, 24158, 24210, 23986, 24011, 24107, 24102, 24202, 24064, 24163, 24128, 24182, 24212, 24246, 24250, 24308, 24333, 24058, 24049, 24074, 23682, 23969, 24011, 23864, 23850, 23790, 23753, 23784, 23722, 23897, 23778, 23895, 23833, 23791, 23792, 23807, 23710, 23623, 23628, 23726, 23694, 23686, 23586, 23714, 23550, 23476, 23494, 23572, 23453, 23557, 23559, 23573, 23578, 23542, 23811, 23807, 23752, 23816, 23737, 23847, 23710, 23734, 23815, 23874, 23919, 23999, 24102, 24082, 23768, 23937, 23863, 24008, 24188, 24020, 23963, 24282, 24070, 23969, 24078, 24070, 24158, 24021, 24211, 24031, 23899, 23975, 23914, 24031, 24212, 24211, 24260, 24154, 24226, 24047, 24117, 23955, 23935, 24028, 24039, 23800, 23799, 23623, 23859, 23726, 23803, 23663, 23804, 23867, 23851, 23550, 23631, 23606, 23690, 23755, 23871, 23766, 23719, 23606, 23951, 23694, 23799, 23698, 23762, 23921, 24051, 23927, 23531, 23662, 23867, 23750, 23628, 23566, 23507, 23507, 23364, 23493, 23576, 23495, 23535, 23734, 23730, 23846, 23510, 23678, 23758, 22890, 23108, 23075, 23762, 24074, 24166, 24293, 24130, 23924, 24017, 24154, 24196, 24107, 24184, 24314, 24314, 24294, 24396, 24302, 24151, 24372, 24747, 24792, 24396, 24342, 24352, 24031, 24388, 24418, 24430, 24469, 24426, 24387, 24467, 24410], [24382, 24398, 24260, 24318, 24266, 24242, 24050, 24051, 24150, 24084, 24212, 24218, 24188, 24015, 23979, 23959, 23850, 23882, 23754, 23927, 23873, 23977, 23929, 23897, 23807, 24210, 24011, 23809, 23968, 23913, 24174, 24167, 24224, 23871, 24126, 24148, 24156, 24158, 24326, 24258, 24130, 23996, 23897, 23825, 23845, 23897, 23849, 23785, 23983, 24072, 23999, 24178, 24298, 24210, 23891, 23849, 23863, 24191, 24210, 23887, 23790, 23821, 24058, 23697, 23646, 23644, 23736, 23697, 23734, 23795, 23823, 23678, 23546, 23730, 23766, 23794, 23566, 23728, 23612, 23840, 23784, 23714, 23674, 23665, 23439, 23377, 23215, 23414, 23726, 23476, 23335, 23752, 23400, 23532, 23507, 23742, 23827, 23730, 23666, 24007, 23851, 23850, 23970, 23995, 23911, 23792, 23843, 23834, 23842, 23827, 23986, 23959, 24018, 23929, 23946, 23931, 23904, 23831, 23718, 24027, 24058, 23742, 23881, 23828, 23784, 23815, 23999, 24054, 24202, 24198, 24024, 23925, 23921, 23766, 23710, 23718, 23839, 23857, 23816, 23919, 23943, 23969, 23883, 23865, 23843, 23726, 23754, 24061, 24086, 24015, 23984, 24047, 23937, 24015, 24150, 24114, 24039, 23939, 23831, 23874, 23959, 24050, 24082, 24196, 24300, 24035, 24194, 23900, 24015, 24188, 24070, 24134, 24242, 23792, 23879, 23784, 23935, 24122, 24110, 24157, 24140, 24186, 24270, 24251, 24279, 24314, 24254, 23961, 24171, 24275, 24242, 24141, 24044, 24164, 23923, 24122, 24236, 24293, 24314, 24306, 24190, 24190, 24218, 24122, 24182, 24258, 24346, 24418, 24370, 24514, 24434, 24422, 24434, 24322, 24347, 24260, 24306, 24298, 24314, 24358, 24410, 24382, 24343, 24366, 24530, 24494, 24530, 24608, 24644, 24527, 24611, 24661, 24671, 24619, 24416, 24333, 24396, 24538, 24474, 24552, 24715, 24546, 24540, 24538, 24603, 24314, 24306, 24372, 24426, 24346, 24320, 24298, 24366, 24434, 24381, 24147], [24250, 24327, 24234, 24244, 24234, 24474, 24498, 24462, 24292, 24346, 24426, 24314, 24542, 24574, 24659, 24651, 24506, 24560, 24590, 24514, 24651, 24667, 24326, 24326, 24136, 24354, 24058, 24352, 24314, 24447, 24431, 24210, 24600, 24259, 24138, 23999, 24101, 24130, 24122, 24065, 24140, 24051, 23987, 23983, 24078, 24194, 24142, 24142, 24170, 24228, 23993, 24206, 24314, 24186, 24268, 24270, 24243, 24266, 24252, 24158, 24001, 24190, 24142, 23975, 24015, 23849, 23920, 23823, 23923, 23815, 24047, 24009, 24154, 24047, 24041, 24145, 24090, 24179, 24178, 24202, 24074, 24090, 24095, 24070, 24081, 24260, 24314, 24250, 24124, 24286, 24174, 24213, 24054, 24028, 24017, 24224, 24170, 24186, 24218, 24314, 24540, 24475, 24306, 24410, 24412, 24483, 24557, 24394, 24326, 24334, 24298, 24403, 24202, 24370, 24581, 24434, 24458, 24546, 24579, 24647, 24406, 24475, 24803, 24699, 24711, 24595, 24536, 24652, 24298, 24378, 24514, 24530, 24298, 24410, 24454, 24515, 24755, 24764, 24558, 24688, 24591, 24591, 24526, 24655, 24571, 24458, 24498, 24627, 24478, 24426, 24189, 24426, 24416, 24510, 24446, 24124, 24432, 24386, 24402, 24482, 24683, 24560, 24599, 24835, 24839, 24841, 24877, 24893, 24625, 24691, 24699, 24835, 24841, 24675, 24747, 24779, 24835, 24751, 24640, 24612, 24663, 24671, 24623, 24589, 24571, 24437, 24430, 24571, 24530, 24552, 24560, 24494, 24462, 24426, 24466, 24468, 24514, 24507, 24423, 24405, 24282, 24066, 24418, 24615, 24675, 24595, 24506, 24162, 23983, 24112, 24492, 24407, 24456, 24031, 23847, 23688, 24244, 24064, 24236, 24258, 23999, 23961, 23987, 23969, 24174, 24320, 24700, 24674, 24251, 24402, 24693, 24490, 24476, 24493, 24562, 24431, 24183, 24189, 24398, 24779, 24971, 24787, 24959, 24939, 24915, 24884, 24827, 24869, 24836, 24767, 24751, 24627, 24622, 24747, 24811, 24889], [24735, 24734, 24522, 24442, 24454, 24282, 24595, 24388, 24410, 24054, 24039, 23913, 23959, 24077, 24243, 23807, 23975, 24374, 24617, 24672, 24466, 24466, 24518, 24490, 24583, 24667, 24593, 24258, 24413, 24411, 24364, 24426, 24378, 24324, 24320, 24266, 24351, 24252, 24314, 24283, 24035, 24023, 24090, 24342, 24339, 24363, 24290, 24170, 24354, 24326, 24098, 24058, 24247, 24300, 24452, 24647, 24723, 24643, 24186, 24250, 24202, 24322, 24607, 24680, 24595, 24279, 24102, 24099, 24150, 24363, 24617, 24546, 24564, 24542, 24623, 24531, 24126, 23992, 23986, 23726, 23938, 23831, 23695, 23413, 23658, 23903, 23872, 23987, 23917, 23649, 22699, 22731, 22490, 22567, 22003, 22393, 22799, 23411, 23975, 24070, 23953, 23362, 22973, 22953, 22537, 21833, 21518, 21651, 21918, 22079, 22253, 22557, 22325, 21705, 20816, 19990, 20148, 19192, 18274, 17319, 16336, 15347, 14240, 13080, 12830, 14010, 15055, 16033, 17733, 18640, 19404, 20126, 20842, 21521, 22187, 22833, 23463, 24090, 24701, 25317, 25929, 26545, 27172, 27806, 28458, 29120, 29809, 30515, 31231, 31982, 32750, 33550, 34378, 35248, 36154, 37116, 38141, 39216, 39373, 38381, 37028, 35310, 33992, 32576, 31299, 30353, 29868, 29534, 28698, 27691, 28466, 29425, 30227, 30965, 31004, 31156, 31256, 31093, 31487, 31473, 30711, 29526, 29550, 30092, 30831, 31447, 31431, 30543, 30022, 29992, 29610, 29403, 29047, 29490, 29870, 30028, 29538, 29370, 29281, 29427, 29406, 29458, 29526, 29590, 29712, 30148, 30383, 30368, 30863, 31223, 31439, 31345, 30831, 30639, 30698, 30697, 30831, 30883, 30734, 30960, 30871, 31148, 31439, 31541, 31321, 31471, 31020, 30199, 30001, 30044, 29849, 29820, 29774, 29735, 29518, 29570, 30174, 30423, 30391, 30189, 30279, 30449, 30383, 30203, 29698, 29518, 29411, 29684, 29630, 29712, 29724, 29562, 29466, 29373, 29209, 29014], [28559, 29130, 29498, 29193, 29102, 28982, 28346, 28442, 28771, 28986, 28856, 28798, 28676, 28734, 28880, 28878, 28847, 28354, 28562, 28879, 29142, 29186, 29283, 29006, 28467, 28219, 28261, 28081, 28080, 28148, 28425, 28801, 28934, 29385, 29498, 29554, 29590, 29658, 29578, 29293, 28866, 28705, 28684, 28930, 29030, 28958, 28878, 29088, 29120, 28914, 28998, 28746, 28642, 28675, 28403, 28206, 28186, 28276, 28203, 28295, 28267, 28192, 28250, 28346, 28339, 28404, 28411, 28523, 28808, 29034, 29126, 29144, 28846, 28370, 28268, 28372, 28571, 28774, 28938, 28986, 28964, 28692, 28602, 28606, 28610, 28325, 27952, 27868, 28072, 28108, 27886, 27690, 27584, 27610, 27779, 27832, 27590, 27556, 27794, 27822, 27678, 27504, 27742, 27666, 27568, 27878, 28104, 28199, 28146, 27916, 27848, 27778, 27814, 27936, 28000, 27902, 27867, 27931, 28144, 27886, 27784, 28008, 28137, 28238, 28486, 28690, 28870, 28958, 29225, 29124, 29126, 29249, 29218, 29126, 28564, 27976, 28032, 28048, 28056, 27876, 27846, 27628, 27513, 27590, 27906, 28000, 28011, 27830, 28066, 28186, 28064, 28060, 28128, 28144, 28003, 27798, 27558, 27608, 27517, 27814, 28104, 28402, 28454, 28403, 28596, 28634, 28574, 28627, 28414, 28262, 28310, 27790, 27572, 27005, 26781, 26970, 27484, 27540, 27735, 28122, 28376, 28612, 28642, 28557, 28370, 28105, 28139, 28255, 28468, 28534, 28694, 28846, 28814, 28679, 28754, 28682, 28706, 28710, 28808, 29098, 28787, 27776, 27863, 27718, 27838, 27784, 27674, 27950, 28324, 28204, 28402, 28498, 27969, 28550, 29118, 29478, 29856, 30110, 30499, 30889, 31271, 31761, 32203, 32561, 32841, 32962, 33114, 33106, 33033, 32993, 32702, 32517, 32593, 32570, 32470, 32357, 32243, 32027, 31946, 31851, 31878, 32027, 31938, 31431, 31411, 31308, 30955, 30711, 30424, 30347, 30229, 30068, 29948, 29986, 30004, 29754], [29417, 29932, 30457, 30831, 31110, 31489, 31786, 32079, 32359, 32654, 33041, 33452, 33799, 33831, 33593, 33500, 33294, 33013, 32745, 32962, 32965, 32857, 32893, 32757, 32445, 32229, 32245, 32235, 32357, 32453, 32605, 32853, 33083, 33374, 33460, 33521, 33468, 32985, 33033, 33023, 33065, 33037, 33081, 32845, 32809, 32653, 32777, 32954, 33213, 33420, 33242, 33053, 32701, 32297, 31938, 31569, 30891, 30335, 30197, 30533, 30712, 30887, 30865, 30839, 31047, 30693, 30505, 30455, 30549, 30753, 31148, 31501, 31417, 31573, 31667, 31810, 31552, 31487, 31347, 31068, 30871, 30864, 31086, 31227, 31024, 31204, 31236, 31125, 31044, 31085, 31100, 31108, 31299, 31531, 31727, 31842, 31854, 31819, 31623, 31481, 31490, 31303, 31300, 31152, 31028, 30889, 30791, 30783, 30638, 30558, 30673, 30625, 30480, 30471, 30525, 30337, 30296, 30327, 30219, 29952, 29800, 29794, 29714, 29830, 29901, 29852, 29800, 29547, 29186, 29466, 29692, 29821, 29900, 29888, 30034, 30181, 30257, 30251, 30196, 30194, 30425, 30677, 30741, 30768, 30581, 30605, 30439, 29748, 29610, 29837, 30040, 30132, 30280, 30319, 30212, 30193, 30052, 30002, 29944, 30025, 30100, 30132, 30207, 30108, 30327, 30507, 29853, 28974, 28506, 27524, 26780, 26921, 27508, 28106, 28536, 28846, 29150, 29369, 29592, 29333, 29281, 29074, 28802, 28958, 29201, 29305, 29201, 29385, 29379, 29056, 28666, 28518, 28886, 29166, 29500, 29826, 29828, 29761, 29838, 28991, 28096, 27783, 27726, 27604, 27140, 27234, 27540, 27984, 28350, 28346, 28342, 28048, 28034, 27878, 27920, 28054, 27822, 27220, 26240, 26065, 26555, 27123, 27372, 27516, 27687, 27771, 27276, 26601, 26561, 26804, 27204, 27416, 26829, 26208, 26768, 27380, 27710, 27912, 26938, 26820, 27504, 27928, 27492, 27458, 28128, 28634, 29126, 29602, 30057, 30453, 30865, 31028, 31086, 31222, 31330, 31547], [30271, 29562, 29732, 29868, 29820, 29704, 29209, 29118, 29048, 28902, 28894, 28958, 28995, 29142, 29287, 29204, 29191, 29241, 29181, 29197, 29106, 28998, 28910, 28891, 28944, 28958, 28814, 28911, 28816, 28784, 28555, 28750, 28488, 28634, 28918, 29273, 29602, 29453, 29442, 29377, 29466, 29548, 29646, 29546, 29322, 29171, 29078, 28990, 28947, 28854, 28658, 28721, 28806, 28734, 28642, 28230, 27964, 28386, 28728, 28267, 28178, 28194, 28643, 29046, 29277, 29417, 28966, 28976, 29072, 29096, 28910, 28728, 28718, 28739, 28799, 28971, 29102, 29195, 29317, 29397, 29293, 29401, 29702, 29988, 30199, 30171, 30045, 29876, 29836, 29908, 29976, 30140, 30174, 30303, 30148, 29992, 29949, 29917, 29816, 29678, 29530, 29446, 29154, 29229, 29092, 28918, 28922, 28870, 28910, 28882, 28886, 29070, 29371, 29475, 29685, 29908, 29940, 29976, 29626, 29466, 29620, 29642, 29650, 29662, 29578, 29446, 29456, 29401, 29642, 29700, 29538, 29413, 29546, 29743, 29788, 29794, 29718, 29598, 29507, 29522, 29337, 29058, 29118, 29023, 28777, 28645, 28611, 28645, 28684, 28720, 28707, 28727, 28710, 28832, 28958, 29104, 29207, 29297, 28966, 28237, 27662, 27238, 27476, 27719, 27956, 28266, 28610, 28786, 29055, 29160, 29128, 29305, 29403, 29684, 29852, 29900, 29944, 29976, 29885, 30014, 29932, 29924, 29908, 29844, 29892, 29984, 29976, 29940, 29962, 30180, 30385, 30561, 30544, 30427, 30234, 30076, 29916, 29828, 29788, 29574, 29174, 28945, 29048, 29128, 29289, 29281, 29249, 28926, 28278, 28213, 28325, 28405, 28374, 27947, 27093, 27290, 27420, 27912, 28318, 28699, 28878, 29038, 28766, 28914, 29062, 29145, 29269, 29409, 29502, 29444, 29450, 29361, 29321, 29174, 28858, 28650, 28710, 28878, 29070, 29138, 29049, 28958, 28984, 28548, 28002, 27910, 28028, 27426, 27742, 27994, 28166, 28234, 28116, 27344, 27324, 27528], [28066, 28388, 28800, 29178, 29369, 29514, 29551, 29522, 29498, 29309, 29160, 29425, 29718, 29941, 30068, 30160, 30367, 30339, 30267, 29846, 29106, 28671, 27532, 26547, 25863, 26089, 26481, 26742, 27199, 27492, 27492, 26957, 26001, 26102, 26305, 25753, 26140, 26350, 26336, 26266, 26100, 26120, 26324, 26379, 26921, 27416, 27806, 27968, 28130, 28357, 28658, 29158, 29636, 29916, 30501, 30911, 30745, 30895, 31164, 31655, 32075, 32474, 32931, 33388, 33783, 34076, 34127, 33905, 33513, 32985, 32373, 31533, 30541, 29554, 28882, 29030, 29078, 28662, 27818, 27400, 27488, 27545, 27336, 27270, 27148, 27364, 27372, 26841, 26636, 27396, 28088, 28814, 29498, 29856, 30375, 30904, 31401, 31858, 32309, 32273, 31846, 31519, 31954, 32501, 32853, 33121, 33350, 33599, 33197, 32980, 32563, 32685, 32977, 33571, 34176, 34526, 34756, 34970, 35249, 35116, 34986, 35080, 34394, 34113, 34183, 34024, 33967, 33561, 33181, 33036, 32859, 32661, 32686, 32623, 32833, 33045, 33093, 33121, 33009, 32711, 32322, 32075, 31990, 31914, 32041, 31639, 30597, 30375, 30201, 30172, 30080, 29948, 30078, 30252, 30231, 30080, 29972, 29876, 30040, 30255, 30297, 30494, 30755, 30751, 30621, 30864, 31054, 31149, 30730, 30235, 29620, 28514, 27444, 27176, 27755, 28402, 29030, 29746, 30256, 30638, 29702, 29369, 29941, 30261, 30621, 30811, 30903, 31007, 31212, 31180, 30470, 29768, 29446, 29652, 29822, 29682, 29668, 29652, 29229, 29050, 28854, 27891, 27723, 28058, 28482, 28906, 29199, 28826, 27504, 27500, 27556, 28026, 28330, 28758, 29220, 29658, 30073, 30283, 30401, 29300, 28017, 26860, 25889, 25254, 25413, 25833, 26563, 27050, 27580, 27954, 27308, 26376, 25669, 25101, 24542, 24076, 23707, 23562, 24154, 24683, 25137, 24767, 23631, 23574, 24298, 25036, 24354, 23237, 22381, 21737, 20914, 20094, 19246, 18366, 18182, 18415], [18540, 18382, 18391, 18290, 18310, 18387, 18319, 18307, 18299, 18262, 18037, 17699, 16810, 16719, 16113, 15250, 16326, 17291, 18157, 18963, 19716, 20432, 21057, 21505, 21222, 20749, 20489, 20692, 20502, 19940, 19752, 18641, 17647, 17442, 17204, 16749, 16506, 16415, 16741, 16886, 16425, 15951, 16288, 16647, 16672, 16627, 16493, 16497, 16459, 16719, 16665, 16743, 16687, 16771, 16938, 16890, 16922, 17111, 16988, 17102, 16957, 16613, 16545, 16761, 16795, 16357, 16323, 16737, 17027, 17203, 17317, 17351, 17052, 17046, 16592, 16575, 16843, 17030, 17010, 16922, 16719, 16783, 16657, 16661, 16640, 16576, 16543, 16559, 16543, 16617, 16500, 16491, 16460, 16512, 16535, 16604, 16419, 16536, 16569, 16326, 16350, 16383, 16384, 16395, 16445, 16612, 16767, 16861, 16832, 16833, 16652, 16524, 16296, 16528, 16759, 16643, 16265, 16167, 16011, 16087, 16285, 16375, 16411, 16467, 16357, 16297, 16418, 16497, 16795, 16847, 16693, 16591, 16239, 16050, 16139, 16134, 16179, 16310, 16627, 16672, 16847, 16513, 16254, 16385, 16428, 16564, 16587, 16391, 16250, 16313, 16336, 16274, 16152, 16293, 16245, 16001, 16121, 16499, 16743, 16784, 16503, 16511, 16503, 16408, 16349, 16198, 16285, 16453, 16404, 16367, 16453, 16487, 16289, 16225, 16320, 16383, 16531, 16480, 16511, 16527, 16516, 16320, 16369, 16283, 16268, 16279, 16314, 16362, 16392, 16455, 16419, 16499, 16530, 16357, 16261, 16248, 16551, 16695, 16731, 16686, 16704, 16483, 16365, 16357, 16496, 16498, 16468, 16727, 16960, 16799, 16704, 16743, 16706, 16663, 16720, 16803, 16759, 16611, 16615, 16521, 16491, 16273, 16377, 16497, 16583, 16333, 16208, 15910, 16069, 16294, 16367, 16403, 16639, 16499, 16237, 16078, 16050, 16165, 16169, 16184, 16191, 16206, 16161, 16030, 16164, 16321, 16435, 16506, 16458, 16424, 16319, 16375, 16456, 16350, 16383, 16319], [16261, 16196, 16094, 16033, 15993, 16261, 16338, 16497, 16529, 16449, 16225, 16200, 16326, 16240, 16205, 16246, 16166, 16154, 16034, 15916, 15909, 15859, 15859, 15772, 15739, 15888, 16016, 15955, 15937, 16078, 16231, 15867, 15905, 15695, 15462, 15574, 15543, 15533, 15779, 15827, 16109, 16516, 16569, 16247, 16257, 16314, 16229, 16201, 16049, 15945, 15869, 15736, 15787, 15973, 16253, 16361, 16299, 16397, 16320, 16293, 16259, 16221, 16512, 16432, 16513, 16531, 16559, 16495, 16543, 16445, 16333, 16182, 16207, 16305, 16210, 16194, 16223, 15960, 15995, 15969, 16072, 15994, 15863, 16014, 15619, 15679, 15715, 15716, 15843, 15941, 15808, 15779, 15671, 15759, 15994, 16167, 16241, 16280, 16455, 16519, 16519, 16359, 16325, 16342, 16285, 16122, 16026, 16021, 15893, 15894, 15997, 16006, 15968, 15830, 15880, 15815, 15805, 15769, 15731, 15711, 15720, 15897, 15925, 15868, 15941, 15625, 15626, 15591, 15837, 15990, 15978, 15951, 15851, 15668, 15664, 15443, 15394, 15371, 15499, 15679, 15770, 15894, 15981, 15999, 15700, 15573, 15613, 15713, 15583, 15494, 15779, 15659, 15637, 15684, 15719, 15704, 15554, 15682, 15548, 15696, 15711, 15840, 15914, 15909, 15687, 15835, 15883, 15791, 15821, 15606, 15462, 15476, 15508, 15575, 15424, 15514, 15538, 15496, 15610, 15327, 15103, 15455, 15517, 15487, 15498, 15550, 15548, 15260, 15234, 15514, 15289, 15067, 15403, 15667, 15506, 15837, 16255, 16456, 16279, 15478, 15129, 16165, 17091, 17789, 18472, 18354, 18239, 17957, 17785, 17937, 17783, 17781, 17759, 17940, 17865, 17775, 17834, 17743, 17774, 17821, 17809, 17781, 17813, 17908, 17869, 17781, 17797, 17779, 17797, 17806, 17785, 17733, 17690, 17681, 17584, 17719, 17649, 17286, 17632, 17513, 17494, 17575, 17493, 17379, 17397, 17422, 17647, 17537, 17556, 17625, 17631, 17518, 17429, 17397, 17347, 17577], [17565, 17539, 17571, 17525, 17503, 17357, 17359, 17275, 17459, 17397, 17539, 17457, 17482, 17421, 17477, 17518, 17387, 17371, 17303, 17247, 17243, 17060, 16879, 16148, 14908, 14431, 14927, 15961, 16938, 17837, 18691, 18640, 17736, 17882, 17387, 17339, 17365, 17613, 17558, 17423, 17385, 17329, 17189, 17441, 17469, 17458, 17339, 17283, 17439, 17247, 17387, 17420, 17356, 17155, 17377, 17393, 17284, 17163, 17167, 17165, 16998, 17018, 16970, 17169, 17059, 17042, 16840, 17002, 17046, 17124, 16962, 17106, 17014, 16923, 16946, 16963, 16938, 16828, 16860, 16879, 16962, 16799, 16817, 16825, 16797, 16793, 16798, 16868, 16728, 16739, 16706, 16853, 16801, 16652, 16652, 16642, 16451, 16441, 16625, 16451, 16468, 16466, 16434, 16505, 16515, 16489, 16471, 16575, 16306, 16591, 16237, 16426, 16419, 16143, 16365, 16293, 16334, 16341, 16549, 16503, 16436, 16277, 16203, 16256, 16229, 16329, 16373, 16328, 16551, 16587, 16499, 16397, 16281, 16215, 16174, 16330, 16432, 16425, 16397, 16441, 16432, 16499, 16441, 16221, 16188, 16209, 16126, 16267, 16262, 16303, 16432, 16369, 16119, 16149, 16141, 16177, 16079, 16089, 16210, 16067, 16067, 16047, 16093, 16169, 16155, 16138, 16222, 16293, 16327, 16436, 16501, 16459, 16364, 16395, 16381, 16392, 16337, 16168, 16110, 16079, 16121, 16133, 15920, 15919, 15878, 15773, 15362, 14589, 14597, 14653, 14823, 14939, 14795, 15064, 15359, 16069, 16799, 17034, 16988, 17221, 17106, 16970, 16755, 16668, 16664, 16888, 16689, 16578, 16474, 16559, 16445, 16391, 16029, 15444, 15073, 14753, 14587, 15048, 15546, 16062, 16732, 17243, 17035, 16874, 16676, 16863, 16816, 16842, 16824, 16762, 16839, 16671, 16548, 16775, 16815, 16779, 16769, 16847, 16805, 16666, 16633, 16635, 16559, 16599, 16595, 16624, 16564, 16535, 16468, 16381, 16238, 16005, 15855, 15516, 15410, 15594], [15741, 15606, 15528, 14717, 14826, 14245, 14351, 14552, 14747, 15046, 15167, 15287, 15366, 15827, 16539, 17443, 18074, 18206, 17679, 17629, 17569, 17549, 17620, 17379, 17373, 17349, 17235, 17297, 17372, 17174, 17397, 17287, 17175, 16978, 16986, 17347, 17177, 17156, 17100, 17110, 17122, 17040, 17035, 17026, 17042, 16934, 16874, 16799, 16936, 16839, 16654, 16619, 16655, 16424, 16909, 16951, 16647, 16760, 16683, 16654, 16705, 16855, 16874, 16966, 16936, 16398, 16555, 16594, 16410, 16521, 16505, 16532, 16354, 16708, 16623, 16735, 16653, 16683, 16765, 16678, 16852, 16955, 16879, 16739, 16783, 16807, 16890, 16893, 16876, 16787, 16777, 16770, 16631, 16727, 16698, 16696, 16623, 16595, 16439, 16380, 16480, 16532, 16685, 16759, 16719, 16535, 16617, 16604, 16447, 16473, 16527, 16568, 16611, 16575, 16592, 16569, 16492, 16442, 16575, 16497, 16545, 16520, 16496, 16480, 16505, 16429, 16365, 16399, 16433, 16336, 16227, 16104, 16119, 15467, 15398, 15712, 15989, 16417, 17010, 17171, 16904, 16751, 16743, 16853, 16759, 16688, 16655, 16500, 16429, 16391, 16392, 16309, 16314, 16285, 16249, 16272, 16427, 16370, 16265, 16325, 16309, 16367, 16281, 16199, 16159, 15974, 15668, 15831, 15986, 16069, 15958, 15851, 15538, 15362, 14459, 14310, 13776, 13162, 12051, 12654, 13298, 12742, 13122, 12861, 12702, 12371, 12378, 12458, 12483, 12418, 12202, 12362, 12283, 12308, 12332, 12427, 12394, 12199, 11938, 11754, 10611, 11943, 12754, 11053, 10832, 10663, 10234, 10324, 10246, 10214, 10538, 10103, 9634, 9841, 9602, 10577, 11387, 11021, 11201, 11423, 11356, 11214, 10748, 10845, 10751, 10655, 10630, 10625, 10700, 10516, 10280, 10298, 10347, 10608, 10585, 10610, 10629, 10505, 10597, 10426, 10378, 10452, 10364, 10552, 10164, 10293, 10530, 10887, 10910, 10821, 10713, 10618, 10678, 10723, 10647, 10479], [10617, 10440, 10745, 10699, 10552, 10742, 10638, 10748, 10822, 10820, 10833, 10798, 10716, 10529, 10681, 10615, 10646, 10353, 10641, 10847, 10962, 10790, 10047, 10111, 10067, 10086, 10402, 10252, 10268, 10487, 10464, 10551, 10284, 10107, 10211, 10064, 10190, 10190, 10131, 10194, 10437, 10332, 10382, 10320, 10130, 10261, 10224, 10233, 10226, 10147, 10437, 10420, 10388, 10406, 10420, 10552, 10522, 10450, 10460, 10565, 10737, 10672, 10540, 10552, 10647, 10756, 10667, 10571, 10568, 10410, 10593, 10628, 10660, 10665, 10425, 10559, 10666, 10336, 10274, 10489, 10631, 10781, 10593, 10407, 10517, 10643, 10681, 10300, 10447, 10514, 10499, 10413, 10460, 10710, 10788, 10790, 10767, 10748, 10745, 10751, 10683, 10470, 10624, 10745, 10756, 10743, 10644, 10659, 10725, 10655, 10748, 10741, 10583, 10390, 10361, 10356, 10487, 10444, 10444, 10565, 10480, 10456, 10439, 10537, 10444, 10601, 10562, 10567, 10414, 10625, 10542, 10531, 10413, 10601, 10484, 9890, 10071, 10460, 10341, 10291, 10189, 9872, 9532, 9732, 10130, 10282, 10706, 10824, 11091, 10210, 10633, 10854, 10949, 10792, 10984, 10812, 10804, 10800, 10693, 10812, 10614, 10838, 10959, 10784, 10679, 10655, 10596, 10489, 10641, 10636, 10885, 10505, 10967, 11148, 10888, 10601, 10562, 10603, 10583, 10622, 10597, 10503, 10456, 10390, 9976, 9994, 10535, 10486, 10549, 10472, 10485, 10621, 10565, 10727, 10848, 10454, 10127, 10166, 10333, 10633, 10372, 10332, 10114, 9962, 10198, 10146, 10148, 10158, 10078, 10179, 10154, 10133, 9980, 9806, 10219, 10425, 10013, 9860, 9828, 9625, 9611, 9886, 10155, 10336, 10234, 10237, 10162, 10183, 10291, 9994, 9423, 9527, 9721, 9796, 10546, 10820, 9978, 9335, 9476, 10593, 9948, 10160, 9614, 9748, 10729, 9681, 10156, 10750, 11108, 9761, 9589, 9059, 9719, 10504, 11339, 11996], [10742, 9113, 10192, 11123, 9774, 9916, 10746, 9948, 9960, 9726, 9800, 10266, 10732, 11618, 12187, 10676, 8984, 9233, 10547, 11728, 12782, 13786, 14753, 15700, 16592, 17231, 16712, 15310, 14167, 12974, 11429, 9808, 9709, 10073, 9501, 10420, 10074, 9940, 9562, 9152, 10214, 9685, 9653, 9659, 10737, 9334, 10185, 9721, 9619, 9903, 9492, 9790, 10949, 9955, 9692, 10101, 9834, 11201, 12419, 13538, 14589, 15566, 16486, 17359, 18168, 18969, 19700, 20406, 21077, 21729, 22345, 22957, 23555, 24144, 24739, 25327, 25918, 26513, 27113, 27715, 28331, 28954, 29596, 30242, 30921, 31616, 32365, 33137, 33943, 34786, 35682, 36596, 37579, 38597, 39683, 39734, 39323, 38533, 37479, 35714, 35080, 34143, 32977, 31655, 30461, 29346, 28308, 27332, 26407, 25527, 24670, 24414, 23690, 23009, 22857, 23331, 23324, 22995, 23047, 23012, 23069, 22913, 22652, 22627, 22755, 22805, 22857, 22555, 22780, 22591, 22581, 22551, 22441, 22513, 22497, 22616, 22441, 22560, 22701, 22759, 22708, 22919, 23243, 23303, 23195, 23147, 23315, 23363, 23399, 23244, 23267, 23310, 23491, 23365, 23424, 23482, 23606, 23515, 23419, 23536, 23595, 23571, 23477, 23403, 23389, 23546, 23451, 23507, 23411, 23499, 23403, 23357, 23433, 23451, 23427, 23471, 23387, 23405, 23400, 23388, 23280, 23423, 23345, 23275, 23310, 23199, 23291, 23203, 23211, 23179, 23220, 23199, 23176, 23156, 23157, 23129, 23157, 23124, 23243, 23150, 23193, 23071, 23047, 23075, 23025, 23101, 22969, 23103, 23009, 23029, 23051, 23039, 23085, 22937, 23123, 23059, 23063, 23092, 23028, 23042, 23017, 23013, 22933, 22963, 22870, 22857, 22812, 22715, 22330, 21439, 20596, 19737, 18862, 17948, 17010, 16626, 17629, 18529, 18640, 17447, 16233, 15633, 14947, 15643, 16627, 17565, 18420, 19224, 19748, 19841, 19121, 17944, 16721, 15477, 14269, 13076], [13943, 15018, 15851, 15077, 13576, 14142, 15079, 15648, 14831, 13372, 14235, 15103, 15907, 16319, 15715, 14905, 13462, 13959, 14848, 15582, 16251, 16639, 16235, 14761, 13302, 12464, 13564, 14682, 15717, 16674, 17565, 18392, 19168, 19936, 20650, 21328, 21989, 22633, 23267, 23891, 24510, 25117, 25719, 26320, 26933, 27538, 28158, 28808, 29459, 30148, 30843, 31571, 32325, 33105, 33919, 34770, 35626, 34536, 32993, 31592, 30327, 30335, 31378, 32385, 33398, 34426, 34612, 32993, 31563, 30267, 29102, 28174, 27984, 27738, 27859, 27622, 27703, 27548, 27468, 27496, 27446, 27492, 27396, 27372, 27364, 27282, 27402, 27212, 27184, 27229, 27142, 27119, 27224, 27160, 27059, 27105, 27144, 27121, 27029, 27049, 27049, 27037, 27002, 26972, 26981, 26965, 26927, 26949, 26909, 26889, 26861, 26839, 26846, 26885, 26828, 26816, 26875, 26862, 26899, 26780, 26918, 26953, 26828, 26873, 26813, 26781, 26796, 26569, 26756, 26744, 26757, 26748, 26669, 26736, 26697, 26776, 26740, 26764, 26569, 26581, 26796, 26767, 26732, 26632, 26648, 26703, 26800, 26501, 26525, 26620, 26481, 26686, 26506, 26657, 26553, 26545, 26397, 26412, 26485, 26547, 26461, 26466, 26405, 26410, 26396, 26410, 26242, 26541, 26489, 26444, 26407, 26545, 26724, 26340, 26467, 26264, 26236, 26292, 26256, 26505, 26642, 26828, 26708, 26588, 26586, 26452, 26516, 26530, 26441, 26462, 26427, 26497, 26537, 26485, 26529, 26476, 26396, 26396, 26320, 26246, 26294, 26383, 26398, 26379, 26280, 26320, 26204, 26340, 26453, 26329, 26437, 26196, 26263, 26530, 26561, 26284, 26389, 26395, 26397, 26365, 26473, 26224, 26422, 26581, 26637, 26724, 26461, 26453, 26458, 26589, 26348, 26466, 26441, 26379, 26302, 26582, 26430, 26348, 26403, 26570, 26573, 26529, 26499, 26507, 26514, 26433, 26521, 26534, 26515, 26541, 26401, 26234, 26286, 26292, 26407, 26403], [26302, 26230, 26268, 26377, 26414, 26224, 26196, 26545, 26712, 26587, 26700, 26652, 26624, 26584, 26447, 26420, 26670, 26252, 26461, 26249, 26260, 26156, 26180, 26482, 26577, 26533, 26276, 26132, 26174, 26108, 26108, 26212, 26073, 26118, 26181, 26048, 26116, 26111, 26115, 26123, 26300, 26381, 26348, 26340, 26280, 26469, 26435, 26518, 26461, 26340, 26316, 26196, 26262, 26278, 26341, 26182, 26348, 26385, 26276, 26035, 26316, 26112, 26073, 26019, 25977, 25941, 25806, 26316, 26387, 26383, 26125, 26277, 26458, 26581, 26357, 26236, 26362, 26276, 26413, 26134, 26212, 26515, 26213, 26246, 26304, 26457, 26409, 26352, 26175, 26253, 26109, 26128, 26186, 26140, 26246, 26204, 26220, 26204, 26241, 26098, 26194, 26178, 26125, 26234, 26236, 26100, 26134, 26161, 26221, 26229, 26102, 26252, 26637, 26404, 26409, 26569, 26569, 26481, 26280, 26348, 26159, 26190, 26230, 26223, 26292, 26545, 26449, 26192, 26486, 26465, 26625, 26648, 26369, 26479, 26455, 26256, 26433, 26501, 26200, 26561, 26364, 26473, 26491, 26308, 26196, 26208, 26120, 26129, 26140, 26049, 26067, 26017, 26158, 26089, 26153, 25993, 26212, 26214, 26268, 26342, 26174, 26244, 26112, 25964, 26225, 26266, 26325, 26365, 26200, 26245, 26383, 26260, 26156, 26260, 26286, 26248, 26164, 26242, 26164, 26140, 26245, 26152, 26148, 26316, 26344, 26093, 26136, 26140, 26159, 26244, 26244, 26256, 26108, 26050, 26132, 26180, 26326, 26206, 26260, 26426, 26138, 26100, 26220, 26173, 26252, 26224, 26276, 26212, 26117, 26208, 26194, 26260, 26152, 26196, 26253, 26348, 26070, 26176, 26182, 26329, 26148, 26132, 26280, 26518, 26220, 26405, 26425, 26518, 26256, 26248, 26300, 26694, 26784, 26652, 26328, 26401, 26537, 26316, 26065, 26393, 25886, 25939, 26057, 26043, 25975, 26111, 26268, 26369, 26613, 26332, 26148, 26405, 25997, 26248, 26221, 26354], [26116, 25997, 25905, 26292, 26292, 26561, 26429, 26164, 26164, 26149, 26101, 26425, 26609, 26435, 26426, 26136, 26161, 26385, 26033, 26256, 26222, 26212, 26466, 26417, 26342, 26224, 26137, 26260, 26379, 26310, 26200, 26110, 26220, 26344, 26486, 26278, 26500, 26316, 26204, 26226, 26188, 26132, 26033, 26108, 26296, 26385, 26395, 26628, 26459, 26344, 26316, 26216, 26159, 26475, 26288, 26348, 26396, 26437, 26240, 26384, 26429, 26375, 26401, 26200, 26222, 26252, 26261, 26228, 26385, 26425, 26288, 26208, 26405, 26493, 26571, 26570, 26450, 26461, 26371, 26324, 26409, 26340, 26265, 26373, 26380, 26320, 26224, 26385, 26300, 26073, 26220, 26164, 26252, 26230, 26244, 26005, 26481, 26342, 26332, 26457, 26525, 26233, 26128, 26176, 26244, 26330, 26324, 26341, 26501, 26481, 26457, 26409, 26098, 26161, 26154, 26090, 26185, 26401, 26367, 26244, 26292, 26356, 26417, 26081, 26124, 26100, 26208, 26292, 26099, 26224, 26233, 26204, 26228, 26218, 26061, 26100, 26129, 26124, 26148, 26162, 26197, 26379, 26350, 26292, 26188, 26252, 26308, 26342, 26296, 26176, 26045, 26068, 26269, 26334, 26276, 26029, 26089, 26146, 26191, 26004, 26124, 26059, 25993, 26204, 26270, 26140, 26090, 26160, 26146, 26180, 26222, 26165, 26252, 26184, 26206, 25917, 26309, 26414, 26513, 26513, 26593, 26672, 26427, 26244, 26272, 26336, 26405, 26411, 26348, 26176, 26152, 26284, 26236, 26168, 26152, 26025, 26128, 26252, 26245, 26292, 26220, 26188, 26276, 26284, 26381, 26222, 26041, 26178, 26104, 26212, 26425, 26124, 26220, 26348, 26373, 26172, 26140, 25870, 26204, 26549, 26009, 26169, 26192, 26180, 26081, 26065, 25977, 26062, 26035, 26108, 26136, 26292, 26453, 26308, 26316, 26292, 26308, 26075, 26356, 26421, 26325, 26276, 26300, 26189, 26316, 26557, 26361, 26308, 26286, 26241, 26284, 26179, 26172, 26209, 26270, 26196], [26065, 26099, 26302, 26394, 26429, 26507, 26426, 26262, 26412, 26375, 26300, 26248, 26300, 26232, 26017, 26204, 26377, 26069, 26260, 26377, 26252, 26312, 26100, 26401, 26264, 26214, 26238, 26675, 26445, 26300, 26447, 26712, 26906, 26609, 26264, 26240, 26417, 26356, 26288, 26493, 26584, 26672, 26361, 26383, 26595, 26443, 26460, 26304, 26049, 26465, 26646, 26768, 26340, 26198, 26204, 26383, 26310, 26192, 26180, 26246, 26143, 26133, 26073, 26130, 26089, 26212, 26223, 26304, 26405, 26459, 26475, 26586, 26557, 26700, 26636, 26573, 26240, 26228, 26194, 26280, 26348, 26365, 26288, 26257, 26212, 26232, 26265, 26128, 26230, 26340, 26320, 26216, 26209, 26122, 26100, 26017, 26025, 26144, 26361, 26046, 25929, 25981, 26073, 25993, 26059, 26116, 26132, 26078, 26189, 26222, 26178, 26002, 25974, 25987, 26061, 25905, 25949, 26017, 25974, 25907, 25993, 26454, 26361, 26206, 26222, 26244, 26264, 26239, 26224, 26120, 26192, 26216, 26073, 26127, 26150, 26162, 26124, 26233, 26122, 26156, 26145, 26053, 26104, 26140, 26029, 26120, 26120, 26097, 26124, 26279, 26264, 26256, 26143, 26216, 26111, 25985, 26176, 26332, 26263, 26277, 26264, 26232, 26099, 26240, 26228, 26065, 26003, 26082, 26159, 26262, 26428, 26529, 26605, 26577, 26334, 26312, 26175, 26352, 26475, 26601, 26465, 26371, 26292, 26270, 26164, 26316, 26353, 26348, 26311, 26293, 26288, 26213, 26312, 26104, 26140, 26154, 26449, 26680, 26605, 26547, 26300, 26236, 26348, 26546, 26578, 26636, 26547, 26465, 25977, 26164, 26292, 26133, 26102, 26304, 26224, 26268, 26735, 26923, 27051, 26864, 26473, 26415, 26433, 26336, 26340, 26304, 26401, 26412, 26547, 26613, 26814, 26340, 26300, 26252, 26342, 26465, 26509, 26400, 26377, 26089, 26382, 26378, 26430, 26632, 26587, 26610, 26821, 26654, 26680, 26726, 26655, 26798, 26969, 27144, 27117, 26959], [26620, 26525, 26593, 26828, 26875, 26864, 26933, 26684, 26573, 26316, 26304, 26252, 26361, 26453, 26521, 26542, 26532, 26393, 26332, 26308, 26354, 26230, 26430, 26622, 26816, 26961, 26969, 26897, 26812, 26717, 26740, 26740, 26652, 26668, 26577, 26580, 26486, 26325, 26404, 26403, 26377, 26352, 26348, 26529, 26300, 26268, 26326, 26443, 26361, 26264, 26294, 26296, 26334, 26357, 26359, 26402, 26485, 26481, 26260, 26081, 26156, 26140, 26229, 26270, 26028, 25993, 26304, 26578, 26577, 26180, 26439, 25942, 26658, 26939, 26909, 26744, 26603, 26461, 26184, 26425, 26481, 26529, 26602, 26268, 26204, 26393, 26422, 26545, 26417, 26393, 26382, 26409, 26340, 26324, 26320, 26344, 26498, 26612, 26603, 26350, 26308, 26270, 26270, 26405, 26210, 26172, 26330, 26340, 26334, 26116, 26124, 26161, 26214, 26252, 26101, 26130, 26156, 26328, 26516, 26449, 26326, 26288, 26324, 26270, 26029, 25960, 26244, 26457, 26616, 26634, 26879, 26865, 26654, 26554, 26479, 26441, 26373, 26469, 26529, 26316, 26317, 26326, 26240, 26397, 26324, 26642, 26986, 26749, 26708, 26836, 26868, 26688, 26506, 26796, 26969, 26956, 26913, 26652, 26609, 26796, 26873, 26929, 26873, 26453, 26620, 26620, 26425, 26517, 26565, 26732, 26764, 26812, 26745, 26724, 26822, 26797, 26796, 26816, 26938, 26924, 26961, 26839, 26700, 26717, 26756, 26435, 26351, 26362, 26356, 26268, 26529, 26489, 26620, 26537, 26525, 26465, 26473, 26300, 26221, 26271, 26340, 26579, 26353, 26244, 26350, 26501, 26562, 26554, 26601, 26410, 26356, 26529, 26573, 26366, 26160, 26089, 26212, 26415, 26239, 26059, 26224, 26514, 26708, 26744, 26648, 26457, 26483, 26294, 26397, 26284, 26220, 26264, 26212, 26317, 26353, 26454, 26616, 26704, 26521, 26017, 26152, 26108, 26232, 26318, 26402, 26377, 26066, 26128, 26260, 26217, 26101, 26292, 26216, 26234, 26923, 27228], [27065, 26889, 26860, 26676, 26844, 26973, 26806, 26961, 26868, 26711, 26852, 26788, 26529, 26541, 26545, 26580, 26577, 26620, 26680, 26684, 26636, 26648, 26640, 26676, 26571, 26371, 26348, 26418, 26692, 26806, 26708, 26660, 26607, 26700, 26784, 26812, 26776, 26638, 26596, 26498, 26547, 26664, 26668, 26601, 26656, 26696, 26545, 26648, 26603, 26329, 26398, 26478, 26609, 26679, 26569, 26324, 26393, 26449, 26406, 26326, 26342, 26265, 26288, 26361, 26449, 26475, 26407, 26369, 26359, 26501, 26425, 26381, 26324, 26312, 26437, 26485, 26477, 26445, 26308, 26425, 26505, 26553, 26425, 26403, 26377, 26370, 26077, 26216, 26268, 26220, 26225, 26304, 26529, 26616, 26328, 26300, 26099, 26228, 26230, 26228, 26236, 26278, 26465, 26601, 26593, 26344, 26228, 26228, 26264, 26308, 26380, 26284, 26150, 26173, 26153, 26156, 26332, 26379, 26288, 25917, 26204, 26518, 26577, 26216, 26089, 26065, 26033, 26172, 26788, 26670, 26393, 26433, 26502, 26292, 26340, 26434, 26453, 26344, 26457, 26614, 26569, 26429, 26461, 26427, 26161, 26332, 26366, 26272, 26288, 26272, 26361, 26340, 26313, 26308, 26399, 26473, 26581, 26671, 26601, 26458, 26435, 26410, 26324, 26097, 26423, 26609, 26377, 26284, 26124, 26264, 26317, 26214, 26190, 25978, 26027, 26352, 26537, 26593, 26652, 26265, 25961, 26160, 26192, 26206, 26258, 26206, 26073, 26244, 26296, 26502, 26804, 26676, 26718, 26401, 26272, 26469, 26449, 26439, 26421, 26537, 26638, 26704, 26652, 26789, 26710, 26334, 26070, 26270, 26215, 26332, 26477, 26332, 26289, 26431, 26549, 26704, 26417, 26669, 26790, 27076, 26912, 26749, 26945, 27053, 27085, 27033, 26820, 26684, 26774, 26866, 26493, 26336, 26325, 26577, 26417, 26449, 26285, 26044, 26505, 26437, 26426, 26748, 26688, 26740, 26772, 26700, 26505, 26593, 26700, 26497, 26340, 26329, 26156, 26090, 26246, 26373], [26399, 26652, 26413, 26417, 26348, 26292, 26288, 26176, 26223, 26108, 26108, 26479, 26873, 26800, 26792, 26796, 26641, 26569, 26507, 26636, 26840, 26995, 26553, 26638, 26545, 26538, 26585, 26561, 26517, 26589, 26511, 26276, 26401, 26425, 26240, 26140, 26270, 26184, 26158, 26236, 26332, 26508, 26453, 26340, 26301, 26125, 25922, 25873, 26165, 26365, 26780, 27041, 26801, 26700, 26569, 26348, 26449, 26640, 26642, 26684, 26587, 26772, 26838, 26788, 26417, 26100, 26003, 26156, 26658, 26712, 26911, 26929, 26780, 26441, 26409, 26481, 26382, 26327, 26308, 26136, 26084, 26491, 26812, 26765, 26720, 26805, 26612, 26489, 26257, 26516, 26593, 26425, 26616, 26820, 26523, 26473, 26696, 26724, 26634, 26595, 26780, 26585, 26700, 26725, 26726, 26547, 26603, 26621, 26684, 26889, 27003, 27049, 26668, 26610, 26668, 26593, 26603, 26272, 26441, 26514, 26276, 26377, 26247, 26578, 26832, 26868, 26804, 26800, 26637, 26395, 26385, 26397, 26620, 26701, 26640, 26693, 26529, 26652, 26724, 26640, 26385, 26212, 26610, 26920, 26959, 26687, 26862, 26867, 26741, 26676, 26637, 26753, 26804, 26636, 26478, 26081, 26168, 26381, 26150, 25887, 26110, 26529, 26852, 27001, 26808, 26822, 26708, 26706, 26764, 26481, 26453, 26441, 26609, 26724, 26686, 26521, 26696, 26766, 26726, 26684, 26717, 26433, 26481, 26517, 26508, 26471, 26414, 26272, 26180, 26089, 26414, 26444, 26140, 25871, 26332, 26812, 27121, 26848, 26712, 26578, 26582, 26541, 26509, 26580, 26605, 26541, 26505, 26525, 26414, 26381, 26356, 26393, 26451, 26569, 26615, 26617, 26541, 26530, 26562, 26497, 26429, 26403, 26284, 26292, 26081, 26237, 26324, 26376, 26293, 26245, 26126, 26140, 26272, 26300, 26224, 26104, 26081, 26252, 26505, 26573, 26586, 26355, 26320, 26377, 26385, 26449, 26601, 26585, 26453, 26497, 26569, 26726, 26701, 26593, 26520, 26252], [26348, 26505, 26571, 26561, 26644, 26768, 26684, 26554, 26553, 26547, 26425, 26284, 26248, 26320, 26521, 26660, 26491, 26320, 26156, 26260, 26280, 26284, 26268, 26276, 26425, 26377, 26129, 26065, 26145, 26324, 26636, 26816, 26710, 26585, 26563, 26489, 26507, 26409, 26396, 26369, 26252, 26230, 26226, 26288, 26292, 26193, 26188, 26212, 26276, 26292, 26295, 26399, 26417, 26393, 26294, 26176, 26034, 26156, 26197, 26310, 26441, 26577, 26485, 26429, 26252, 26244, 26292, 26276, 26188, 26373, 26397, 26329, 26246, 26309, 26268, 26385, 26097, 26276, 26399, 26141, 26255, 26553, 26688, 26578, 26553, 26533, 26457, 26295, 26361, 26224, 26025, 26077, 26184, 26393, 26473, 26434, 26308, 26184, 26081, 25864, 26260, 26444, 26415, 26316, 26204, 26352, 26246, 26146, 26221, 26220, 26236, 26441, 26437, 26348, 26352, 26394, 26296, 26152, 26228, 26525, 26562, 26497, 26425, 26455, 26539, 26450, 26555, 26655, 26553, 26449, 26310, 26264, 26266, 26128, 26126, 26232, 26260, 26444, 26580, 26645, 26605, 26601, 26284, 26342, 26394, 26428, 26453, 26393, 26361, 26475, 26485, 26421, 26425, 26348, 26325, 26268, 26256, 26302, 26292, 25983, 26188, 26157, 25929, 26033, 26057, 26260, 26426, 26342, 26126, 26038, 26073, 26097, 26100, 26348, 26595, 26629, 26445, 26489, 26435, 26405, 26318, 26220, 26037, 26101, 26097, 26199, 26025, 26144, 25993, 26013, 26304, 26059, 26142, 26081, 26206, 26228, 26239, 26108, 25883, 25897, 25995, 26019, 25803, 25833, 25843, 25750, 26041, 25855, 25871, 25810, 25947, 26115, 26168, 26287, 26264, 26426, 26481, 26462, 26128, 26140, 25802, 26110, 26228, 25895, 26175, 26537, 26369, 26628, 26561, 26692, 26664, 26431, 26260, 26230, 26123, 26284, 26356, 25921, 26184, 26154, 26099, 26308, 26491, 26366, 26431, 26184, 26057, 26049, 26025, 26025, 25814, 25945, 25855, 26276, 26513, 26168], [26216, 26217, 25957, 26081, 26252, 26004, 26417, 26676, 26502, 26537, 26505, 26595, 26439, 26294, 26073, 26414, 26499, 26537, 26363, 26228, 26284, 26330, 26361, 26228, 26260, 26268, 26293, 26288, 26108, 25953, 26033, 26200, 26328, 26341, 26268, 26200, 26248, 26150, 26083, 26001, 26005, 26094, 26108, 26128, 26115, 26018, 25980, 26204, 26357, 26439, 26457, 26400, 26285, 26340, 26257, 26026, 25907, 26148, 26114, 26340, 26269, 25997, 25993, 26085, 26236, 26240, 26086, 26205, 26212, 26120, 26172, 26180, 26013, 26005, 26104, 26188, 26237, 26090, 25938, 26058, 25987, 26051, 26057, 26141, 26037, 26017, 25913, 25857, 26057, 26260, 26268, 26244, 26168, 26158, 26252, 26126, 25970, 25955, 26108, 26270, 26276, 26348, 26232, 26264, 26336, 26353, 26340, 26200, 26236, 26304, 26363, 26256, 26196, 26208, 26065, 26160, 26216, 26164, 26067, 26018, 25971, 26095, 26065, 26172, 26178, 26097, 25977, 26216, 26224, 26278, 26144, 26134, 26034, 26017, 25969, 25993, 25825, 26036, 26093, 26108, 26108, 26158, 25989, 26035, 25948, 26158, 26177, 26208, 26025, 26084, 26236, 26126, 25980, 26081, 26224, 26289, 26099, 26148, 26158, 26198, 26156, 26232, 26090, 26224, 26277, 26223, 26269, 26236, 26029, 26126, 26165, 26280, 26228, 26146, 26117, 26111, 26220, 26310, 26363, 26365, 26412, 26278, 26487, 26579, 26457, 26361, 26425, 26431, 26399, 26308, 26264, 26220, 26065, 26148, 26164, 26146, 26140, 26122, 26173, 26158, 26098, 26065, 26164, 26148, 26228, 26248, 26261, 26256, 26144, 26164, 26122, 26108, 26019, 25937, 25961, 25883, 25906, 25903, 25670, 25814, 25953, 26068, 26006, 26006, 26116, 26162, 26184, 26150, 26120, 26001, 26013, 26033, 25965, 25837, 25983, 25977, 25813, 25932, 25769, 26089, 26336, 26493, 26562, 26077, 25977, 25913, 26050, 26357, 26238, 26070, 26097, 26065, 26001, 25834, 25713, 26108], [26505, 26248, 26288, 26238, 26205, 25909, 26457, 26453, 26356, 26120, 26194, 26450, 26740, 26469, 26324, 26411, 26348, 26336, 26377, 26457, 26481, 26222, 26130, 26194, 26256, 26288, 26470, 26482, 26441, 26292, 26248, 26180, 26164, 26164, 26089, 26001, 25925, 25972, 25949, 25852, 25788, 26284, 26620, 26521, 26325, 26308, 26310, 26343, 26532, 26645, 26593, 26561, 26473, 26399, 26212, 26276, 26148, 25981, 26041, 26108, 26070, 26089, 26148, 26114, 26025, 25905, 25765, 25833, 25953, 25963, 25905, 26005, 25863, 25817, 25859, 26063, 26252, 26340, 26401, 26049, 25909, 25761, 25901, 25811, 25945, 25905, 25721, 26038, 26136, 26300, 26466, 26586, 26573, 25895, 25711, 25947, 26077, 25785, 25761, 26244, 26577, 26142, 26132, 26224, 26158, 26136, 26425, 26505, 26317, 26268, 26033, 26140, 26090, 25881, 25970, 25977, 26033, 25897, 26001, 26097, 26196, 26209, 25977, 26081, 26222, 26242, 26238, 26240, 26108, 26025, 25913, 25881, 25858, 25914, 25657, 25828, 25761, 25953, 25841, 25738, 25685, 25687, 25819, 25953, 26065, 25882, 25841, 25881, 25676, 25818, 25700, 25903, 25866, 25773, 25902, 26074, 26065, 25945, 25958, 26148, 26212, 26168, 26124, 26005, 25819, 25527, 25753, 25859, 25850, 26041, 26017, 25865, 25833, 25709, 25835, 25857, 25742, 25439, 25653, 25721, 25543, 25694, 25713, 26101, 26126, 26160, 26152, 26097, 26007, 25871, 25863, 25834, 25833, 25870, 25828, 25615, 25657, 25757, 25705, 25943, 26260, 25949, 25870, 25810, 25781, 25673, 25926, 25990, 26013, 26108, 26140, 26069, 26020, 25977, 25974, 26005, 26104, 26173, 26240, 26172, 26196, 26224, 26308, 26417, 26394, 26052, 26181, 26177, 26176, 26188, 26156, 25918, 25938, 25995, 26025, 26172, 26172, 26140, 26093, 25896, 25941, 25937, 25883, 25920, 25827, 25855, 25754, 26091, 26293, 26352, 26204, 26186, 26168, 26193, 26148, 26089], [26286, 26276, 26149, 26073, 25953, 26003, 26009, 26033, 26077, 26041, 25869, 25585, 25907, 25769, 25841, 26005, 26200, 25977, 26161, 25889, 25646, 26077, 26276, 25907, 25725, 26268, 26553, 26378, 26506, 26300, 25786, 26247, 26318, 26300, 26241, 26170, 26097, 26065, 26108, 26093, 26005, 26013, 26017, 25873, 25701, 25825, 25913, 25909, 25681, 25841, 25814, 25523, 25825, 26244, 26361, 26336, 26326, 26367, 25972, 25955, 25949, 26093, 26006, 26052, 26021, 26140, 26184, 26212, 26220, 26061, 26006, 26033, 26084, 26059, 25927, 26041, 26018, 25993, 25940, 25969, 26164, 26140, 25989, 26065, 26104, 25865, 25646, 25741, 25753, 25729, 25896, 25991, 25850, 25863, 25905, 25838, 25838, 25881, 25855, 25818, 25747, 25732, 25724, 25755, 25835, 25849, 25673, 25575, 25721, 25917, 25905, 26036, 26184, 26196, 26284, 26326, 26348, 26370, 26320, 26176, 26083, 26252, 26312, 26292, 26286, 26220, 26104, 25861, 25761, 25449, 25874, 26049, 25585, 25903, 26100, 26057, 25894, 26159, 26208, 26172, 26033, 25945, 25981, 25869, 25709, 25866, 25737, 26041, 26152, 26199, 25933, 25715, 25793, 25985, 26332, 26352, 26382, 26240, 26116, 26144, 26208, 26272, 26276, 26302, 26104, 25789, 26125, 26321, 26441, 26435, 26459, 26334, 26260, 26120, 26057, 25974, 25877, 25993, 26102, 26210, 26212, 26237, 26117, 26018, 26011, 26035, 25985, 26001, 25974, 26097, 25801, 25729, 25939, 26326, 26367, 26369, 26252, 26301, 25841, 25774, 25579, 26140, 26101, 25915, 26030, 25887, 25745, 25846, 26050, 26097, 26013, 25969, 26033, 25985, 26099, 26156, 26189, 26180, 25981, 25993, 25868, 26108, 26212, 26268, 26224, 26166, 26061, 25815, 25757, 25919, 26049, 26006, 25995, 25731, 25925, 25961, 25889, 26081, 26257, 26136, 26041, 26065, 26075, 25985, 25909, 25922, 26065, 26244, 26300, 26252, 26236, 26140, 26119, 25915, 25950, 26304], [26089, 26013, 26037, 26089, 26053, 26035, 26001, 26150, 26172, 25833, 25905, 25927, 25849, 25894, 25789, 25905, 25933, 25715, 25626, 25929, 26172, 26184, 25929, 26049, 25801, 25713, 25845, 25861, 25899, 25925, 26050, 26192, 26097, 25909, 25789, 25583, 25673, 25796, 25850, 25853, 25837, 25841, 25626, 25729, 25769, 25841, 25842, 25859, 25661, 25735, 25682, 25691, 25705, 25701, 25681, 25737, 25898, 25941, 25898, 25753, 25667, 25794, 25882, 25953, 26005, 25777, 25722, 25632, 25585, 25563, 25610, 25551, 25463, 25567, 25657, 25866, 25950, 25721, 25625, 25753, 25849, 25950, 25905, 25778, 25595, 25561, 25521, 25371, 25393, 25499, 25535, 25551, 25527, 25447, 25201, 25221, 25465, 25761, 25801, 25841, 25733, 25809, 25551, 25589, 25608, 25918, 25941, 26033, 25657, 25683, 25677, 25605, 25969, 26265, 26280, 25972, 25881, 25487, 25527, 24979, 25637, 25833, 25819, 25317, 25765, 26184, 26228, 25834, 25614, 25747, 25497, 26128, 26269, 26005, 26100, 25914, 25889, 25841, 25817, 26033, 26057, 26132, 25535, 25731, 25701, 25630, 25812, 26208, 26407, 26244, 26100, 26120, 26128, 25850, 25917, 25910, 25969, 26114, 26224, 26184, 26002, 26053, 26153, 26216, 26083, 25838, 25906, 25851, 25887, 25661, 25835, 25893, 25684, 25737, 25794, 25911, 25707, 25793, 25737, 25705, 25669, 25593, 25729, 25890, 25965, 25953, 25761, 25721, 25662, 25589, 25627, 25677, 25709, 25761, 25810, 25689, 25551, 25605, 25714, 25689, 25826, 25837, 25803, 25713, 25687, 25697, 25685, 25643, 25699, 25683, 25722, 25737, 25733, 25757, 25787, 25673, 25570, 25563, 25610, 25594, 25621, 25745, 25877, 25710, 25447, 25610, 25730, 25593, 25705, 25669, 25713, 25721, 25729, 25725, 25769, 25634, 25761, 25701, 25605, 25536, 25738, 25825, 25828, 25773, 25801, 25721, 25697, 25657, 25650, 25563, 25657, 25721, 25729, 26001, 26046, 26245], [26300, 26186, 26100, 25794, 25886, 25601, 25527, 25717, 25793, 26081, 26192, 26252, 26141, 25970, 25937, 26142, 25946, 25958, 26081, 25825, 25753, 25988, 26029, 25850, 25811, 25827, 25730, 25797, 25884, 26041, 26043, 25978, 25793, 25661, 25644, 25729, 25435, 25529, 25450, 25563, 25529, 25649, 25825, 25955, 25881, 25753, 25906, 25833, 25828, 25858, 25866, 25810, 25890, 25748, 25926, 25945, 25882, 25745, 25643, 25625, 25707, 25641, 25677, 25715, 25854, 25678, 25701, 25631, 25733, 25712, 25713, 25673, 25657, 25594, 25649, 25589, 25579, 25705, 25755, 25626, 25265, 25270, 25161, 25403, 25419, 25285, 25285, 25603, 26097, 26236, 26045, 26166, 26172, 26059, 25991, 25999, 26208, 26327, 26072, 26057, 25921, 25945, 26129, 26111, 25955, 26001, 26196, 26116, 26090, 26196, 26148, 26176, 26036, 26003, 25801, 25845, 25833, 25964, 25971, 26017, 26009, 25969, 25977, 25841, 25801, 25475, 25721, 25781, 25707, 25907, 25977, 25859, 25873, 25877, 25833, 25694, 25805, 25801, 25785, 25601, 25615, 25527, 25836, 25986, 26006, 26108, 25819, 25637, 25741, 26099, 25941, 25463, 25575, 25795, 25841, 25861, 25953, 26103, 25618, 25841, 25947, 26120, 26132, 26328, 26252, 26210, 26180, 26045, 25857, 25801, 25843, 25809, 25801, 25811, 25881, 25977, 25933, 26021, 26068, 26050, 26087, 25953, 25863, 25835, 25838, 25859, 25871, 25873, 25940, 25839, 25633, 25561, 25663, 25811, 25801, 25787, 25722, 25905, 25990, 25841, 25754, 25805, 25826, 25745, 25718, 25713, 25734, 25757, 25908, 26071, 26061, 26091, 26019, 25913, 25921, 25858, 25827, 25997, 25694, 25617, 25609, 25937, 26065, 26035, 26085, 25954, 25869, 25934, 25989, 25970, 25898, 25830, 25882, 25583, 25589, 25721, 25837, 25843, 25857, 25822, 25752, 25527, 25523, 25819, 25817, 25683, 25873, 25981, 26005, 26073, 26100, 26005, 26124, 26132, 25769, 25475], [26172, 26172, 26093, 26003, 25875, 25519, 25519, 25439, 25487, 25601, 25488, 25609, 25771, 25931, 25981, 25941, 26021, 25904, 25850, 25709, 25673, 25627, 25722, 25841, 25661, 25817, 25753, 25789, 25737, 25786, 25809, 25853, 25865, 25849, 25833, 25779, 25745, 25821, 25765, 25763, 25837, 25755, 25753, 25884, 25871, 25677, 25721, 25817, 25795, 25780, 25596, 25551, 25555, 25707, 25761, 25641, 25666, 25343, 25563, 25653, 25676, 25888, 25962, 25863, 25981, 26077, 25771, 25607, 25556, 25317, 25352, 25471, 25531, 25503, 25833, 25937, 25633, 25902, 25945, 25685, 25579, 25725, 25901, 26020, 25929, 25905, 26069, 26136, 26108, 25953, 25529, 25563, 25585, 25739, 25881, 25793, 25785, 25543, 25513, 25609, 25841, 25974, 26049, 25923, 25971, 26101, 26180, 26140, 26168, 26020, 25913, 25890, 25841, 25753, 25737, 25625, 25739, 25730, 25781, 25715, 25699, 25805, 25772, 25729, 25729, 25713, 25586, 25435, 25693, 25849, 25809, 25777, 25801, 25725, 25479, 25487, 25472, 25522, 25499, 25546, 25479, 25447, 25513, 25483, 25587, 25810, 25866, 25904, 25967, 26084, 26144, 25941, 25661, 25535, 25443, 25465, 25459, 25474, 25593, 25733, 25846, 25809, 25682, 25698, 25662, 25657, 25668, 25684, 25683, 25686, 25701, 25801, 25957, 25978, 25941, 25902, 25993, 25881, 25639, 25535, 25411, 25351, 25697, 26005, 26304, 26417, 26179, 25899, 26018, 26108, 26172, 26143, 26034, 25916, 25709, 25551, 25467, 25737, 25963, 26057, 25953, 25769, 25813, 25865, 25826, 25674, 25570, 25747, 25845, 26089, 26099, 25993, 25845, 25914, 25909, 25833, 25697, 25609, 25845, 25785, 25865, 25755, 25587, 25583, 25657, 25742, 25833, 25809, 25741, 25617, 25639, 25721, 25723, 25865, 25821, 25873, 25820, 25750, 25715, 25709, 25643, 25552, 25467, 25417, 25471, 25441, 25402, 25434, 25625, 25622, 25795, 26013, 25990, 25961, 25988, 25873], [25948, 25949, 25937, 25977, 25917, 25724, 25551, 25571, 25654, 25674, 25633, 25637, 25825, 25989, 25857, 25801, 25634, 25793, 25618, 25726, 25762, 25925, 25841, 25866, 25730, 25769, 25717, 25724, 25794, 25729, 25653, 25521, 25281, 25404, 25666, 25801, 25888, 25981, 25906, 25849, 25869, 25890, 25849, 25817, 25841, 25885, 25953, 25884, 25814, 25600, 25230, 25379, 25783, 25837, 25869, 25825, 25785, 25689, 25713, 25778, 25713, 25778, 25746, 25745, 25506, 25577, 25637, 25741, 25697, 25724, 25809, 25859, 25625, 25269, 25543, 25650, 25590, 25594, 25359, 25460, 25545, 25813, 25966, 26042, 25835, 25812, 25678, 25649, 25790, 25927, 25938, 25929, 25913, 25888, 25556, 25479, 25569, 25505, 25593, 25875, 26085, 26150, 26120, 25997, 25629, 25583, 25638, 25669, 25745, 25694, 25900, 26017, 26065, 25980, 25849, 25753, 25789, 25933, 25913, 25851, 25785, 25775, 25925, 25891, 25313, 25721, 25997, 26175, 26034, 25930, 25810, 25818, 25843, 25845, 25871, 25721, 25609, 25617, 25471, 25331, 25615, 25701, 25797, 25909, 25769, 25465, 25287, 25367, 25650, 26058, 26097, 25734, 25837, 25801, 25812, 25749, 25793, 25909, 25919, 25863, 25821, 25755, 25669, 25567, 25745, 25823, 25833, 25681, 25643, 25745, 25769, 25583, 25529, 25817, 25846, 25821, 25657, 25419, 25465, 25653, 25758, 25705, 25399, 25739, 25873, 25926, 25913, 25849, 25753, 25583, 25556, 25613, 25625, 25665, 25647, 25639, 25605, 25641, 25508, 25129, 25325, 25528, 25483, 25451, 25403, 25594, 25865, 25993, 26025, 26081, 25583, 25614, 25586, 25737, 25729, 25657, 25601, 25482, 25552, 25583, 25129, 25459, 25535, 25431, 25761, 26065, 26034, 25415, 25483, 25647, 25753, 25707, 25793, 25793, 25816, 25651, 25693, 25841, 25745, 25825, 25635, 25627, 25673, 25587, 25793, 25861, 25884, 25869, 25765, 25659, 25810, 25929, 26005, 25972, 25918, 25745], [25463, 25451, 25479, 25399, 25599, 25451, 25355, 25344, 25493, 25593, 25555, 25515, 25605, 25427, 25409, 25645, 25648, 25658, 25785, 25641, 25511, 25741, 25593, 25449, 25415, 25463, 25660, 25837, 25817, 25543, 25631, 25891, 25953, 25906, 25821, 25785, 25827, 25897, 25901, 25869, 25757, 25552, 25506, 25618, 25535, 25431, 25633, 25725, 25774, 25667, 25725, 25690, 25611, 25557, 25625, 25585, 25536, 25643, 25818, 25900, 25841, 25843, 25837, 25257, 25412, 25929, 25930, 25755, 25785, 25809, 25827, 25830, 25829, 25865, 25785, 25750, 25669, 25625, 25601, 25609, 25575, 25709, 25689, 25491, 25425, 25689, 25657, 25778, 25614, 25589, 25605, 25627, 25638, 25621, 25593, 25440, 25545, 25618, 25544, 25583, 25682, 25798, 25825, 25745, 25559, 25575, 25554, 25583, 25737, 25321, 25491, 25512, 25495, 25583, 25745, 25779, 25709, 25657, 25721, 25543, 25633, 25621, 25575, 25571, 25602, 25585, 25665, 25737, 25519, 25483, 25593, 25575, 25641, 25674, 25589, 25471, 25289, 25353, 25543, 25641, 25579, 25583, 25499, 25593, 25507, 25630, 25633, 25787, 25849, 25817, 25841, 25561, 25601, 25706, 25512, 25544, 25527, 25554, 25599, 25631, 25611, 25551, 25579, 25609, 25667, 25753, 25805, 25779, 25351, 25395, 25402, 25373, 25282, 25345, 25451, 25369, 25407, 25271, 25491, 25535, 25511, 25642, 25618, 25657, 25583, 25794, 25681, 25599, 25269, 25423, 25495, 25451, 25756, 25876, 25948, 25836, 25769, 25789, 25863, 25829, 25713, 25737, 25697, 25737, 25740, 25737, 25722, 25569, 25626, 25666, 25682, 25681, 25598, 25646, 25717, 25689, 25761, 25817, 25766, 25721, 25584, 25669, 25729, 25693, 25746, 25654, 25694, 25692, 25685, 25648, 25556, 25571, 25653, 25587, 25561, 25503, 25373, 25521, 25399, 25336, 25407, 25347, 25287, 25350, 25407, 25375, 25434, 25607, 25439, 25469, 25633, 25610, 25665, 25722, 25589, 25556], [25617, 25585, 25471, 25601, 25667, 25917, 25927, 25937, 25817, 25722, 25957, 26136, 25961, 25905, 25814, 25747, 25702, 25567, 25411, 25693, 25745, 25787, 25585, 25369, 25585, 25621, 25741, 25881, 25507, 25375, 25535, 25474, 25520, 25567, 25431, 25657, 25543, 25463, 25490, 25433, 25825, 25905, 25761, 25804, 25815, 25881, 25601, 25505, 25551, 25583, 25634, 25527, 25519, 25583, 25689, 25659, 25737, 25659, 25587, 25609, 25555, 25697, 25867, 26003, 26066, 26128, 26013, 25979, 25901, 25947, 26003, 25934, 25761, 25661, 25617, 25479, 25519, 25543, 25737, 25747, 25796, 26027, 26089, 26185, 26172, 26049, 26097, 26069, 26017, 25987, 26025, 25997, 25985, 25977, 25905, 25901, 25906, 25844, 25821, 25829, 25805, 25730, 25674, 25637, 25593, 25750, 25841, 25895, 25977, 25945, 25965, 26026, 25761, 25685, 25641, 25621, 25637, 25465, 25615, 25753, 25658, 25606, 25737, 25893, 25923, 25796, 25674, 25645, 25511, 25529, 25536, 25343, 25596, 25726, 25779, 25809, 25882, 25901, 25762, 25781, 25954, 26109, 26172, 26074, 25833, 25585, 25447, 25444, 25437, 25471, 25439, 25435, 25379, 25213, 24846, 25247, 25869, 26185, 26252, 26192, 26074, 25935, 25891, 25932, 25819, 25745, 25629, 25427, 25331, 25505, 25674, 25731, 25617, 25481, 25487, 25584, 25714, 25885, 25891, 25883, 25633, 25527, 25618, 25762, 25841, 25769, 25693, 25657, 25643, 25726, 25769, 25687, 25355, 25425, 25495, 25407, 25352, 25359, 25563, 25785, 25893, 25751, 25851, 25884, 25894, 25899, 25923, 25887, 25818, 25781, 25780, 25769, 25685, 25803, 25869, 25841, 25825, 25874, 25875, 25873, 25941, 25913, 25877, 25849, 25693, 25689, 25809, 25817, 25729, 25706, 25722, 25614, 25559, 25581, 25625, 25627, 25516, 25732, 25889, 25953, 25950, 25914, 25781, 25780, 25662, 25785, 25913, 25871, 25809, 25551, 25221, 25487, 25443, 25432, 25311, 25503], [25599, 25769, 25995, 26036, 25871, 25916, 25915, 25714, 25593, 25828, 25989, 26033, 26019, 25973, 25961, 26033, 26058, 25930, 25821, 25673, 25503, 25535, 25609, 25427, 25601, 25682, 25813, 25745, 25737, 25867, 25995, 26035, 25899, 25765, 25721, 25678, 25745, 25829, 25929, 26005, 25969, 25933, 25705, 25535, 25435, 25555, 25557, 25699, 25858, 25779, 25167, 25309, 25849, 26011, 25900, 25737, 25777, 25669, 25487, 25661, 25730, 25745, 25815, 25519, 25698, 26108, 26089, 25945, 26017, 26061, 26061, 25962, 26017, 25862, 25825, 25817, 25873, 25789, 25868, 25881, 25977, 26033, 25921, 25819, 25836, 25769, 25849, 25945, 25915, 25868, 25794, 25850, 25998, 25895, 25864, 25841, 25893, 25910, 25923, 25964, 25949, 25953, 25985, 25889, 25826, 25729, 25881, 25931, 25891, 25841, 25837, 25681, 25317, 25769, 25937, 25929, 25901, 25804, 25600, 25634, 25701, 25749, 25479, 25657, 25601, 25721, 25691, 25782, 25741, 25683, 25785, 25837, 25785, 25615, 25751, 25881, 25866, 25809, 25865, 25639, 25543, 25519, 25601, 25560, 25593, 25602, 25673, 25773, 25913, 25958, 25660, 25423, 25353, 25457, 25601, 25839, 25962, 25448, 25597, 25869, 25953, 25898, 25865, 25827, 25864, 25465, 25575, 25600, 25615, 25709, 25681, 25636, 25761, 25769, 25689, 25733, 25777, 25765, 25668, 25683, 25731, 25677, 25575, 25585, 25567, 25611, 25773, 25914, 25961, 25929, 25903, 25873, 25833, 25678, 25721, 25825, 25894, 25825, 25730, 25431, 25499, 25463, 25529, 25488, 25686, 25913, 25901, 25705, 25637, 25705, 25761, 25781, 25519, 25830, 25964, 25935, 25881, 25641, 25651, 25653, 25785, 25589, 25650, 25737, 25852, 25961, 25929, 25974, 25929, 25729, 25754, 25713, 25645, 25693, 25689, 25701, 25425, 25465, 25309, 25173, 25814, 25989, 25527, 25545, 25657, 25687, 25722, 25779, 25575, 25861, 25953, 26009, 25870, 25793, 25825, 25739], [25769, 25821, 25801, 25812, 25303, 25725, 26005, 25925, 25913, 25947, 25589, 25294, 25681, 25861, 25745, 25666, 25637, 25653, 25681, 25665, 25609, 25682, 25567, 25487, 25499, 25737, 25833, 25489, 25483, 25489, 25407, 25611, 25611, 25547, 25381, 25487, 25431, 25301, 25279, 25527, 25801, 25857, 25455, 25605, 25658, 25741, 25681, 25709, 25553, 25427, 25584, 25593, 25519, 25729, 26105, 26128, 25672, 25680, 25849, 25925, 25809, 25568, 25512, 25547, 25625, 25844, 25189, 25684, 25937, 26057, 25973, 25857, 25781, 25769, 25745, 25777, 25842, 25801, 25809, 25825, 25777, 25757, 25713, 25692, 25537, 25625, 25751, 25825, 25845, 25785, 25747, 25721, 25691, 25745, 25741, 25741, 25763, 25785, 25923, 25887, 25778, 25663, 25673, 25697, 25697, 25665, 25651, 25645, 25629, 25628, 25555, 25601, 25685, 25761, 25701, 25587, 25537, 25395, 25297, 25467, 25697, 25809, 25769, 25725, 25793, 25773, 25731, 25729, 25737, 25543, 25479, 25447, 25325, 25387, 25262, 25331, 25400, 25457, 25471, 25138, 25144, 25407, 25320, 25368, 25205, 25234, 25255, 25293, 25431, 25777, 25762, 25583, 25381, 25511, 25631, 25795, 25918, 25842, 25857, 25713, 25663, 25852, 26058, 26091, 25969, 25894, 25851, 25833, 25785, 25798, 25797, 25730, 25737, 25717, 25682, 25653, 25611, 25677, 25681, 25741, 25797, 25846, 25805, 25818, 25802, 25738, 25673, 25649, 25676, 25721, 25769, 25781, 25789, 25769, 25707, 25673, 25693, 25723, 25690, 25631, 25657, 25789, 25805, 25677, 25637, 25653, 25753, 25821, 25641, 25415, 25423, 25382, 25551, 25864, 25993, 26050, 26009, 26085, 26041, 25914, 25579, 25367, 25603, 25689, 25729, 25657, 25717, 25717, 25647, 25746, 25777, 25754, 25721, 25601, 25625, 25665, 25683, 25641, 25577, 25568, 25551, 25539, 25536, 25415, 25399, 25339, 25354, 25335, 25355, 25419, 25513, 25559, 25610, 25495, 25436, 25459], [25385, 25311, 25427, 25579, 25583, 25529, 25545, 25487, 25511, 25515, 25499, 25431, 25381, 25407, 25447, 25221, 25393, 25297, 25167, 24987, 25231, 25246, 25551, 25343, 25511, 25765, 25947, 25764, 25754, 25697, 25705, 25665, 25682, 25785, 25777, 25753, 25801, 25625, 25601, 25585, 25666, 25732, 25935, 25978, 25633, 25432, 25134, 25477, 25197, 25253, 25297, 25537, 25630, 25206, 25713, 26205, 26173, 25809, 25575, 25585, 25423, 25281, 25503, 25599, 25869, 25785, 25993, 25985, 26013, 26066, 25945, 25864, 25895, 25753, 25693, 25785, 25825, 25745, 25641, 25653, 25877, 25889, 25881, 25870, 25802, 25774, 25833, 25785, 25797, 25761, 25593, 25681, 25793, 25841, 25601, 25527, 25645, 25737, 25749, 25554, 25380, 25813, 26083, 25906, 26015, 25993, 25939, 25970, 26017, 25993, 25888, 25843, 25738, 25755, 25721, 25757, 25778, 25659, 25701, 25657, 25738, 25763, 25692, 25780, 25811, 25778, 25877, 25915, 25924, 25865, 25882, 25810, 25829, 25849, 25796, 25914, 25957, 25945, 25914, 25873, 25816, 25801, 25857, 25893, 25891, 25929, 25900, 25841, 25713, 25677, 25718, 25653, 25705, 25705, 25721, 25661, 25671, 25713, 25753, 25833, 25857, 25814, 25737, 25705, 25637, 25641, 25637, 25547, 25551, 25560, 25277, 25595, 25725, 25697, 25786, 25779, 25866, 25601, 25563, 25377, 25567, 25535, 25621, 25625, 25837, 25979, 25849, 25809, 25877, 25849, 25747, 25697, 25777, 25753, 25728, 25691, 25705, 25739, 25673, 25675, 25691, 25625, 25662, 25594, 25537, 25497, 25443, 25503, 25483, 25527, 25628, 25661, 25718, 25681, 25681, 25714, 25739, 25635, 25555, 25531, 25535, 25607, 25495, 25249, 25399, 25543, 25523, 25631, 25627, 25505, 25555, 25409, 25605, 25642, 25610, 25621, 25535, 25463, 25392, 25447, 25527, 25465, 25435, 25411, 25405, 25331, 25339, 25503, 25585, 25522, 25569, 25625, 25693, 25757, 25705, 25732], [25556, 25733, 25929, 25897, 25987, 26057, 26002, 25993, 25954, 25925, 25903, 25833, 25661, 25801, 25929, 25881, 25843, 25937, 25963, 25961, 25950, 25945, 25915, 25839, 25761, 25713, 25769, 25833, 25841, 25810, 25685, 25610, 25403, 25097, 25448, 25383, 25755, 25941, 25815, 25852, 25849, 25793, 25769, 25780, 25841, 25849, 25778, 25669, 25685, 25721, 25669, 25617, 25671, 25706, 25653, 25593, 25585, 25583, 25587, 25521, 25527, 25625, 25686, 25661, 25617, 25645, 25650, 25642, 25637, 25694, 25677, 25705, 25579, 25521, 25547, 25511, 25553, 25607, 25608, 25587, 25506, 25545, 25519, 25585, 25545, 25543, 25604, 25411, 25326, 25339, 25371, 25417, 25496, 25451, 25613, 25769, 25695, 25681, 25601, 25497, 25511, 25567, 25577, 25609, 25633, 25619, 25641, 25679, 25677, 25749, 25769, 25811, 25809, 25793, 25674, 25678, 25674, 25817, 25825, 25865, 25957, 25905, 25840, 25780, 25873, 25778, 25804, 25825, 25650, 25593, 25555, 25556, 25535, 25558, 25559, 25559, 25545, 25483, 25593, 25575, 25553, 25319, 25551, 25737, 25817, 25773, 25699, 25641, 25657, 25537, 25593, 25713, 25729, 25787, 25738, 25713, 25685, 25797, 25833, 25891, 25841, 25774, 25825, 25117, 25395, 25487, 25459, 25593, 25685, 25587, 25586, 25569, 25491, 25499, 25500, 25535, 25557, 25387, 25416, 25593, 25571, 25503, 25496, 25575, 25599, 25559, 25583, 25651, 25661, 25741, 25677, 25675, 25641, 25642, 25503, 25182, 25301, 25253, 25347, 25423, 25417, 25474, 25695, 26130, 26164, 26124, 26070, 26018, 25905, 25898, 25937, 25897, 25795, 25645, 25665, 25816, 25761, 25715, 25793, 25722, 25785, 25845, 25841, 25921, 25929, 25665, 25472, 25635, 25700, 25692, 25809, 25854, 25717, 25713, 25607, 25545, 25543, 25601, 25503, 25620, 25643, 25664, 25708, 25717, 25331, 25325, 25367, 25552, 25633, 25755, 25753, 25709, 25595, 25531, 25460, 25383], [25421, 25519, 25455, 25499, 25449, 25585, 25609, 25556, 25529, 25547, 25585, 25515, 25456, 25653, 25785, 25793, 25684, 25615, 25497, 25483, 25487, 25516, 25436, 25455, 25593, 25729, 25869, 25953, 26077, 26120, 25881, 25801, 25830, 25837, 25682, 25612, 25543, 25367, 25335, 25385, 25641, 25705, 25673, 25529, 25643, 25717, 25686, 25697, 25471, 25439, 25423, 25476, 25585, 25579, 25627, 25789, 25897, 25979, 25977, 25990, 25873, 25753, 25869, 25945, 25970, 26083, 25927, 25855, 25891, 25937, 25903, 25874, 25861, 25881, 25869, 25855, 25789, 25764, 25694, 25652, 25737, 25749, 25817, 25774, 25463, 25347, 25327, 25265, 25288, 25261, 25113, 25059, 25487, 25653, 25575, 25657, 25741, 25498, 25492, 25513, 25447, 25367, 25371, 25463, 25520, 25674, 25319, 25263, 25301, 25391, 25109, 25265, 25471, 25499, 25606, 25717, 25789, 25777, 25755, 25686, 25619, 25535, 25479, 25447, 25551, 25583, 25657, 25697, 25199, 25242, 25189, 25237, 25347, 25266, 25177, 25186, 25249, 25272, 25325, 25293, 25317, 25209, 25141, 25387, 25857, 26051, 26005, 25962, 25789, 25753, 25690, 25660, 25607, 25314, 25487, 25713, 25865, 25825, 25492, 25571, 25521, 25593, 25805, 25815, 25821, 25727, 25689, 25689, 25715, 25708, 25599, 25529, 25503, 25492, 25388, 25463, 25523, 25417, 25363, 25425, 25677, 25811, 25741, 25689, 25611, 25543, 25401, 25331, 25420, 25519, 25737, 25865, 25801, 25805, 25674, 25529, 25598, 25657, 25626, 25723, 25685, 25655, 25714, 25729, 25765, 25937, 26049, 25985, 25921, 25895, 25985, 26025, 25930, 25801, 25801, 25677, 25579, 25492, 25567, 25657, 25746, 25651, 25440, 25554, 25815, 25877, 25739, 25657, 25647, 25665, 25761, 25838, 25814, 25821, 25749, 25689, 25681, 25661, 25531, 25539, 25529, 25503, 25449, 25431, 25488, 25499, 24972, 25626, 26001, 26120, 26116, 25769, 25757, 25817, 25841, 25805], [25833, 25833, 25655, 25602, 25665, 25653, 25781, 25821, 25777, 25803, 25834, 25886, 25913, 25939, 26003, 25961, 25793, 25416, 25597, 25761, 25705, 25609, 25576, 25701, 25793, 25840, 25839, 25833, 25627, 25460, 25442, 25432, 25511, 25503, 25543, 25597, 25634, 25593, 25487, 25612, 25706, 25605, 25543, 25583, 25543, 25635, 25681, 25701, 25632, 25593, 25577, 25492, 25661, 25717, 25395, 25543, 25630, 25667, 25625, 25583, 25589, 25657, 25737, 25705, 25685, 25730, 25715, 25729, 25628, 25383, 25269, 25359, 25348, 25421, 25463, 25497, 25499, 25387, 25265, 25237, 25335, 25327, 25391, 25699, 25884, 25962, 25957, 25885, 25721, 25721, 25637, 25583, 25514, 25483, 25447, 25367, 25437, 25611, 25659, 25551, 25447, 25495, 25503, 25535, 25609, 25633, 25609, 25637, 25677, 25750, 25731, 25741, 25610, 25554, 25523, 25539, 25519, 25467, 25575, 25492, 25465, 25559, 25657, 25643, 25681, 25641, 25814, 25729, 25499, 25537, 25621, 25627, 25677, 25625, 25614, 25595, 25721, 25649, 25637, 25535, 25471, 25350, 25301, 25233, 25249, 25387, 25539, 25626, 25669, 25634, 25701, 25785, 25729, 25685, 25675, 25739, 25678, 25632, 25637, 25583, 25535, 25625, 25629, 25753, 25737, 25657, 25653, 25543, 25402, 25182, 25099, 25347, 25675, 25865, 25821, 25689, 25511, 25641, 25790, 25801, 25651, 25625, 25585, 25511, 25669, 25678, 25594, 25523, 25535, 25499, 25575, 25642, 25621, 25608, 25699, 25761, 25811, 25825, 25793, 25746, 25695, 25581, 25633, 25841, 25751, 25689, 25452, 25395, 25439, 25355, 25336, 25335, 25255, 25335, 25487, 25483, 25551, 25700, 25479, 25325, 25381, 25487, 25426, 25340, 25347, 25415, 25628, 25639, 25651, 25641, 25761, 25785, 25731, 25483, 25459, 25393, 25601, 25657, 25515, 25339, 25339, 25293, 25308, 25511, 25634, 25733, 25777, 25772, 25726, 25669, 25625, 25662, 25693, 25625, 25551, 25419], [25487, 25553, 25497, 25471, 25389, 25367, 25387, 25412, 25407, 25468, 25435, 25427, 25553, 25637, 25645, 25648, 25585, 25567, 25575, 25571, 25551, 25537, 25543, 25635, 25623, 25589, 25551, 25559, 25594, 25499, 25511, 25297, 25387, 25451, 25458, 25437, 25455, 25423, 25421, 25404, 25407, 25377, 25288, 25395, 25512, 25455, 25411, 25411, 25463, 25593, 25676, 25761, 25793, 25833, 25785, 25653, 25399, 25314, 25293, 25341, 25229, 25415, 25693, 25757, 25641, 25559, 25620, 25487, 25447, 25467, 25455, 25464, 25457, 25455, 25567, 25355, 25388, 25383, 25222, 25197, 25343, 25411, 25352, 25384, 25415, 25431, 25488, 25427, 25415, 25480, 25481, 25367, 25339, 25456, 25532, 25537, 25531, 25527, 25496, 25441, 25416, 25439, 25327, 25221, 25317, 25381, 25441, 25487, 25495, 25505, 25467, 25503, 25535, 25603, 25611, 25613, 25603, 25535, 25099, 25317, 25395, 25441, 25353, 25338, 25409, 25499, 25511, 25505, 25585, 25673, 25705, 25661, 25607, 25598, 25579, 25415, 25427, 25411, 25415, 25425, 25423, 25503, 25513, 25506, 25432, 25370, 25331, 25351, 25375, 25379, 25453, 25503, 25467, 25496, 25521, 25545, 25519, 25363, 25221, 25067, 25076, 25288, 25367, 25449, 25556, 25583, 25579, 25495, 25347, 25387, 25427, 25213, 25249, 25306, 25463, 25547, 25552, 25519, 25464, 25483, 25515, 25495, 25471, 25535, 25583, 25521, 25447, 25399, 25373, 25335, 25325, 25302, 25309, 25433, 25497, 25523, 25535, 25487, 25522, 25471, 25399, 25427, 25447, 25451, 25338, 25342, 25158, 25257, 25384, 25319, 25191, 25167, 25201, 25225, 25336, 25393, 25449, 25575, 25559, 25605, 25639, 25503, 25488, 25340, 25285, 25328, 25302, 25415, 25335, 25341, 25435, 25435, 25515, 25553, 25585, 25527, 25495, 25559, 25601, 25493, 25399, 25214, 25149, 25313, 25439, 25535, 25613, 25579, 25583, 25503, 25467, 25487, 25491, 25455, 25441, 25359], [25302, 25335, 25415, 25535, 25487, 25423, 25472, 25529, 25551, 25495, 25527, 25553, 25579, 25669, 25625, 25347, 25272, 25313, 25401, 25529, 25261, 25107, 25277, 25399, 25459, 25575, 25569, 25495, 25535, 25528, 25394, 24963, 25028, 25601, 25514, 25491, 25443, 25431, 25433, 25427, 25397, 25410, 25527, 25511, 25495, 25617, 25625, 25648, 25571, 25535, 25489, 25449, 25457, 25490, 25515, 25465, 25436, 25439, 25473, 25427, 25121, 25261, 25347, 25451, 25505, 25447, 25247, 25177, 25077, 25399, 25601, 25633, 25591, 25579, 25625, 25583, 25511, 25503, 25347, 25308, 25383, 25341, 25351, 25379, 25370, 25294, 25375, 25343, 25240, 25360, 25318, 25377, 25347, 25325, 25499, 25596, 25507, 25448, 25331, 25301, 25303, 25241, 25337, 25347, 25368, 25341, 25371, 25473, 25586, 25579, 25507, 25515, 25685, 25674, 25627, 25545, 25483, 25487, 25543, 25322, 25428, 25423, 25383, 25344, 25363, 25375, 25426, 25407, 25399, 25427, 25435, 25463, 25342, 25335, 25427, 25467, 25465, 25661, 25645, 25587, 25523, 25555, 25571, 25480, 25457, 25341, 25408, 25411, 25443, 25483, 25535, 25577, 25531, 25471, 25479, 25535, 25527, 25513, 25527, 25529, 25610, 25635, 25653, 25681, 25593, 25524, 25460, 25416, 25503, 25547, 25678, 25715, 25778, 25761, 25745, 25661, 25459, 25519, 25505, 25357, 25404, 25519, 25641, 25683, 25731, 25669, 25634, 25641, 25654, 25495, 25483, 25407, 25487, 25594, 25657, 25677, 25432, 25467, 25475, 25611, 25754, 25779, 25705, 25682, 25653, 25671, 25625, 25649, 25601, 25423, 25619, 25613, 25597, 25576, 25563, 25607, 25567, 25472, 25543, 25595, 25563, 25551, 25369, 25318, 25402, 25373, 25409, 25456, 25543, 25593, 25593, 25710, 25639, 25579, 25625, 25597, 25535, 25535, 25487, 25352, 25391, 25439, 25367, 25319, 25431, 25463, 25375, 25331, 25451, 25543, 25605, 25487, 25391, 25409, 25491, 25556], [25447, 25403, 25347, 25375, 25451, 25447, 25455, 25443, 25455, 25355, 25311, 25343, 25273, 25285, 25139, 25133, 25253, 25363, 25492, 25520, 25583, 25547, 25491, 25605, 25557, 25499, 25471, 25487, 25483, 25368, 25303, 25331, 25328, 25335, 25330, 25337, 25348, 25399, 25387, 25309, 25351, 25396, 25420, 25370, 25261, 25352, 25347, 25043, 25277, 25547, 25729, 25761, 25665, 25661, 25634, 25627, 25673, 25613, 25567, 25605, 25531, 25493, 25464, 25511, 25505, 25515, 25457, 25419, 25505, 25621, 25684, 25811, 25754, 25643, 25483, 25313, 25215, 25311, 25594, 25627, 25614, 25503, 25577, 25617, 25575, 25503, 25519, 25627, 25537, 25442, 25475, 25479, 25471, 25391, 25367, 25495, 25579, 25585, 25503, 25455, 25463, 25519, 25536, 25535, 25543, 25527, 25527, 25529, 25586, 25580, 25355, 25374, 25455, 25479, 25351, 25293, 25338, 25527, 25660, 25583, 25661, 25605, 25663, 25637, 25615, 25471, 25368, 25392, 25585, 25441, 25463, 25459, 25499, 25336, 25468, 25551, 25586, 25557, 25531, 25471, 25543, 25511, 25503, 25408, 25201, 25399, 25405, 25379, 25336, 25394, 25423, 25511, 25305, 25218, 25193, 25355, 25203, 25129, 25359, 25258, 25181, 25411, 25499, 25457, 25431, 25528, 25633, 25654, 25515, 25377, 25408, 25419, 25347, 25391, 25411, 25391, 25351, 25339, 25395, 25372, 25395, 25503, 25493, 25495, 25456, 25451, 25431, 25439, 25431, 25439, 25391, 25367, 25386, 25440, 25399, 25455, 25451, 25423, 25447, 25409, 25349, 25447, 25409, 25367, 25293, 25419, 25505, 25431, 25496, 25586, 25613, 25657, 25646, 25583, 25571, 25551, 25487, 25427, 25391, 25331, 25391, 25419, 25386, 25343, 25321, 25352, 25397, 25449, 25359, 25399, 25209, 25229, 25249, 25383, 25301, 25269, 25269, 25310, 25391, 25302, 25335, 25376, 25423, 25081, 25165, 25205, 25254, 25055, 25134, 24995, 25185, 25253, 25258, 25277, 25383, 25401], [25335, 25278, 25297, 25286, 25272, 25221, 25186, 25237, 25375, 25610, 25661, 25730, 25673, 25487, 25496, 25527, 25423, 25039, 25399, 25609, 25536, 25643, 25547, 25242, 25459, 25543, 25455, 25439, 25367, 25428, 25391, 25407, 25457, 25234, 25352, 25380, 25391, 25335, 25348, 25409, 25354, 25343, 25375, 25357, 25305, 25190, 25335, 25269, 25328, 25189, 25277, 25299, 25269, 25313, 25261, 25249, 25176, 25085, 25205, 25149, 25237, 25209, 25183, 25217, 25190, 25173, 25173, 25141, 25253, 25265, 25301, 25471, 25395, 25197, 25381, 25670, 25693, 25527, 25351, 25301, 25357, 25387, 25309, 25261, 25241, 25161, 25235, 25359, 25487, 25491, 25354, 25197, 25363, 25463, 25457, 25011, 25085, 25075, 25119, 25233, 25343, 25637, 25593, 25391, 25399, 25351, 25359, 25413, 25423, 25373, 25221, 25475, 25249, 25068, 25329, 25189, 24911, 25071, 25149, 25209, 25345, 25451, 25417, 25160, 25019, 25102, 25331, 25221, 25004, 25272, 25408, 25269, 25117, 25109, 25126, 25216, 25347, 25371, 25391, 25110, 25067, 25012, 25221, 25245, 25133, 25213, 25181, 25153, 25136, 25124, 24947, 25123, 25082, 24842, 24998, 25047, 25075, 25091, 25110, 25159, 25107, 24944, 24827, 24747, 25068, 25078, 25255, 25090, 25097, 25109, 25043, 25194, 25383, 25409, 25387, 25375, 25307, 25237, 25247, 25282, 25215, 25213, 25230, 25165, 25193, 25225, 25067, 25199, 25119, 25395, 25589, 25335, 25481, 25567, 25537, 25240, 25261, 25169, 25177, 24955, 25061, 25067, 24987, 25091, 25253, 25273, 25254, 25230, 25173, 25093, 25059, 25197, 25107, 25068, 25117, 24971, 24983, 25141, 25229, 25331, 25197, 25169, 25205, 25168, 25178, 25167, 24846, 24891, 24947, 25003, 25011, 25015, 25046, 24963, 24827, 24843, 25085, 25039, 24996, 25113, 25317, 25233, 25154, 25185, 25043, 25225, 25310, 25511, 25556, 25503, 25471, 25507, 25371, 25286, 25297, 25335], [25285, 25287, 25456, 25467, 25281, 25257, 25261, 25336, 25465, 25531, 25165, 25295, 25423, 25277, 25123, 24859, 24939, 25335, 25481, 25413, 25326, 25305, 24859, 24773, 25270, 25630, 25805, 25537, 25480, 25381, 25161, 25345, 25431, 25027, 25005, 24864, 24947, 25194, 25596, 25626, 25487, 25367, 25455, 25317, 25463, 25221, 25027, 25247, 25325, 25271, 25449, 25105, 24867, 25271, 25176, 25317, 25560, 25607, 25610, 25674, 25475, 25495, 25286, 25425, 25658, 25528, 25392, 25347, 24956, 25285, 25170, 25023, 25349, 25665, 25697, 25602, 25583, 25585, 25445, 25085, 25059, 24982, 25060, 25173, 24939, 24635, 25081, 25609, 25906, 25779, 25578, 25504, 25363, 25512, 25551, 25277, 25175, 25145, 25273, 25367, 25071, 25197, 25335, 25290, 25400, 25407, 25261, 25255, 25278, 25383, 25371, 25369, 25337, 25467, 25435, 25325, 25321, 25415, 25239, 25121, 25371, 25392, 24983, 25182, 25278, 25177, 25198, 25363, 25415, 25439, 25301, 25131, 25238, 25199, 25229, 25381, 25370, 25347, 25415, 25325, 25191, 25167, 25253, 25261, 25265, 25254, 25297, 25305, 25325, 25363, 25419, 25431, 25415, 25416, 25375, 25325, 25325, 25241, 25335, 25359, 25347, 25279, 25272, 25155, 25193, 25384, 25191, 25123, 25107, 25387, 25384, 25331, 25471, 25389, 25293, 25205, 24819, 24534, 25103, 25607, 25725, 25617, 25531, 25579, 25575, 25495, 25359, 25327, 25245, 25301, 25269, 25253, 25355, 25415, 25401, 25277, 25264, 25326, 25325, 25313, 25353, 25383, 25375, 25347, 25351, 25335, 25335, 25379, 25367, 25337, 25059, 25130, 25181, 25090, 24829, 24941, 25317, 25511, 25341, 25289, 25269, 25293, 25149, 24979, 24836, 25104, 25351, 25471, 25261, 25177, 25125, 25131, 25003, 25019, 25165, 25185, 25091, 25062, 25191, 25392, 25224, 25213, 25285, 25335, 25199, 25129, 25053, 25044, 25253, 25269, 25261, 25127, 25030, 25117, 24799, 24904], [24859, 25182, 25351, 25615, 25567, 25609, 25455, 25431, 25543, 25593, 25544, 25495, 25403, 25359, 25395, 25265, 25186, 24991, 25027, 25221, 25264, 25331, 25469, 25673, 25719, 25587, 25432, 25427, 25367, 24907, 25205, 25339, 25416, 25543, 25537, 25524, 25153, 25277, 25449, 25496, 25602, 25609, 25561, 25363, 25221, 25286, 25455, 25493, 25443, 25375, 25367, 25412, 25503, 25383, 25379, 25118, 25217, 25370, 25347, 25090, 25075, 25281, 25223, 25307, 25469, 25602, 25567, 25456, 25482, 25447, 25321, 25313, 25195, 25117, 25104, 25277, 25415, 25388, 25451, 25443, 25403, 25465, 25424, 25457, 25551, 25585, 25448, 25455, 25451, 25479, 25519, 25492, 25481, 25399, 25367, 25401, 25385, 25229, 25313, 25385, 25310, 25294, 25149, 25102, 24963, 25011, 25153, 25135, 25177, 25293, 25199, 25145, 25261, 25369, 25270, 25165, 25035, 24985, 24949, 24931, 25011, 25031, 25055, 24965, 24927, 25031, 25061, 25097, 25101, 25165, 25199, 25269, 25321, 25373, 25335, 25266, 25247, 25285, 25086, 25183, 25184, 25138, 25169, 25129, 25093, 25097, 25070, 25158, 25091, 25157, 25181, 25335, 25351, 25536, 25637, 25737, 25575, 25087, 24910, 25105, 24925, 24987, 24701, 24895, 25024, 25264, 25479, 25487, 24945, 25229, 25440, 25093, 25105, 25166, 25158, 25253, 24910, 24827, 24651, 25081, 25231, 25579, 25755, 25554, 25495, 25343, 25157, 25069, 25085, 25088, 25040, 25015, 25019, 24715, 24751, 24747, 24893, 24908, 24819, 25179, 25659, 25798, 25658, 25487, 25383, 25435, 25411, 25415, 25399, 25432, 25384, 25171, 25181, 25327, 25285, 25048, 25097, 25167, 25160, 25078, 24975, 24963, 24939, 24819, 24773, 25053, 25182, 25331, 25335, 25317, 25301, 25027, 25117, 25081, 25068, 25229, 25207, 25221, 25503, 25663, 25729, 25837, 25701, 25205, 25503, 25625, 25794, 25845, 25695, 25661, 25596, 25339, 25325, 25371, 25359, 25241], [24965, 25068, 25045, 25075, 25078, 25135, 25341, 25261, 25447, 25595, 25237, 25229, 25094, 25133, 25093, 25154, 25433, 25309, 25069, 25183, 25233, 25351, 25536, 25609, 25676, 25894, 25854, 25601, 25737, 25821, 25751, 25677, 25657, 25579, 25543, 25401, 25379, 25343, 25407, 25439, 25537, 25617, 25543, 25124, 25221, 25631, 25693, 25499, 25288, 25408, 25367, 25357, 25407, 25339, 25347, 25279, 25169, 25329, 25431, 25379, 25385, 25344, 25301, 25317, 25254, 25181, 25181, 25225, 25257, 25153, 25098, 25118, 25161, 25190, 25167, 25209, 25285, 25141, 25059, 25136, 25102, 25171, 25253, 25293, 25245, 25133, 25119, 25077, 25011, 25071, 25249, 25274, 25335, 25277, 25343, 25343, 25317, 25262, 25277, 25261, 25278, 25093, 25197, 25321, 25384, 25415, 25007, 25213, 25279, 25301, 25109, 25301, 25423, 25450, 25442, 25457, 25415, 25369, 25341, 25383, 25343, 25402, 25335, 25367, 25361, 25285, 25271, 25177, 25246, 25246, 25293, 25339, 25389, 25455, 25497, 25479, 25309, 25085, 25210, 25427, 25310, 25343, 25369, 25357, 25351, 25335, 25282, 25327, 25289, 25249, 24859, 25185, 25327, 25433, 25426, 25456, 25547, 25567, 25435, 25344, 25410, 25342, 25400, 25353, 25305, 25174, 25258, 25310, 25301, 25245, 25293, 25331, 25317, 25257, 25086, 25104, 25253, 25320, 25367, 25345, 25176, 25206, 25293, 25457, 25373, 25422, 25343, 25463, 25559, 25594, 25556, 25419, 25367, 25359, 25335, 25282, 25125, 25157, 25197, 25293, 25416, 25511, 25567, 25555, 25483, 25354, 25297, 25250, 25245, 25326, 25327, 25337, 25351, 25310, 25270, 25207, 24984, 24957, 24991, 25020, 24987, 24979, 24981, 25003, 25039, 25027, 25003, 25055, 25075, 25118, 25081, 25104, 25375, 25593, 25479, 25363, 25261, 25317, 25305, 25325, 25272, 25250, 25290, 25213, 25133, 25137, 25132, 25075, 25075, 25153, 25153, 25210, 25387, 25512, 25560, 25593], [25583, 25463, 25285, 25121, 25285, 25352, 25346, 25435, 25503, 25537, 25585, 25559, 25491, 25505, 25479, 25439, 25375, 25189, 25237, 25201, 25130, 25019, 25011, 25129, 25249, 25363, 25385, 25447, 25409, 25399, 25371, 25328, 25313, 25157, 24979, 24949, 25100, 25201, 25237, 25327, 25347, 25337, 25245, 25075, 25035, 25077, 25149, 25165, 25242, 25307, 25257, 25192, 25189, 25241, 25193, 25182, 25085, 24964, 25003, 25039, 25085, 25135, 25189, 24955, 24827, 24893, 24965, 24956, 25019, 24983, 24711, 24668, 24787, 24979, 25100, 25031, 24806, 24514, 24572, 24767, 25024, 25375, 25537, 25505, 25511, 25539, 25595, 25387, 25435, 25553, 25571, 25621, 25551, 25475, 25354, 25467, 25583, 25579, 25505, 25336, 25317, 25313, 25301, 25305, 25293, 25277, 25405, 25459, 25407, 25380, 25443, 25338, 25269, 25143, 25077, 25317, 25416, 25555, 25658, 25613, 25537, 25451, 25489, 25472, 25463, 25503, 25367, 25349, 25317, 25213, 25286, 25290, 25273, 25327, 25407, 25439, 25349, 25349, 25375, 25386, 25391, 25423, 25361, 25326, 25353, 25343, 25336, 25317, 25374, 25303, 25367, 25325, 25343, 25391, 25425, 25471, 25451, 25467, 25527, 25471, 25435, 25479, 25520, 25545, 25547, 25463, 25394, 25400, 25407, 25389, 25392, 25037, 24907, 24821, 24939, 24891, 24891, 25343, 25599, 25455, 25357, 25309, 25269, 25233, 25257, 25309, 25340, 25327, 25230, 25167, 25167, 25117, 25143, 25273, 25359, 25467, 25492, 25459, 25389, 25387, 25419, 25374, 25327, 25367, 25359, 25391, 25374, 25343, 25338, 25266, 25265, 25271, 25199, 24996, 24960, 25061, 25005, 24999, 25146, 25245, 25167, 25149, 25105, 25076, 25071, 25077, 25121, 25174, 25199, 25225, 25240, 25242, 25160, 25051, 24987, 25016, 24951, 24939, 24935, 24894, 24979, 25085, 25142, 25193, 25194, 25273, 25281, 25269, 25202, 25243, 25335, 25415, 25481, 25368, 25429, 25480], [25335, 25245, 24963, 24915, 25035, 25230, 25271, 25347, 25456, 25491, 25423, 25245, 25043, 25125, 25053, 24967, 25123, 25223, 25231, 25153, 25071, 25007, 24931, 24859, 24835, 24939, 24923, 24981, 25261, 25497, 25531, 25261, 25223, 25304, 25151, 25035, 25003, 25031, 25037, 25048, 25085, 25023, 25045, 25154, 25165, 25221, 25255, 25305, 25319, 25263, 25131, 25113, 25261, 25173, 25099, 25141, 24931, 24995, 24979, 25061, 25297, 25499, 25555, 25439, 25404, 25311, 25301, 25239, 25182, 25215, 25137, 25101, 25149, 25201, 25269, 25285, 25245, 25145, 25097, 25097, 25110, 25181, 25169, 25118, 25091, 25045, 24964, 24935, 24963, 24987, 24927, 24935, 24872, 24895, 25061, 25075, 25093, 25091, 25067, 24975, 24893, 24931, 25117, 25173, 24905, 24639, 24378, 24220, 24118, 24398, 24763, 25363, 25809, 25499, 25455, 25439, 25419, 25370, 25372, 25351, 25347, 25347, 25375, 25285, 25171, 25198, 25238, 25250, 25287, 25225, 25205, 25207, 25287, 25269, 25141, 25253, 25101, 25147, 25297, 25451, 25455, 25207, 25269, 25305, 25288, 25375, 25439, 25431, 25361, 25329, 25272, 25307, 25293, 25192, 25239, 25281, 25141, 25044, 25255, 25138, 25098, 25129, 25273, 25367, 25359, 25274, 25237, 25155, 25051, 25059, 25081, 25003, 25029, 25237, 25352, 25455, 25495, 25371, 25379, 25505, 25575, 25287, 25229, 25343, 25392, 25471, 25443, 25249, 25197, 25285, 25289, 25351, 25301, 25165, 25023, 24987, 25043, 25281, 25416, 25455, 25400, 25455, 25506, 25491, 25447, 25189, 25110, 25137, 25152, 25115, 25166, 25202, 25166, 25217, 25301, 25285, 25325, 25325, 25233, 25326, 25415, 25370, 25353, 25397, 25329, 25367, 25341, 25367, 25427, 25391, 25335, 25311, 25317, 25253, 25285, 25303, 25270, 25301, 25293, 25269, 25181, 25224, 25289, 25328, 25327, 25327, 25379, 25407, 25399, 25351, 25348, 25329, 25253, 25303, 25335, 25237], [25253, 25325, 25335, 25335, 25269, 25191, 25121, 25222, 25303, 25311, 25404, 25401, 25351, 25261, 25317, 25306, 25301, 25317, 25279, 25317, 25239, 25281, 25320, 25287, 25221, 25231, 25277, 25293, 25205, 25262, 25325, 25293, 25285, 25269, 25221, 25237, 25277, 25265, 25255, 25189, 25175, 25257, 25221, 25181, 25181, 25099, 25093, 25059, 25067, 25109, 25155, 25069, 25161, 25237, 25166, 25097, 25060, 25059, 25117, 25119, 25081, 25090, 25086, 24983, 24991, 25012, 24995, 25019, 24925, 25030, 25149, 25086, 25079, 25085, 25023, 25029, 25101, 25133, 25121, 25102, 25078, 25005, 24967, 24947, 24905, 24997, 25055, 25028, 25078, 25085, 25071, 25078, 25093, 25182, 25099, 24771, 24871, 24876, 24841, 24915, 24919, 24995, 24897, 24847, 24873, 24971, 25005, 24965, 24963, 24981, 24995, 25059, 25047, 25125, 25230, 25171, 25109, 25069, 25043, 25085, 24958, 25059, 25059, 25028, 24940, 24891, 24787, 24791, 24847, 24819, 24731, 24751, 24827, 24897, 24971, 25019, 25155, 25134, 25189, 25199, 25125, 25085, 25047, 25014, 24995, 24939, 24884, 24963, 24995, 25003, 24915, 24871, 24842, 24875, 24907, 24871, 24895, 24924, 24955, 24871, 24907, 24924, 24899, 24887, 24959, 25011, 25007, 24999, 24949, 24903, 24919, 24923, 24884, 24855, 24851, 24927, 24999, 24967, 24937, 24965, 25091, 25242, 25151, 25087, 25061, 25062, 25207, 25221, 24991, 24860, 25012, 25119, 25048, 24873, 24798, 24828, 24873, 24923, 25075, 25119, 25261, 25294, 25253, 25217, 25271, 25339, 25407, 25343, 25344, 25282, 25213, 25137, 24931, 24915, 24931, 24973, 24865, 25098, 25269, 25317, 25351, 25265, 25181, 25154, 25163, 25019, 25031, 25135, 25094, 25077, 25067, 24981, 25047, 25081, 25085, 25141, 25153, 25217, 25209, 25269, 25139, 25007, 24995, 25104, 25071, 25124, 25169, 25257, 25167, 24852, 24900, 24949, 24875, 24755, 24779, 24884], [24823, 24915, 24879, 24715, 24676, 24779, 24880, 24847, 24987, 25037, 25085, 25175, 25213, 25265, 25265, 25221, 25157, 25091, 25019, 25085, 25053, 25003, 24939, 24860, 24763, 24796, 24939, 24943, 24921, 24839, 24827, 24843, 24895, 24839, 24771, 24739, 24733, 24659, 24560, 24567, 24494, 24526, 24660, 24859, 25007, 25055, 25150, 25219, 25269, 25145, 25067, 25075, 25060, 24976, 24775, 24703, 24815, 24883, 24948, 25067, 25169, 25121, 25021, 24895, 24841, 24947, 25043, 25045, 25003, 24779, 24363, 24827, 25249, 25233, 25066, 25055, 25138, 25077, 25029, 24951, 24863, 24926, 24979, 24871, 24895, 24789, 24823, 24923, 25023, 24957, 24995, 24929, 24933, 25005, 25093, 25125, 25293, 25326, 25197, 25270, 25343, 25305, 25214, 25120, 25059, 24871, 24755, 24859, 25011, 25118, 25077, 25092, 24939, 24867, 24803, 24819, 24924, 24981, 25039, 25067, 25007, 25011, 25059, 24979, 25082, 25029, 25011, 25051, 24981, 25011, 25101, 25221, 25241, 25263, 25222, 25183, 25073, 25043, 24973, 24995, 24959, 24949, 25071, 25175, 25165, 25059, 25089, 24891, 24819, 24700, 24827, 24984, 25112, 24963, 24965, 24871, 24675, 24663, 24735, 24737, 24711, 24623, 24699, 24749, 24772, 24629, 24699, 24839, 24649, 24733, 24819, 24707, 24751, 24843, 24876, 25076, 25141, 25145, 25089, 24892, 24936, 24856, 24899, 24867, 24815, 24763, 24747, 24932, 24979, 24877, 24813, 24813, 24747, 24755, 24679, 24652, 24691, 24628, 24691, 24779, 24820, 24913, 24871, 24791, 24735, 24853, 24846, 24895, 24877, 24831, 24820, 24891, 24755, 24659, 24567, 24370, 24765, 24943, 25067, 24976, 24725, 24675, 24499, 24659, 24835, 24903, 24919, 25003, 24867, 24853, 24934, 24944, 24851, 24871, 24843, 24877, 24915, 24863, 24813, 24923, 24957, 24992, 24959, 24822, 24899, 24987, 24957, 24899, 24877, 24939, 24973, 24995, 24995, 24987, 25035, 25011], [24979, 24971, 24943, 24895, 24864, 24863, 24847, 24860, 24887, 24860, 24827, 24846, 24815, 24792, 24729, 24723, 24767, 24741, 24779, 24733, 24667, 24607, 24651, 24731, 24665, 24735, 24829, 24783, 24755, 24707, 24683, 24663, 24683, 24731, 24819, 24895, 25090, 25161, 25161, 25081, 24975, 24879, 24891, 24963, 25077, 25130, 25160, 25011, 24931, 24804, 24863, 24883, 24939, 25035, 25061, 25067, 25081, 25092, 25035, 24971, 24923, 24827, 24451, 24484, 24691, 24896, 24893, 24901, 24975, 25060, 24739, 24599, 24482, 24691, 24607, 24468, 24561, 24442, 24522, 24504, 24540, 24679, 24859, 24748, 24813, 24651, 24735, 24728, 24701, 24685, 24679, 24797, 24815, 24739, 24676, 24675, 24687, 24580, 24563, 24595, 24729, 24895, 25003, 25059, 25136, 25111, 25105, 24958, 25067, 25081, 24963, 24979, 24959, 24803, 24773, 24731, 24717, 24735, 24893, 25016, 25031, 25068, 25059, 25098, 25003, 25043, 24968, 24859, 24872, 24913, 25051, 25117, 25063, 25055, 24995, 24989, 25013, 24955, 24893, 24751, 24699, 24675, 24647, 24460, 24474, 24627, 24571, 24761, 24887, 24899, 24813, 24715, 24591, 24595, 24643, 24466, 24522, 24510, 24603, 24700, 24619, 24705, 24763, 24619, 24799, 25077, 25271, 25277, 25213, 24965, 24895, 24897, 24990, 25067, 25060, 25047, 24979, 24991, 24891, 24867, 24757, 24732, 24827, 24883, 24895, 24869, 24803, 24767, 24739, 24736, 24695, 24792, 24731, 24603, 24641, 24663, 24414, 24399, 24434, 24331, 24360, 24466, 24556, 24605, 24516, 24561, 24599, 24686, 24948, 25093, 24919, 24530, 24423, 24540, 24563, 24584, 24587, 24677, 24787, 24806, 24879, 24847, 24532, 24374, 24438, 24426, 24372, 24596, 24727, 24728, 24755, 24759, 24823, 24859, 24923, 24907, 24813, 24629, 24655, 24669, 24708, 24719, 24580, 24356, 24218, 24122, 24306, 24571, 24709, 24933, 25190, 25234, 25325, 25294, 25213, 25067], [24859, 24801, 24783, 24290, 24604, 24671, 24591, 24651, 24803, 25067, 25226, 25129, 25013, 24834, 24780, 24813, 24830, 24893, 24979, 25051, 25003, 24899, 24849, 24587, 24571, 24641, 24873, 24991, 25109, 25217, 25027, 25149, 25075, 24827, 24370, 24398, 24472, 24434, 24420, 24306, 24139, 24466, 24627, 24749, 24751, 24560, 24315, 24239, 24627, 24965, 25139, 25355, 25395, 25230, 25269, 25189, 24995, 24812, 24715, 24907, 25093, 25141, 25086, 25036, 24989, 24923, 24873, 24907, 24905, 24710, 25021, 25048, 24964, 25031, 24947, 25045, 24980, 24919, 24967, 24999, 25012, 24989, 24947, 24820, 24460, 24589, 24739, 24883, 24728, 24507, 24410, 24382, 24619, 24947, 25230, 25305, 25246, 25124, 25067, 25035, 24931, 24804, 24609, 24739, 24839, 24819, 24818, 24871, 24919, 24997, 24895, 24886, 24631, 24684, 24805, 24835, 24804, 24691, 24723, 24678, 24563, 24603, 24731, 24763, 24783, 24795, 24615, 24442, 24654, 24573, 24583, 24563, 24667, 24695, 24579, 24452, 24487, 24499, 24454, 24458, 24499, 24392, 24514, 24619, 24715, 24907, 24887, 24899, 24813, 24491, 24395, 24498, 24639, 24711, 24587, 24506, 24554, 24494, 24506, 24486, 24484, 24426, 24332, 24434, 24560, 24591, 24593, 24470, 24530, 24589, 24591, 24615, 24625, 24691, 24803, 24731, 24781, 24755, 24403, 24560, 24611, 24430, 24518, 24715, 24955, 25130, 25288, 24675, 24298, 24426, 24282, 24343, 24370, 24390, 24337, 24567, 24955, 25258, 25202, 24530, 24862, 25263, 25387, 25093, 24853, 24868, 24902, 24925, 25117, 25269, 25109, 24908, 24971, 24732, 24667, 24723, 24859, 24981, 24975, 24739, 24667, 24787, 24803, 24763, 24783, 24659, 24651, 24749, 24579, 24498, 24712, 24731, 24683, 24813, 24912, 24885, 24819, 24835, 24728, 24723, 24995, 25077, 24894, 24859, 24908, 24915, 25081, 25044, 25035, 24979, 24883, 24491, 24334, 24298, 23863, 24198], [24604, 25111, 25407, 25873, 25277, 25253, 25113, 25035, 24971, 24952, 25202, 25375, 25407, 25399, 25223, 25149, 25061, 25008, 24883, 24997, 25015, 24935, 25019, 25007, 25027, 24887, 24939, 24967, 24763, 24975, 25129, 24711, 24703, 24859, 24843, 24799, 24756, 24971, 24735, 25027, 24876, 24843, 24676, 24560, 24907, 25035, 25063, 25029, 24901, 24926, 24819, 24916, 25215, 25278, 25197, 24883, 25055, 25061, 24827, 24612, 24747, 24895, 24599, 24659, 24891, 25047, 25045, 25250, 25142, 25087, 25059, 25076, 24959, 24904, 24835, 24531, 24360, 24755, 25157, 25209, 25165, 25178, 25121, 25043, 24942, 24907, 24983, 25055, 25067, 24974, 24903, 24875, 24779, 24579, 23766, 23883, 24725, 25551, 25641, 25481, 25331, 25293, 25293, 25225, 25153, 25256, 25217, 25201, 25129, 25075, 25133, 25171, 25126, 25169, 25129, 25165, 25097, 25195, 25230, 25245, 25162, 25051, 25110, 25043, 24955, 24995, 25085, 25031, 24896, 24872, 24891, 24924, 24963, 25011, 24987, 24992, 25021, 25003, 24839, 24889, 24935, 24831, 24913, 24703, 24767, 24907, 25134, 25225, 25239, 25094, 24987, 24935, 25067, 24933, 25015, 25023, 25019, 24955, 24771, 24687, 24611, 24651, 24763, 24739, 24752, 24859, 24679, 24604, 24684, 24675, 24679, 24792, 24907, 25075, 25047, 25013, 25019, 25101, 25019, 25105, 25113, 24763, 24635, 24588, 24552, 24621, 24787, 24891, 24897, 24871, 24827, 24851, 24979, 25028, 25011, 24989, 24767, 24683, 24571, 24693, 24787, 24792, 24771, 24803, 24795, 24820, 24819, 24805, 24526, 24341, 24506, 24306, 24327, 24454, 24557, 25081, 24983, 25193, 25345, 25396, 25051, 25011, 25007, 24984, 24905, 25039, 25149, 25075, 25071, 24995, 24925, 24979, 24963, 24931, 24934, 24864, 24779, 24871, 24827, 24748, 24506, 24576, 24684, 24773, 24819, 24667, 24486, 24518, 24623, 24688, 24595, 24661, 24639, 24656, 24678, 24687], [24707, 24750, 24739, 24799, 24763, 24979, 24853, 24911, 24963, 24887, 24923, 24963, 25011, 25173, 25190, 25068, 24925, 24767, 24805, 24821, 24727, 24659, 24683, 24743, 24605, 24082, 24223, 24494, 24996, 25285, 25075, 25059, 25039, 24799, 25063, 25197, 25115, 24975, 25153, 25209, 25085, 25020, 25063, 25019, 24979, 24892, 24899, 24836, 24623, 24748, 24767, 24596, 24615, 24614, 24739, 24794, 24743, 24667, 24478, 24498, 24619, 24611, 24684, 24604, 24364, 24438, 24636, 24828, 24675, 24575, 24452, 24514, 24511, 24452, 24395, 24373, 24314, 24482, 24596, 24422, 24635, 24443, 24508, 24619, 24556, 24578, 24631, 24643, 24780, 24827, 24796, 24799, 24751, 24700, 24775, 24907, 24815, 24731, 24631, 24624, 24542, 24812, 24912, 24839, 24763, 24747, 24779, 24577, 24625, 24842, 24789, 24811, 24971, 25087, 24899, 24759, 24667, 24687, 24829, 24799, 24791, 24805, 24831, 24807, 24812, 24779, 24747, 24639, 24755, 24787, 24797, 24811, 24859, 24741, 24394, 24178, 24286, 24518, 24731, 24971, 24991, 25008, 25013, 24995, 24827, 24563, 24623, 24728, 24723, 24918, 24944, 24844, 24843, 24828, 24839, 24756, 24675, 24583, 24747, 24819, 24760, 24787, 24691, 24532, 24532, 24514, 24378, 24230, 24266, 24216, 24211, 24244, 24466, 24702, 25063, 24995, 24911, 24739, 24659, 24779, 24647, 24707, 24725, 24763, 24817, 24787, 24767, 24787, 24907, 24943, 24979, 24892, 24609, 24625, 24675, 24687, 24621, 24643, 24590, 24575, 24719, 24783, 24860, 24867, 24847, 24851, 24877, 24873, 24846, 24643, 24636, 24618, 24612, 24394, 23983, 24395, 24462, 25019, 25222, 24924, 24875, 24653, 24759, 24647, 24702, 24763, 24797, 24835, 24815, 24764, 24763, 24703, 24739, 24763, 24783, 24691, 24672, 24647, 24641, 24595, 24560, 24629, 24731, 24763, 24755, 24795, 24684, 24631, 24611, 24603, 24534, 24535, 24532, 24510, 24559, 24579], [24655, 24683, 24534, 24587, 24522, 24290, 24372, 24668, 24907, 24880, 24619, 24484, 24226, 24323, 24552, 24484, 24560, 24603, 24691, 24573, 24553, 24534, 24414, 24250, 24270, 24346, 24390, 24560, 24639, 24554, 24415, 24338, 24326, 24278, 24308, 24293, 24386, 24524, 24711, 24659, 24495, 24412, 24561, 24649, 24707, 24562, 24418, 24458, 24278, 24428, 24704, 24899, 24671, 24695, 24584, 24527, 24467, 24660, 24724, 24573, 24608, 24620, 24394, 23871, 23959, 24647, 25230, 25085, 24821, 24659, 24861, 25118, 25075, 24895, 24807, 24747, 24676, 24707, 24715, 24522, 24490, 24415, 24355, 24058, 24243, 24467, 24717, 24819, 25133, 24885, 25113, 24841, 24877, 24787, 24835, 24791, 24767, 24851, 24795, 24643, 24588, 24625, 24530, 24535, 24515, 24486, 24244, 24163, 24238, 24258, 24395, 24556, 24819, 24972, 24907, 24891, 24756, 24717, 24757, 24702, 24572, 24434, 24607, 24707, 24783, 24723, 24724, 24748, 24691, 24715, 24615, 24616, 24691, 24771, 24875, 24881, 24710, 24579, 24580, 24589, 24593, 24668, 24707, 24829, 24639, 24396, 24567, 24627, 24494, 24552, 24274, 24348, 24490, 24648, 24741, 24811, 24739, 24755, 24728, 24715, 24571, 24258, 24410, 24596, 24647, 24704, 24628, 24815, 24867, 24711, 24735, 24748, 24947, 25045, 25023, 25089, 25029, 24765, 24835, 24741, 24486, 24387, 24291, 23686, 24360, 24996, 25203, 24823, 24895, 24759, 24844, 24695, 24728, 25141, 24963, 24943, 24735, 24388, 24653, 24711, 25158, 25117, 24875, 24849, 24755, 24771, 24851, 24795, 24720, 24703, 24639, 24709, 24827, 24795, 24771, 24792, 24686, 24675, 24741, 24739, 24661, 24526, 24450, 24613, 24567, 24542, 24514, 24648, 24600, 24691, 24338, 24518, 24771, 24853, 24879, 24895, 24781, 24683, 24494, 24595, 24583, 24667, 24655, 24683, 24672, 24226, 24490, 24580, 24715, 24668, 24460, 24516, 24546, 24458, 24434, 24218], [24823, 24915, 24651, 24693, 24368, 24482, 24574, 24571, 24566, 24628, 24723, 24915, 24957, 24919, 24346, 24310, 24394, 24430, 24476, 24567, 24615, 24427, 24394, 24504, 24623, 24779, 24944, 24903, 24847, 24787, 24739, 24679, 24631, 24571, 24560, 24498, 24546, 24663, 24968, 25201, 25023, 24819, 24731, 24739, 24771, 24691, 24707, 24615, 24677, 24787, 24747, 24700, 24897, 24619, 24653, 24832, 24902, 24876, 24863, 24839, 24723, 24629, 24704, 24817, 24663, 24579, 24575, 24442, 24266, 24458, 24410, 24422, 24490, 24381, 24587, 24771, 24787, 24871, 24715, 24561, 24483, 24563, 24655, 24625, 24498, 24508, 24619, 24474, 24352, 24380, 24290, 24458, 24267, 24218, 24325, 24534, 24556, 24466, 24486, 24479, 24522, 24477, 24394, 24364, 24434, 24615, 24526, 24497, 24530, 24719, 24779, 24803, 24729, 24685, 24655, 24635, 24663, 24576, 24422, 24470, 24663, 24725, 24683, 24594, 24540, 24659, 24639, 24621, 24383, 24340, 24459, 24724, 24775, 24594, 24531, 24592, 24663, 24606, 24589, 24560, 24615, 24546, 24803, 24771, 24724, 24747, 24707, 24760, 24675, 24627, 24643, 24727, 24800, 24791, 24789, 24787, 24748, 24686, 24500, 24302, 24328, 24347, 24392, 24210, 24282, 24398, 24466, 24643, 24587, 24522, 24510, 24507, 24500, 24397, 24242, 24394, 24295, 24306, 24218, 24331, 24315, 24378, 24490, 24531, 24470, 24593, 24546, 24623, 24699, 24759, 24707, 24667, 24803, 24829, 24915, 24871, 24763, 24691, 24739, 24819, 24831, 24789, 24749, 24718, 24671, 24691, 24691, 24707, 24667, 24604, 24467, 24498, 24509, 24553, 24618, 24639, 24560, 24585, 24695, 24683, 24611, 24625, 24648, 24668, 24571, 24583, 24649, 24763, 24779, 24773, 24667, 24865, 25087, 25106, 25133, 24868, 24619, 24787, 24829, 24739, 24635, 24595, 24290, 24294, 24500, 24506, 24468, 24450, 24506, 24575, 24639, 24518, 24747, 24815, 24847, 24577], [24820, 24907, 24651, 24595, 24579, 24643, 24530, 24487, 24458, 24420, 24404, 24434, 24390, 24266, 24330, 24631, 24725, 24819, 24851, 24806, 24749, 24676, 24583, 24275, 24571, 24683, 24655, 24310, 24635, 24787, 24815, 24747, 24720, 24739, 24695, 24636, 24791, 24915, 24526, 24795, 24931, 25028, 24963, 24915, 24827, 24727, 24707, 24748, 24755, 24651, 24687, 24532, 24158, 24202, 24538, 24667, 24335, 24223, 24266, 24462, 24667, 24615, 24727, 24827, 24819, 24732, 24679, 24635, 24563, 24573, 24603, 24596, 24639, 24211, 24035, 24164, 24098, 24451, 24643, 24719, 24715, 24482, 24342, 24274, 24234, 24166, 24214, 24402, 24522, 24533, 24336, 24266, 24379, 24212, 24370, 24462, 24495, 24422, 24372, 24394, 24474, 24542, 24651, 24619, 24763, 24679, 24771, 24676, 24574, 24643, 24667, 24719, 24859, 24866, 24806, 24653, 24579, 24627, 24629, 24627, 24683, 24653, 24583, 24458, 24422, 24406, 24571, 24572, 24651, 24606, 24498, 24396, 24286, 24322, 24386, 24532, 24584, 24450, 24404, 24508, 24599, 24536, 24404, 24298, 24346, 24268, 24274, 24392, 24474, 24463, 24402, 24346, 24423, 24560, 24540, 24535, 24526, 24583, 24498, 24406, 24356, 24276, 24226, 24236, 24284, 24320, 24318, 24394, 24434, 24452, 24563, 24591, 24653, 24723, 24683, 24684, 24707, 24755, 24380, 24482, 24506, 24460, 24354, 24210, 24260, 24320, 24539, 24599, 24691, 24691, 24631, 24606, 24653, 24683, 24703, 24739, 24659, 24546, 24420, 24243, 23999, 23821, 23945, 24380, 24949, 25130, 24965, 24973, 24963, 24901, 24660, 24868, 24803, 24756, 24821, 24725, 24677, 24659, 24739, 24756, 24815, 24783, 24733, 24623, 24599, 24579, 24667, 24660, 24475, 24546, 24534, 24639, 24624, 24663, 24715, 24791, 24771, 24811, 24757, 24709, 24755, 24739, 24675, 24651, 24704, 24627, 24647, 24756, 24792, 24781, 24811, 24779, 24751, 24841, 24611, 24771], [24803, 24827, 24763, 24659, 24597, 24482, 24547, 24685, 24683, 24819, 24855, 24787, 24772, 24723, 24793, 24719, 24739, 24502, 24692, 24695, 24579, 24492, 24402, 24416, 24434, 24110, 24276, 24462, 24402, 24388, 24378, 24567, 24799, 24779, 24697, 24577, 24442, 24270, 24258, 23931, 23594, 24163, 24919, 25255, 25149, 25027, 24959, 24963, 24907, 25067, 25059, 24867, 24907, 24923, 24887, 24985, 24915, 24765, 24799, 24707, 24823, 24781, 24717, 24640, 24704, 24767, 24749, 24795, 24707, 24695, 24843, 24845, 24699, 24799, 24829, 24811, 24787, 24699, 24811, 24775, 24867, 24779, 24751, 24772, 24668, 24603, 24767, 24803, 24726, 24711, 24725, 24675, 24695, 24683, 24678, 24715, 24751, 24735, 24669, 24506, 24597, 24675, 24635, 24635, 24667, 24668, 24671, 24683, 24727, 24739, 24723, 24747, 24791, 24741, 24530, 24514, 24486, 24482, 24538, 24605, 24553, 24579, 24573, 24686, 24879, 24865, 24691, 24699, 24755, 24707, 24631, 24546, 24446, 24468, 24526, 24589, 24642, 24599, 24603, 24540, 24510, 24494, 24532, 24530, 24571, 24575, 24589, 24530, 24370, 24320, 24378, 24423, 24394, 24390, 24444, 24494, 24447, 24458, 24442, 24398, 24398, 24442, 24382, 24390, 24308, 24275, 24306, 24314, 24328, 24342, 24346, 24277, 24170, 24220, 23919, 24218, 24522, 24799, 24454, 24492, 24615, 24592, 24671, 24699, 24599, 24486, 24346, 24228, 24358, 24394, 24263, 24134, 24090, 24138, 24202, 24343, 24514, 24398, 24587, 24765, 24815, 24919, 25019, 24912, 24747, 24571, 24450, 24126, 23935, 23695, 24279, 24899, 25411, 25331, 25067, 24911, 24896, 24878, 24819, 24859, 24883, 24867, 24799, 24819, 24839, 24846, 24783, 24707, 24651, 24651, 24640, 24795, 24811, 24739, 24707, 24779, 24787, 24667, 24631, 24653, 24681, 24709, 24639, 24635, 24571, 24502, 24446, 24510, 24542, 24586, 24680, 24676, 24600, 24580, 24470, 24560], [24659, 24615, 24609, 24635, 24653, 24526, 24502, 24518, 24552, 24516, 24522, 24310, 24328, 24322, 24322, 24306, 24328, 24320, 24266, 24154, 24211, 24210, 24327, 24498, 24610, 24891, 24840, 24767, 24716, 24713, 24587, 24610, 24575, 24616, 24546, 24498, 24518, 24567, 24661, 24703, 24564, 24552, 24447, 24410, 24450, 24402, 24338, 24397, 24542, 24589, 24466, 24215, 23746, 24035, 24178, 24781, 25216, 24917, 24931, 24819, 24739, 24723, 24723, 24741, 24699, 24672, 24569, 24553, 24436, 24187, 23930, 23967, 24346, 24740, 24923, 25089, 25144, 25055, 24911, 24863, 24333, 24442, 24657, 24699, 24655, 24348, 24492, 24506, 24382, 24317, 23859, 23995, 24370, 24402, 24495, 24567, 24491, 23747, 24058, 24368, 24819, 24787, 24635, 24739, 24755, 24629, 24755, 24717, 24462, 24603, 24915, 25094, 25049, 24947, 24899, 24835, 24771, 24635, 24669, 24587, 24618, 24575, 24539, 24448, 24293, 24346, 23993, 24380, 24919, 24695, 24436, 24321, 23726, 23811, 23911, 24090, 24228, 24228, 24382, 24915, 25023, 24787, 24635, 24609, 24583, 24554, 24616, 24627, 24599, 24418, 24363, 24090, 24370, 24380, 24498, 24468, 24482, 24567, 24386, 24394, 24350, 24342, 24365, 24346, 24386, 24404, 24261, 23985, 24048, 24158, 24322, 24478, 24530, 24290, 24274, 24182, 23983, 24106, 24250, 24429, 24366, 24286, 24110, 23877, 23937, 24106, 24140, 24090, 24258, 24315, 24306, 24140, 24239, 24242, 24351, 24412, 24358, 24021, 24196, 23900, 24031, 24058, 24040, 23959, 24098, 24394, 24639, 24617, 24538, 24220, 23838, 23688, 23778, 23875, 23967, 24195, 24326, 24656, 25085, 25077, 25063, 24983, 24911, 24947, 24828, 24619, 24583, 24495, 24507, 24379, 24230, 24033, 24058, 23842, 23935, 24102, 24151, 24196, 24266, 24326, 24450, 24365, 24390, 24176, 23636, 23761, 24147, 24631, 25029, 24881, 24670, 24605, 24382, 24011, 23855, 23932], [24140, 24267, 24310, 24024, 24154, 24254, 24534, 24362, 24034, 23999, 24108, 24154, 24131, 24098, 24234, 24043, 24027, 23719, 23910, 24103, 24258, 24054, 24086, 23845, 23597, 23516, 23742, 24428, 25043, 25027, 24829, 24719, 24535, 24595, 24431, 24146, 24330, 24686, 24867, 24844, 24619, 24431, 24490, 24730, 24808, 24833, 24833, 24743, 24563, 24506, 24454, 24451, 24589, 24318, 24382, 24464, 24258, 24320, 24522, 24458, 24430, 24458, 24361, 24282, 24196, 24215, 24239, 24321, 24334, 24277, 24146, 23954, 23550, 23920, 24386, 24390, 24446, 24334, 23955, 24122, 24364, 24064, 24219, 24294, 24082, 24050, 24090, 24066, 24031, 24078, 24138, 24122, 24088, 24048, 24066, 24104, 24124, 24138, 24127, 24176, 24008, 24021, 24200, 24188, 24178, 24082, 24189, 24438, 24442, 24442, 24530, 24540, 24683, 24779, 24771, 24741, 24522, 24342, 24346, 24411, 24344, 24306, 24221, 24228, 24186, 24043, 24039, 23984, 24187, 24150, 24227, 24314, 24300, 24171, 24190, 24226, 24342, 24371, 24342, 24196, 24250, 24282, 24164, 24070, 23896, 23798, 24306, 24445, 24306, 24274, 24440, 24365, 24117, 24050, 24394, 24615, 24522, 24219, 24092, 24094, 24254, 24094, 24073, 23995, 24102, 24292, 24230, 24063, 24194, 24108, 23975, 24118, 24195, 24436, 24606, 24636, 24530, 24763, 24725, 24672, 24617, 24644, 24667, 24619, 24434, 24478, 24290, 24498, 24683, 24675, 24599, 24683, 24686, 24546, 24180, 23963, 23847, 23909, 24151, 24250, 24075, 24140, 24162, 23973, 23846, 23742, 23855, 24039, 23879, 23883, 23813, 23754, 23667, 23507, 23493, 23900, 24611, 24987, 24936, 24775, 24647, 24279, 24540, 24628, 24482, 24530, 24426, 24258, 24454, 24442, 24186, 24394, 24476, 24170, 24452, 24483, 24719, 24742, 24731, 24659, 24563, 24552, 24403, 24366, 24564, 24477, 24230, 23799, 23999, 24446, 24711, 24661, 24523, 24442, 24351, 24298], [24143, 23908, 23999, 24058, 24074, 24222, 24755, 24713, 24415, 24679, 24322, 24223, 24254, 24157, 24203, 24234, 24356, 24226, 23919, 24027, 24049, 24050, 24279, 24188, 24076, 24130, 24070, 24023, 24039, 24091, 24148, 24214, 24212, 23887, 24015, 24190, 24212, 24235, 24204, 24099, 24047, 24210, 24198, 24270, 24308, 24450, 24669, 24643, 24498, 24274, 24159, 24250, 24204, 24132, 24242, 24381, 24398, 24292, 24194, 24270, 24152, 24124, 24234, 24380, 24571, 24637, 24506, 24394, 24226, 24227, 24267, 24039, 24039, 24031, 23831, 23715, 23898, 24074, 24090, 24218, 24346, 24379, 23924, 24146, 24322, 24585, 24538, 24436, 24390, 24031, 24059, 24070, 24120, 24258, 24450, 24571, 24640, 24595, 24530, 24571, 24506, 24370, 24318, 24318, 24306, 24306, 24187, 24306, 24462, 24359, 24066, 24086, 24004, 24226, 24163, 24338, 24562, 24582, 24589, 24464, 24562, 24402, 24198, 24064, 24007, 23924, 24183, 24394, 24138, 24254, 24155, 24050, 24007, 24054, 24066, 24172, 24306, 24302, 24126, 23931, 23907, 23854, 23792, 23882, 23951, 23947, 23975, 24090, 24166, 24439, 24520, 24260, 24270, 24272, 24274, 24128, 24142, 24180, 24102, 24059, 24218, 24332, 24506, 24606, 24546, 24506, 24478, 24346, 24250, 24149, 24195, 24242, 24302, 24290, 24238, 24290, 24274, 24410, 24468, 24446, 24146, 24050, 24123, 23999, 24011, 24009, 23871, 23943, 24013, 23790, 23864, 23891, 24009, 24060, 24174, 24363, 24518, 24410, 24222, 24154, 24286, 24302, 24258, 24336, 24274, 24148, 24052, 23839, 23784, 22867, 23750, 24587, 25357, 25455, 25159, 24971, 24871, 24849, 24843, 24707, 24747, 24806, 24895, 24751, 24828, 24859, 24743, 24827, 24805, 24716, 24749, 24899, 24875, 24819, 24875, 24891, 24960, 24923, 24835, 24819, 24847, 24773, 24827, 24773, 24713, 24667, 24635, 24595, 24617, 24631, 24506, 24514, 24575, 24683, 24651, 24620], [24583, 24767, 24799, 24606, 24683, 24647, 24611, 24644, 24635, 24610, 24571, 24584, 24622, 24552, 24571, 24556, 24604, 24609, 24675, 24685, 24617, 24704, 24739, 24652, 24588, 24700, 24707, 24667, 24627, 24735, 24687, 24434, 24599, 24636, 24763, 24787, 24751, 24733, 24748, 24732, 24659, 24679, 24522, 24510, 24426, 24612, 24575, 24555, 24492, 24397, 24635, 24717, 24617, 24618, 24592, 24660, 24591, 24575, 24556, 24603, 24635, 24609, 24594, 24518, 24627, 24564, 24540, 24394, 24390, 24452, 24559, 24693, 24688, 24627, 24743, 24643, 24560, 24429, 24346, 24412, 24358, 24342, 24317, 24346, 24454, 24471, 24391, 24112, 24490, 24508, 24534, 24620, 24504, 24490, 24506, 24494, 24510, 24442, 24498, 24571, 24603, 24554, 24414, 24322, 24258, 24311, 24398, 24459, 24526, 24374, 24469, 24536, 24434, 24388, 24317, 24310, 24070, 24342, 24560, 24591, 24578, 24368, 24199, 24314, 24220, 24147, 24234, 24283, 24478, 24477, 24467, 24430, 24447, 24410, 24352, 24356, 24424, 24442, 24458, 24404, 24348, 24398, 24346, 24306, 24361, 24380, 24314, 24186, 24220, 24327, 24426, 24401, 24435, 24460, 24474, 24428, 24198, 24355, 24578, 24585, 24676, 24516, 24386, 24368, 24314, 24268, 24275, 24259, 24162, 24246, 24380, 24398, 24194, 24454, 24556, 24623, 24604, 24711, 24522, 24515, 24498, 24647, 24522, 24410, 24585, 24583, 24571, 24560, 24270, 24234, 23790, 23427, 23487, 24146, 24879, 25326, 25271, 25101, 24932, 25003, 24917, 24644, 24587, 24719, 24615, 24631, 24610, 24747, 24679, 24803, 24836, 24797, 24606, 24755, 24980, 24904, 24819, 24867, 24916, 24881, 24653, 24871, 24863, 24855, 24796, 24739, 24739, 24771, 24805, 24819, 24871, 24829, 24735, 24787, 24749, 24767, 24822, 24852, 24833, 24819, 24787, 24907, 24955, 24711, 24669, 24695, 24717, 24715, 24687, 24735, 24669, 24731, 24779, 24749, 24607, 24629], [24679, 24704, 24671, 24625, 24567, 24546, 24482, 24516, 24506, 24530, 24460, 24458, 24331, 24413, 24387, 24450, 24476, 24534, 24442, 24492, 24486, 24502, 24478, 24494, 24691, 24735, 24735, 24731, 24805, 24583, 24571, 24590, 24556, 24603, 24620, 24654, 24676, 24708, 24731, 24699, 24735, 24779, 24779, 24819, 24790, 24795, 24779, 24795, 24683, 24478, 24735, 24635, 24799, 24811, 24742, 24699, 24687, 24740, 24797, 24739, 24760, 24683, 24410, 24335, 24438, 24314, 24478, 24731, 24764, 24426, 24426, 24659, 24752, 24637, 24498, 24483, 24298, 24660, 24739, 24793, 24691, 24426, 24591, 24579, 24514, 24490, 24238, 24514, 24819, 24815, 24795, 24699, 24687, 24675, 24589, 24583, 24565, 24538, 24466, 24530, 24560, 24571, 24614, 24627, 24531, 24446, 24450, 24552, 24611, 24581, 24619, 24660, 24579, 24552, 24506, 24524, 24571, 24635, 24716, 24703, 24663, 24699, 24639, 24636, 24604, 24583, 24571, 24530, 24474, 24556, 24514, 24514, 24603, 24661, 24619, 24639, 24593, 24526, 24494, 24475, 24268, 24242, 24316, 24330, 24236, 24218, 24178, 24178, 24134, 24157, 24123, 23935, 24047, 24307, 24508, 24671, 24715, 24530, 24326, 24210, 24142, 24338, 24427, 24336, 24351, 24366, 24418, 24434, 24411, 24442, 24474, 24435, 24474, 24542, 24524, 24546, 24617, 24677, 24631, 24491, 24354, 24302, 24378, 24507, 24503, 24502, 24507, 24462, 24422, 24517, 24669, 24609, 24362, 24194, 24295, 24414, 24552, 24571, 24490, 24379, 24370, 24402, 24509, 24468, 24386, 24466, 24466, 24538, 24478, 24310, 24500, 24595, 24379, 24302, 24392, 24422, 24352, 24299, 24311, 24277, 24246, 24194, 24266, 24270, 24276, 24308, 24316, 24306, 24283, 24392, 24490, 24435, 24374, 24346, 24172, 24246, 24238, 24191, 24202, 24215, 24116, 24194, 24347, 24460, 24484, 24503, 24418, 24400, 24346, 24275, 24298, 24308, 24340, 24336, 24348, 24474], [24579, 24699, 24747, 24697, 24410, 24176, 24358, 24434, 24503, 24598, 24635, 24554, 24611, 24636, 24593, 24564, 24546, 24522, 24501, 24490, 24490, 24554, 24584, 24458, 24142, 24266, 24466, 24538, 24279, 24138, 24058, 23658, 23447, 24182, 24987, 24907, 25205, 24975, 24891, 24872, 24931, 24851, 24773, 24807, 24747, 24735, 24747, 24735, 24763, 24739, 24663, 24659, 24613, 24607, 24653, 24771, 24920, 24919, 24911, 24870, 24819, 24699, 24686, 24617, 24629, 24627, 24627, 24639, 24530, 24499, 24524, 24507, 24532, 24490, 24560, 24560, 24573, 24618, 24588, 24592, 24534, 24516, 24490, 24442, 24458, 24514, 24618, 24635, 24591, 24651, 24695, 24748, 24677, 24583, 24522, 24593, 24546, 24560, 24575, 24522, 24455, 24446, 24490, 24466, 24530, 24450, 24501, 24552, 24522, 24468, 24476, 24474, 24434, 24379, 24362, 24275, 24182, 24254, 24290, 24363, 24342, 24317, 24196, 24126, 24146, 24362, 24502, 24530, 24454, 24495, 24514, 24395, 24363, 24338, 24198, 24001, 24140, 24470, 24599, 24639, 24616, 24569, 24546, 24562, 24583, 24494, 24438, 24398, 24378, 24186, 24174, 24338, 24286, 24466, 24458, 24472, 24494, 24467, 24542, 24524, 24444, 24500, 24437, 24436, 24362, 24430, 24378, 24306, 24360, 24292, 24307, 24292, 24333, 24374, 24218, 24350, 24546, 24380, 24457, 24442, 24571, 24532, 24259, 24329, 24411, 24458, 24552, 24603, 24391, 24379, 24458, 24446, 24485, 24221, 24122, 24066, 24243, 24458, 24575, 24635, 24372, 24371, 24331, 24490, 24659, 24603, 24560, 24603, 24595, 24530, 24571, 24573, 24567, 24526, 24593, 24647, 24668, 24639, 24611, 24611, 24596, 24562, 24586, 24522, 24470, 24236, 23988, 23775, 23959, 24351, 24763, 24530, 24236, 24356, 24253, 24204, 24085, 23945, 24115, 24086, 24074, 23964, 23891, 23720, 23075, 23843, 24659, 25261, 25107, 24711, 24661, 24735, 24863, 24908, 24831, 24571], [24795, 24691, 24755, 24661, 24725, 24659, 24667, 24588, 24607, 24538, 24522, 24591, 24683, 24670, 24622, 24596, 24627, 24595, 24605, 24514, 24606, 24624, 24647, 24663, 24711, 24621, 24647, 24612, 24567, 24553, 24546, 24530, 24460, 24474, 24450, 24402, 24130, 24270, 24456, 24474, 24355, 24334, 24353, 24378, 24338, 24364, 24390, 24338, 24314, 24326, 24330, 24338, 24378, 24406, 24355, 24302, 24274, 24298, 24258, 24236, 24283, 24294, 24306, 24122, 24298, 24388, 24338, 24316, 24362, 24414, 24402, 24371, 24279, 24314, 24306, 24302, 24219, 24146, 24090, 24221, 24303, 24278, 24362, 24251, 24261, 24154, 24182, 24338, 24291, 24262, 24202, 24307, 24347, 24423, 24205, 23999, 24303, 24267, 24268, 24352, 24258, 24170, 24307, 24306, 24212, 24111, 24070, 24039, 24134, 24166, 24254, 24262, 24268, 24276, 24218, 24179, 24182, 24250, 24194, 24011, 23806, 23959, 24109, 23899, 23984, 23959, 24050, 23983, 23935, 23951, 24039, 23935, 23722, 24074, 23947, 23912, 23967, 23983, 24324, 24586, 24573, 24486, 24450, 24450, 24398, 24159, 24243, 24404, 24571, 24615, 24490, 24326, 24269, 24329, 24378, 24462, 24362, 24506, 24567, 24504, 24451, 24422, 24362, 24374, 24319, 24294, 24302, 24306, 24330, 24298, 24207, 24194, 24166, 24011, 24039, 24122, 24066, 24286, 24230, 24068, 24136, 24186, 24174, 24337, 24491, 24498, 24334, 24251, 24380, 24293, 24258, 24274, 24282, 24306, 24360, 24388, 24274, 24274, 24250, 24050, 24090, 24134, 24108, 23915, 24194, 24381, 24540, 24657, 24599, 24402, 24462, 24562, 24593, 24515, 24571, 24603, 24588, 24560, 24579, 24603, 24562, 24514, 24498, 24302, 24280, 24350, 24387, 24410, 24522, 24514, 24499, 24482, 24446, 24451, 24418, 24420, 24381, 24438, 24490, 24384, 24368, 24390, 24258, 24299, 24307, 24242, 24228, 24306, 24174, 24065, 23752, 23631, 22955, 23795, 24627, 25125], [24793, 24755, 24804, 24751, 24725, 24715, 24723, 24675, 24643, 24635, 24587, 24612, 24542, 24651, 24482, 24522, 24490, 24530, 24487, 24452, 24466, 24510, 24459, 24346, 24370, 24248, 24282, 24248, 24252, 24298, 24354, 24234, 24228, 24198, 24007, 23808, 23523, 23574, 24234, 24947, 25061, 24935, 24811, 24676, 24532, 24604, 24552, 24490, 24530, 24579, 24483, 24502, 24438, 24270, 24270, 24250, 24346, 24364, 24314, 24242, 24218, 24150, 24074, 23967, 24043, 24122, 24048, 23999, 23864, 23898, 23927, 24086, 24310, 24443, 24517, 24474, 24418, 24381, 24406, 24361, 24242, 24150, 24206, 24282, 24310, 24234, 24144, 23935, 23891, 23951, 24058, 24001, 23790, 23578, 23215, 23582, 24328, 25046, 25015, 24937, 24843, 24723, 24743, 24635, 24542, 24518, 24450, 24428, 24442, 24411, 24346, 24370, 24446, 24455, 24450, 24428, 24358, 24366, 24314, 24252, 24292, 24350, 24314, 24290, 24298, 24227, 24202, 24186, 24290, 24260, 24226, 24175, 24147, 24198, 24182, 24182, 24154, 24212, 24330, 24310, 24286, 24330, 24322, 24324, 24246, 23849, 23975, 24234, 24450, 24384, 24212, 24155, 24090, 24139, 24134, 24210, 24154, 24108, 23779, 23027, 23808, 24640, 25309, 25205, 24934, 24859, 24835, 24815, 24793, 24739, 24780, 24859, 24811, 24813, 24767, 24781, 24707, 24707, 24710, 24703, 24711, 24715, 24731, 24683, 24498, 24615, 24629, 24546, 24491, 24502, 24498, 24443, 24450, 24571, 24691, 24719, 24699, 24648, 24603, 24531, 24530, 24498, 24522, 24553, 24524, 24412, 24398, 24418, 24490, 24542, 24571, 24691, 24605, 24541, 24538, 24500, 24347, 24366, 24338, 24510, 24518, 24422, 24371, 24378, 24366, 24341, 24346, 24352, 24361, 24386, 24378, 24346, 24374, 24416, 24562, 24620, 24603, 24483, 24492, 24486, 24421, 24470, 24402, 24358, 24282, 24402, 24447, 24402, 24378, 24410, 24466, 24494, 24502, 24502, 24438, 24298], [24399, 24406, 24371, 24357, 24298, 24366, 24254, 24212, 24174, 24222, 24306, 24410, 24490, 24430, 24451, 24462, 24434, 24414, 24383, 24378, 24386, 24342, 24332, 24386, 24474, 24418, 24414, 24274, 24285, 24287, 24331, 24307, 24322, 24258, 24152, 23929, 24102, 24275, 24338, 24238, 24020, 23913, 23916, 24155, 24410, 24611, 24571, 24538, 24442, 24388, 24342, 24378, 24315, 24308, 24304, 24302, 24208, 24222, 24355, 24442, 24399, 24326, 24189, 24132, 24206, 24298, 24238, 24298, 24354, 24378, 24307, 24282, 24178, 23923, 23932, 23937, 23703, 23467, 23291, 24027, 24813, 24916, 24635, 24683, 24552, 24498, 24450, 24470, 24442, 24536, 24619, 24595, 24575, 24617, 24532, 24392, 24346, 24442, 24402, 24374, 24482, 24522, 24502, 24436, 24418, 24390, 24347, 24343, 24354, 24346, 24195, 24350, 24414, 24430, 24396, 24339, 24290, 24370, 24330, 24386, 24330, 24386, 24370, 24318, 24306, 24206, 24250, 24360, 24286, 24412, 24490, 24512, 24562, 24554, 24474, 24538, 24587, 24522, 24483, 24490, 24538, 24572, 24538, 24478, 24556, 24516, 24526, 24466, 24386, 24371, 24390, 24418, 24396, 24380, 24374, 24372, 24383, 24320, 24346, 24338, 24284, 24062, 23557, 23037, 23871, 24683, 25360, 24751, 24780, 24846, 24741, 24803, 24867, 24751, 24759, 24683, 24635, 24605, 24605, 24667, 24709, 24590, 24603, 24724, 24663, 24651, 24581, 24571, 24571, 24498, 24627, 24627, 24608, 24530, 24567, 24530, 24599, 24603, 24635, 24695, 24799, 24683, 24829, 24867, 24741, 24748, 24820, 24795, 24763, 24783, 24767, 24790, 24832, 24796, 24741, 24747, 24751, 24621, 24756, 24723, 24803, 24867, 24827, 24855, 24891, 24819, 24763, 24787, 24763, 24733, 24699, 24635, 24571, 24603, 24711, 24442, 24659, 24696, 24663, 24635, 24613, 24608, 24575, 24482, 24351, 24573, 24623, 24609, 24689, 24613, 24534, 24482, 24374, 24450, 24450, 24538], [24514, 24498, 24538, 24575, 24553, 24482, 24492, 24506, 24372, 24362, 24391, 24396, 24382, 24351, 24327, 24358, 24363, 24314, 24198, 24286, 24198, 23716, 23037, 23885, 24707, 25345, 25122, 24819, 24897, 24844, 24867, 24783, 24691, 24646, 24587, 24631, 24699, 24619, 24705, 24727, 24597, 24675, 24526, 24563, 24619, 24667, 24677, 24611, 24585, 24515, 24556, 24590, 24583, 24571, 24646, 24629, 24557, 24591, 24635, 24707, 24723, 24675, 24410, 24372, 24450, 24450, 24484, 24514, 24476, 24397, 24596, 24460, 24531, 24675, 24710, 24741, 24691, 24652, 24649, 24536, 24300, 24336, 24378, 24450, 24562, 24494, 24462, 24420, 24307, 24306, 24326, 24487, 24516, 24631, 24571, 24462, 24320, 24226, 24338, 24360, 24375, 24490, 24397, 24395, 24402, 24402, 24266, 24150, 24142, 24110, 24290, 24279, 24374, 24378, 24290, 24070, 24050, 24049, 23836, 23883, 24146, 24427, 24667, 24679, 24490, 24462, 24414, 24466, 24375, 24081, 23884, 23672, 22857, 23746, 24568, 25343, 25481, 25093, 24923, 24779, 24733, 24735, 24907, 24789, 24827, 25011, 24967, 24837, 24823, 24823, 24892, 24895, 24849, 24740, 24735, 24707, 24699, 24755, 24783, 24783, 24747, 24636, 24605, 24616, 24595, 24643, 24699, 24651, 24593, 24560, 24516, 24530, 24591, 24560, 24599, 24612, 24571, 24557, 24486, 24603, 24583, 24644, 24611, 24492, 24333, 24468, 24542, 24500, 24522, 24564, 24591, 24498, 24564, 24627, 24683, 24482, 24450, 24410, 24410, 24514, 24676, 24695, 24659, 24546, 24482, 24522, 24402, 24510, 24563, 24580, 24617, 24562, 24498, 24514, 24447, 24500, 24530, 24476, 24359, 24407, 24372, 24422, 24502, 24454, 24411, 24365, 24350, 24587, 24560, 24534, 24446, 24403, 24530, 24585, 24390, 24514, 24687, 24613, 24657, 24747, 24725, 24720, 24672, 24668, 24611, 24571, 24552, 24514, 24454, 24450, 24492, 24635, 24596, 24590, 24560, 24587], [24671, 24755, 24771, 24709, 24741, 24675, 24592, 24506, 24466, 24530, 24534, 24524, 24462, 24454, 24402, 24434, 24466, 24490, 24452, 24386, 24368, 24386, 24412, 24438, 24454, 24362, 24358, 24346, 24242, 24362, 24346, 24254, 24254, 24357, 24484, 24508, 24435, 24358, 24275, 24155, 24210, 24202, 24284, 24338, 24332, 24277, 24302, 24238, 24178, 24263, 24194, 24402, 24685, 24813, 24796, 24622, 24560, 24490, 24470, 24379, 24326, 24368, 24418, 24378, 24370, 24138, 24035, 24244, 24039, 23641, 23799, 24178, 24755, 24965, 24775, 24739, 24579, 24565, 24542, 24492, 24561, 24577, 24627, 24579, 24575, 24491, 24556, 24482, 24452, 24494, 24461, 24387, 24270, 24306, 24438, 24238, 24383, 24412, 24382, 24338, 24298, 24186, 24202, 24124, 24104, 24142, 24306, 24361, 24226, 24094, 24034, 23931, 23817, 23823, 23837, 23872, 23903, 23968, 24054, 24293, 24592, 24636, 24621, 24474, 24450, 24354, 24331, 24298, 24124, 24074, 23961, 23911, 23710, 23021, 23736, 24562, 25326, 25241, 24807, 24787, 24975, 25181, 25015, 24924, 24912, 24949, 24884, 24819, 24739, 24571, 24692, 24731, 24812, 24821, 24774, 24739, 24733, 24715, 24704, 24733, 24739, 24632, 24619, 24603, 24659, 24571, 24477, 24388, 24418, 24494, 24498, 24462, 24509, 24542, 24560, 24506, 24484, 24514, 24470, 24535, 24508, 24490, 24575, 24552, 24635, 24663, 24546, 24482, 24490, 24572, 24459, 24499, 24572, 24611, 24579, 24585, 24561, 24595, 24671, 24683, 24611, 24623, 24603, 24607, 24586, 24567, 24510, 24452, 24426, 24366, 24372, 24460, 24472, 24511, 24547, 24623, 24599, 24573, 24516, 24515, 24474, 24494, 24500, 24458, 24422, 24492, 24500, 24432, 24438, 24466, 24471, 24499, 24531, 24502, 24482, 24466, 24478, 24442, 24468, 24394, 24292, 24422, 24506, 24556, 24470, 24411, 24342, 24274, 24242, 24246, 24266, 24307, 24350, 24430, 24405, 24386], [24396, 24156, 24180, 24298, 24490, 24486, 24463, 24378, 24338, 24258, 24259, 24286, 24317, 24286, 24218, 24162, 24111, 24274, 24362, 24412, 24389, 24346, 24214, 24054, 23986, 23983, 23666, 23251, 24051, 24873, 25415, 25165, 24927, 24834, 24875, 25015, 25019, 24919, 24829, 24764, 24787, 24791, 24867, 24719, 24579, 24129, 24374, 24687, 24395, 24579, 24878, 25101, 25015, 24883, 24616, 24500, 24516, 24590, 24659, 24560, 24563, 24500, 24306, 24384, 24522, 24546, 24474, 24406, 24314, 24308, 24342, 24346, 24202, 24356, 24386, 24516, 24607, 24573, 24522, 24446, 24443, 24382, 24258, 24318, 24482, 24486, 24426, 24408, 24394, 24346, 24234, 23948, 24226, 24358, 24426, 24342, 24290, 24031, 23901, 23875, 23977, 24102, 24172, 24198, 24178, 23975, 24125, 24220, 24060, 23943, 23834, 23163, 23565, 24386, 25149, 25213, 24971, 24796, 24885, 24827, 24731, 24557, 24611, 24679, 24747, 24743, 24617, 24584, 24673, 24723, 24755, 24648, 24637, 24595, 24593, 24535, 24498, 24530, 24623, 24621, 24720, 24739, 24619, 24654, 24681, 24767, 24533, 24593, 24647, 24611, 24641, 24683, 24645, 24660, 24627, 24579, 24522, 24514, 24560, 24571, 24563, 24540, 24276, 24450, 24587, 24542, 24284, 24386, 24406, 24423, 24414, 24503, 24607, 24647, 24623, 24596, 24571, 24552, 24563, 24442, 24470, 24410, 24450, 24390, 24282, 24419, 24571, 24542, 24466, 24346, 24350, 24307, 24378, 24667, 24817, 24699, 24779, 24692, 24482, 24418, 24444, 24406, 24380, 24387, 24426, 24522, 24562, 24514, 24450, 24444, 24514, 24412, 24462, 24526, 24490, 24442, 24418, 24434, 24347, 24418, 24390, 24530, 24382, 24478, 24346, 24400, 24522, 24689, 24683, 24583, 24611, 24646, 24540, 24466, 24430, 24428, 24062, 24150, 24282, 24290, 24235, 24107, 24214, 24278, 24148, 24098, 24082, 24274, 24379, 24354, 24386, 24562, 24535, 24430, 24202, 24182], [23805, 24158, 24580, 24767, 24717, 24667, 24628, 24474, 24114, 23899, 23979, 24090, 24358, 24514, 24522, 24506, 24561, 24583, 24406, 24226, 23879, 23943, 23805, 23664, 23507, 23318, 24106, 24899, 25458, 25327, 24699, 24739, 24799, 24717, 24715, 24659, 24663, 24617, 24693, 24683, 24715, 24741, 24731, 24731, 24635, 24755, 24595, 24644, 24603, 24676, 24623, 24596, 24538, 24458, 24460, 24526, 24567, 24538, 24491, 24564, 24539, 24502, 24506, 24498, 24434, 24466, 24517, 24535, 24567, 24477, 24407, 24314, 24486, 24494, 24463, 24506, 24482, 24402, 24416, 24484, 24539, 24581, 24514, 24402, 24494, 24575, 24556, 24506, 24486, 24466, 24443, 24380, 24276, 24306, 24314, 24242, 24368, 24436, 24492, 24522, 24470, 24436, 24418, 24317, 24242, 24218, 24260, 24234, 24138, 24098, 24039, 23975, 24031, 23762, 24108, 24462, 24106, 24195, 24258, 24238, 23646, 23674, 23891, 24180, 24248, 24015, 24226, 24330, 24031, 23955, 23840, 23980, 23766, 23602, 23880, 24186, 24411, 24420, 24396, 24066, 23568, 23206, 23970, 24767, 25421, 25051, 24995, 24987, 24979, 24939, 24901, 24936, 24884, 24887, 24742, 24841, 24779, 24643, 24608, 24532, 24576, 24588, 24516, 24627, 24624, 24552, 24679, 24691, 24723, 24683, 24747, 24775, 24742, 24669, 24647, 24597, 24583, 24526, 24510, 24561, 24530, 24561, 24607, 24615, 24667, 24701, 24743, 24819, 24799, 24703, 24699, 24599, 24519, 24539, 24522, 24617, 24595, 24715, 24725, 24659, 24567, 24563, 24534, 24426, 24443, 24470, 24454, 24434, 24348, 24376, 24402, 24466, 24530, 24482, 24430, 24346, 24307, 24354, 24418, 24358, 24242, 24290, 24360, 24378, 24429, 24474, 24498, 24563, 24514, 24498, 24452, 24452, 24426, 24386, 24276, 24322, 24372, 24292, 24309, 24330, 24388, 24306, 24235, 24234, 24298, 24322, 24334, 24311, 24307, 24340, 24307, 24290, 24299, 24302, 24236, 24206], [24143, 24039, 24025, 24012, 24062, 24064, 24194, 24290, 24282, 24174, 24166, 24015, 23698, 23005, 23770, 24614, 25402, 25524, 25192, 25075, 24855, 24767, 24679, 24823, 24865, 24637, 24686, 24741, 24569, 24595, 24734, 24703, 24699, 24595, 24696, 24680, 24723, 24675, 24671, 24779, 24719, 24679, 24696, 24578, 24645, 24667, 24675, 24623, 24739, 24711, 24652, 24687, 24679, 24629, 24615, 24573, 24603, 24589, 24546, 24621, 24619, 24645, 24684, 24709, 24679, 24606, 24561, 24561, 24583, 24669, 24571, 24611, 24561, 24494, 24546, 24562, 24603, 24735, 24684, 24683, 24552, 24374, 24458, 24490, 24530, 24502, 24573, 24530, 24490, 24474, 24468, 24715, 24821, 24739, 24755, 24704, 24659, 24635, 24591, 24506, 24407, 24482, 24524, 24573, 24546, 24438, 24366, 24324, 24362, 24475, 24579, 24546, 24434, 24402, 24242, 24127, 24166, 24254, 24262, 24259, 24310, 24332, 24303, 24283, 24348, 24410, 24436, 24450, 24366, 24260, 24247, 24298, 24274, 24194, 24106, 24190, 24220, 24170, 24111, 24111, 24154, 24114, 24076, 24080, 24138, 24230, 24320, 24316, 24306, 24326, 24391, 24450, 24366, 24234, 24234, 24259, 24306, 24276, 24235, 24167, 24156, 23935, 23798, 23095, 23427, 24267, 25075, 25535, 25337, 25021, 24812, 24819, 24893, 24908, 24920, 24935, 24899, 24899, 24891, 24915, 24880, 24891, 24851, 24817, 24763, 24715, 24635, 24563, 24595, 24603, 24546, 24498, 24394, 24378, 24294, 24362, 24388, 24540, 24593, 24583, 24591, 24615, 24643, 24619, 24587, 24592, 24546, 24458, 24452, 24335, 24330, 24330, 24360, 24402, 24380, 24292, 24292, 24213, 24214, 24174, 24040, 24342, 24514, 24482, 24416, 24114, 24048, 23999, 23750, 23136, 23853, 24615, 25213, 25339, 25121, 24879, 24891, 24907, 25015, 24987, 24871, 24821, 24863, 24792, 24789, 24711, 24751, 24715, 24619, 24560, 24615, 24707, 24494, 24322, 24210, 24170], [24122, 23984, 23944, 24226, 24540, 24172, 23817, 23805, 23850, 23915, 23774, 22908, 23710, 24542, 25305, 25741, 25544, 25301, 25317, 25150, 24939, 24957, 25027, 24995, 24819, 24663, 24667, 24673, 24827, 24997, 24811, 24731, 24811, 24805, 24787, 24695, 24675, 24667, 24687, 24655, 24739, 24694, 24560, 24556, 24592, 24667, 24628, 24667, 24621, 24603, 24609, 24635, 24604, 24659, 24699, 24699, 24656, 24615, 24628, 24619, 24571, 24577, 24474, 24530, 24510, 24450, 24530, 24557, 24542, 24494, 24470, 24491, 24510, 24426, 24443, 24478, 24360, 24370, 24347, 24378, 24410, 24405, 24422, 24458, 24342, 24414, 24402, 24435, 24410, 24430, 24454, 24358, 24358, 24374, 24454, 24498, 24453, 24322, 24229, 24154, 23979, 23953, 24194, 24286, 24328, 24478, 24406, 24334, 24154, 24342, 24404, 24355, 24308, 24146, 24041, 24157, 24136, 24084, 24049, 24056, 24083, 24108, 24190, 24242, 24202, 24125, 24123, 24098, 24086, 24036, 23959, 23807, 23140, 23531, 24351, 25150, 25583, 24971, 25137, 25265, 25053, 25044, 24991, 24863, 24755, 24773, 24803, 24832, 24859, 24815, 24819, 24723, 24617, 24667, 24669, 24691, 24629, 24691, 24703, 24827, 24853, 24827, 24811, 24709, 24748, 24699, 24655, 24675, 24655, 24579, 24621, 24643, 24587, 24542, 24514, 24474, 24495, 24669, 24290, 24106, 24268, 24379, 24560, 24615, 24707, 24827, 24860, 24701, 24595, 24334, 24340, 24332, 24348, 24346, 24286, 24402, 24443, 24446, 24340, 24374, 24368, 24363, 24342, 24331, 24303, 24274, 24306, 24349, 24372, 24399, 24461, 24450, 24426, 24286, 24170, 24094, 24163, 24086, 24074, 24073, 24118, 24157, 24091, 24146, 24226, 24298, 24346, 24386, 24426, 24490, 24414, 24282, 24047, 23349, 23495, 24186, 24895, 25535, 25471, 24965, 24783, 24603, 24576, 24534, 24652, 24667, 24663, 24702, 24789, 24346, 24463, 24675, 24846, 24943, 24883, 24859], [24787, 24603, 24517, 24510, 24604, 24723, 24817, 24819, 24656, 24652, 24679, 24660, 24707, 24635, 24514, 24552, 24635, 24676, 24609, 24577, 24595, 24607, 24613, 24406, 24328, 24310, 24308, 24378, 24290, 24080, 24015, 23956, 23235, 23570, 24378, 25179, 25793, 25447, 25077, 25136, 25149, 25152, 25079, 25189, 25191, 25075, 25153, 25134, 25085, 25067, 25085, 25085, 25059, 24967, 24877, 24859, 24915, 24969, 24984, 24949, 24959, 24981, 24901, 24967, 25003, 24975, 24975, 24964, 24947, 24927, 24867, 24815, 24896, 24971, 24913, 24919, 24859, 24859, 24831, 24718, 24717, 24658, 24709, 24651, 24575, 24735, 24723, 24751, 24637, 24763, 24739, 24811, 24619, 24587, 24611, 24651, 24577, 24533, 24560, 24542, 24482, 24466, 24494, 24538, 24583, 24657, 24623, 24611, 24663, 24635, 24530, 24440, 24499, 24583, 24579, 24482, 24434, 24404, 24430, 24556, 24595, 24539, 24407, 24516, 24569, 24517, 24434, 24382, 24346, 24374, 24428, 24360, 24361, 24375, 24360, 24413, 24452, 24506, 24355, 24243, 24346, 24450, 24577, 24667, 24619, 24514, 24498, 24661, 24695, 24560, 24579, 24567, 24508, 24474, 24607, 24645, 24556, 24546, 24490, 24306, 24243, 24252, 24282, 24147, 24086, 24019, 23939, 24020, 24015, 24178, 24346, 24635, 24669, 24581, 24474, 24349, 24238, 24090, 23815, 23610, 23762, 23815, 23760, 23255, 23166, 23916, 24659, 25327, 25838, 25289, 25177, 25027, 25035, 25067, 24936, 24876, 25028, 25126, 24947, 24895, 25136, 25077, 25011, 24998, 24916, 24987, 24931, 24823, 24797, 24779, 24876, 24887, 24828, 24693, 24522, 24587, 24733, 24875, 24923, 24755, 24693, 24668, 24675, 24514, 24607, 24684, 24727, 24641, 24626, 24573, 24314, 24298, 24391, 24476, 24442, 24278, 24142, 24260, 24384, 24490, 24536, 24510, 24483, 24431, 24430, 24370, 24436, 24321, 24096, 24134, 24114, 24047, 24058, 24039, 23989, 24033], [24049, 24059, 24047, 24066, 23979, 24023, 24186, 24291, 24270, 24214, 24250, 24158, 23985, 23835, 23895, 24114, 24346, 24458, 24346, 24334, 24314, 24270, 24126, 24019, 23931, 24091, 24202, 24258, 24260, 24186, 24108, 24043, 23919, 23891, 23919, 23995, 24011, 23951, 23794, 23494, 23395, 23291, 23596, 24079, 24611, 25043, 25221, 25134, 25023, 24660, 24522, 24338, 23849, 23668, 23551, 23325, 23219, 23412, 23895, 24635, 25340, 25909, 25769, 25085, 25019, 25059, 25130, 25011, 24879, 24755, 24651, 24695, 24861, 24917, 24967, 24819, 24728, 24611, 24514, 24494, 24598, 24577, 24365, 24378, 24347, 24371, 24382, 24291, 24021, 24058, 24320, 24099, 23931, 23819, 23790, 23946, 24210, 24194, 24166, 24074, 23831, 23703, 23527, 23582, 23699, 23936, 24186, 24252, 24454, 24747, 25035, 24979, 24861, 24747, 24667, 24522, 24494, 24510, 24510, 24483, 24202, 24072, 23999, 23906, 23871, 23858, 23790, 23714, 23327, 23326, 23445, 23459, 23219, 23556, 24114, 24697, 25153, 25225, 25076, 24767, 24719, 24562, 24455, 24280, 24258, 24333, 24315, 24163, 23827, 23884, 24021, 23980, 23991, 23947, 23831, 23618, 23043, 23255, 23722, 24360, 24907, 25539, 25925, 25657, 25245, 25067, 24885, 24827, 24965, 25099, 25063, 25045, 24998, 25031, 25076, 25135, 25102, 25121, 25160, 25071, 25169, 25043, 24928, 24677, 24731, 24736, 24669, 24474, 24502, 24637, 24744, 24795, 24668, 24595, 24583, 24621, 24571, 24517, 24388, 24450, 24546, 24416, 24332, 24403, 24434, 24390, 24410, 24514, 24617, 24733, 24763, 24779, 24754, 24671, 24482, 24380, 24284, 24230, 24258, 24282, 24332, 24310, 24074, 24218, 24230, 23906, 23767, 23831, 23746, 23586, 23654, 23931, 24226, 24238, 24450, 24793, 25104, 25189, 24931, 24619, 24478, 24434, 24031, 23807, 23602, 23491, 23776, 24039, 24368, 24739, 25014, 25178, 25356, 25335, 24900, 23782], [23652, 23923, 24363, 24908, 25265, 25657, 25595, 25317, 25255, 25378, 25181, 25075, 24723, 23945, 23594, 23750, 24155, 24741, 25170, 25115, 24920, 24757, 24563, 24500, 24472, 24506, 24414, 24350, 24270, 24074, 23944, 24082, 24126, 24050, 23795, 23439, 23461, 23736, 23891, 23801, 23568, 23455, 23472, 23579, 23550, 23803, 24093, 24234, 24361, 24611, 24892, 25120, 25293, 25335, 25075, 24813, 24723, 24447, 24202, 24032, 23455, 23371, 23719, 24110, 24675, 25221, 25646, 25609, 25205, 24939, 24631, 24639, 24470, 24692, 24803, 24837, 24671, 24623, 24336, 24194, 24314, 24394, 24474, 24522, 24522, 24410, 24298, 24310, 24216, 24226, 24146, 24067, 24246, 24392, 24466, 24242, 24386, 24351, 24187, 23813, 23383, 23551, 23832, 24106, 24194, 24238, 24154, 23714, 23761, 23871, 23985, 23975, 23799, 23674, 23718, 23803, 23843, 23598, 23594, 23808, 23911, 23927, 23871, 23959, 23638, 23524, 23587, 23574, 23831, 23805, 23624, 23467, 23586, 23602, 23660, 23623, 23444, 23411, 23531, 23702, 23935, 24258, 24458, 24318, 24214, 24035, 23831, 23825, 23774, 23742, 23803, 23731, 23686, 23750, 23871, 24023, 23947, 23953, 23738, 23639, 23628, 23680, 23606, 23519, 23618, 23627, 23546, 23401, 23476, 23584, 23564, 23503, 23568, 23567, 23585, 23618, 23678, 23824, 23947, 23935, 23999, 23667, 23614, 23627, 23706, 23915, 23959, 23896, 24049, 24062, 24058, 24017, 23999, 23907, 23828, 23839, 23859, 23929, 23959, 23905, 23646, 23782, 23899, 23954, 23753, 23712, 23615, 23620, 23575, 23625, 23694, 23550, 23537, 23583, 23526, 23383, 23484, 23694, 23873, 24007, 23866, 23531, 23404, 23554, 23686, 23728, 23815, 24063, 24319, 24535, 24892, 25171, 24936, 24446, 24443, 24635, 24668, 24733, 24663, 24430, 24076, 24158, 24284, 24194, 24138, 24048, 24090, 24110, 24093, 24020, 23937, 23927, 24002, 24136, 24106, 24035], [23889, 23931, 23963, 24039, 24064, 24098, 24122, 24156, 24142, 24114, 24019, 23758, 23867, 24031, 24146, 24122, 23839, 23606, 23734, 23798, 23699, 23706, 23750, 23766, 23983, 23824, 24214, 24522, 24476, 24246, 24130, 24191, 24107, 23903, 23863, 23954, 23976, 24031, 24060, 23907, 24024, 24078, 24159, 24035, 23976, 23956, 23952, 23957, 23928, 24016, 24066, 24039, 23999, 23979, 23983, 23963, 24043, 24015, 24115, 24031, 23895, 23959, 24023, 24039, 24091, 23999, 23975, 23919, 23954, 23914, 23911, 23813, 23812, 23782, 23805, 23802, 23795, 23923, 23983, 23964, 23698, 23654, 23702, 23750, 23553, 23766, 23919, 23985, 24090, 24160, 24258, 24119, 23843, 23798, 23795, 23646, 23927, 24142, 24130, 23975, 23782, 23905, 23923, 23845, 23778, 23668, 23688, 23475, 23686, 24007, 24330, 24286, 24069, 24047, 24007, 24011, 23980, 23995, 23943, 23929, 23711, 23706, 23712, 23734, 23590, 23728, 23852, 23867, 23823, 23969, 24155, 24270, 24326, 24242, 24058, 23938, 23975, 24083, 23735, 23683, 23738, 23706, 23646, 23585, 23523, 23359, 23616, 23799, 23919, 24023, 23979, 23995, 23943, 23927, 24007, 23582, 23584, 23573, 23566, 23678, 23654, 23731, 23674, 23666, 23903, 23872, 23710, 23615, 23695, 23863, 23851, 23554, 23550, 23686, 23877, 23819, 23834, 23963, 23702, 23851, 23881, 23847, 23825, 23836, 23782, 23791, 23807, 23793, 23843, 23855, 23746, 23742, 23702, 23614, 23554, 23602, 23728, 23843, 23883, 23835, 23758, 23614, 23655, 23758, 23782, 23791, 23752, 23698, 23921, 23750, 23496, 23652, 23746, 23782, 23734, 23647, 23558, 23639, 23692, 23706, 23786, 23758, 23742, 23702, 23639, 23678, 23671, 23671, 23662, 23686, 23582, 23536, 23388, 23331, 23663, 24007, 24102, 24142, 24123, 24140, 24154, 24142, 24174, 24044, 23867, 23680, 23636, 23556, 23630, 23656, 23539, 23475, 23626, 23666, 23718, 23795], [23602, 23598, 23634, 23501, 23565, 23860, 23999, 24031, 23934, 23875, 23666, 23550, 23570, 23550, 23519, 23483, 23359, 23260, 23705, 24122, 24556, 24599, 24358, 24226, 23963, 23903, 23582, 24001, 23967, 23591, 23578, 23702, 23739, 23666, 23807, 23927, 23844, 23710, 23702, 23632, 23594, 23341, 23403, 23551, 23627, 23786, 23943, 23835, 23550, 23367, 23345, 23776, 24076, 24043, 23913, 23799, 23762, 23701, 23642, 23595, 23606, 23578, 23591, 23682, 23576, 23600, 23587, 23651, 23678, 23712, 23871, 23943, 23863, 23851, 23815, 23729, 23726, 23714, 23647, 23650, 23622, 23531, 23550, 23582, 23582, 23606, 23710, 23674, 23610, 23523, 23523, 23583, 23607, 23622, 23714, 23746, 23846, 23795, 23674, 23557, 23647, 23763, 23727, 23483, 23467, 23553, 23536, 23562, 23383, 23371, 23467, 23792, 23937, 23976, 23631, 23491, 23475, 23507, 23275, 23380, 23396, 23363, 23558, 23809, 24043, 24058, 24266, 24400, 24047, 24068, 24082, 24019, 23786, 24054, 23840, 23706, 23930, 24015, 23919, 23935, 23953, 23869, 23642, 23654, 23578, 23403, 23455, 23291, 23540, 23626, 23855, 24003, 23988, 23882, 23807, 23955, 23768, 23594, 23558, 23642, 23730, 23718, 23454, 23648, 23819, 23813, 23813, 23795, 23766, 23686, 23666, 23312, 23291, 23566, 23758, 23948, 23864, 23790, 23718, 23694, 23734, 23842, 23767, 23805, 23823, 23792, 23566, 23631, 23610, 23734, 23799, 23865, 23682, 23662, 23619, 23542, 23471, 23546, 23588, 23650, 23471, 23471, 23590, 23598, 23415, 23523, 23614, 23710, 23711, 23662, 23623, 23670, 23563, 23531, 23554, 23558, 23484, 23475, 23543, 23479, 23523, 23638, 23554, 23618, 23574, 23646, 23703, 23805, 24000, 23949, 23738, 23678, 23654, 23694, 23650, 23670, 23662, 23617, 23694, 23670, 23746, 23798, 23919, 24043, 24118, 24170, 24155, 23953, 23887, 23750, 23477, 23809, 23882, 23739, 23553, 23678], [23762, 23541, 23620, 23507, 23519, 23831, 24031, 23960, 23975, 23967, 23804, 23783, 23710, 23680, 23721, 23743, 23838, 23903, 23758, 23672, 23698, 23630, 23758, 23792, 23742, 23566, 23449, 23500, 23508, 23411, 23336, 23708, 23993, 24100, 24161, 24017, 24050, 23944, 23738, 23622, 23924, 24082, 24126, 23952, 23774, 23947, 23999, 23851, 23622, 23670, 23783, 23919, 24082, 24122, 23899, 23875, 23762, 23586, 23531, 23597, 23523, 23582, 23407, 23480, 23658, 23707, 23638, 23634, 23798, 23877, 23672, 23504, 23499, 23664, 23582, 23335, 23245, 23550, 24017, 24178, 24140, 24082, 23917, 23931, 23917, 23852, 23938, 24050, 24003, 23887, 23815, 23839, 23905, 23939, 23911, 23680, 23351, 23823, 24132, 24218, 24103, 23889, 23746, 23628, 23790, 23813, 23784, 23804, 23853, 24110, 24122, 24039, 23881, 23766, 23664, 23840, 23903, 23995, 23996, 23744, 23678, 23691, 23531, 23607, 23720, 23887, 23827, 23923, 23690, 23646, 23628, 23662, 23766, 23790, 23726, 23726, 23734, 23847, 23881, 23734, 23836, 23927, 23753, 23799, 23795, 23771, 23764, 23778, 23843, 23630, 23328, 23550, 23582, 23694, 23471, 23427, 23480, 23515, 23475, 23535, 23654, 23766, 23718, 23283, 23422, 23527, 23898, 24018, 23888, 23622, 23734, 23690, 23596, 23537, 23642, 23758, 23845, 23839, 23952, 23911, 23821, 23807, 23871, 23803, 23794, 23769, 23691, 23727, 23561, 23507, 23503, 23525, 23750, 23811, 23730, 23582, 23590, 23569, 23630, 23582, 23554, 23579, 23542, 23377, 23550, 23606, 23562, 23424, 23686, 23795, 23694, 23263, 23441, 23598, 23479, 23539, 23559, 23646, 23784, 23790, 23786, 23790, 23596, 23631, 23532, 23356, 23461, 23292, 23171, 23443, 23496, 23332, 23379, 23493, 23446, 23374, 23467, 23430, 23327, 23448, 23374, 23337, 23203, 23221, 23253, 23515, 23690, 23971, 23895, 23566, 23634, 23803, 24068, 24146, 24162, 23947], [23702, 23654, 23503, 23447, 23539, 23951, 23834, 23953, 23993, 23895, 23848, 23799, 23722, 23690, 23864, 23937, 23799, 23766, 23646, 23602, 23131, 23525, 23999, 24380, 24428, 24223, 24154, 23989, 23686, 23782, 24009, 23855, 23659, 23291, 23447, 23831, 24080, 24106, 23984, 23821, 23843, 23923, 23987, 24027, 24051, 24130, 24039, 23774, 23738, 23849, 23895, 23844, 23881, 23833, 23835, 23823, 23766, 23637, 23707, 23754, 23825, 23869, 23889, 23815, 23738, 23723, 23841, 23915, 23847, 23796, 23782, 23823, 23873, 23710, 23726, 23750, 23750, 23771, 23786, 23812, 23867, 23883, 23865, 23758, 23839, 23879, 23782, 23734, 23795, 23738, 23702, 23718, 23646, 23652, 23646, 23634, 23706, 23655, 23644, 23579, 23461, 23536, 23618, 23508, 23678, 23867, 23847, 23834, 23642, 23507, 23457, 23355, 23455, 23435, 23591, 23686, 23638, 23607, 23540, 23524, 23536, 23401, 23404, 23363, 23475, 23734, 23947, 24033, 23568, 23694, 23746, 23590, 23666, 23799, 23683, 23868, 23718, 23654, 23680, 23702, 23804, 23898, 23770, 23712, 23642, 23435, 23640, 23698, 23782, 23670, 23427, 23604, 23634, 23642, 23672, 23720, 23686, 23655, 23566, 23542, 23469, 23590, 23667, 23734, 23453, 23495, 23475, 23532, 23658, 23794, 23776, 23704, 23678, 23523, 23542, 23673, 23774, 23839, 23803, 23945, 23975, 23900, 23782, 23782, 23760, 23808, 23786, 23686, 23712, 23698, 23782, 23838, 23726, 23580, 23554, 23431, 23513, 23606, 23650, 23766, 23662, 23615, 23495, 23734, 23916, 23856, 23714, 23750, 23799, 23799, 23726, 23491, 23662, 23766, 23782, 23879, 24007, 23845, 23823, 23803, 23807, 23791, 23679, 23674, 23682, 23623, 23698, 23718, 23550, 23419, 23483, 23443, 23541, 23620, 23614, 23327, 23238, 23440, 23742, 23859, 23802, 23659, 23527, 23614, 23792, 23991, 23959, 23804, 23694, 23539, 23594, 23747, 23728, 23776, 23614, 23569], [23696, 23766, 23708, 23634, 23627, 23614, 23576, 23463, 23443, 23299, 23453, 23640, 23574, 23564, 23337, 23586, 23813, 23706, 23630, 23592, 23478, 23388, 23360, 23439, 23371, 23326, 23388, 23373, 23379, 23356, 23163, 23132, 23448, 24015, 23946, 23883, 23866, 23903, 23769, 23836, 24170, 24330, 24274, 23932, 23720, 23670, 23885, 23692, 23542, 23301, 23582, 23758, 23809, 23746, 23722, 23427, 23355, 23291, 23300, 23503, 23554, 23654, 23523, 23501, 23309, 23323, 23537, 23399, 23395, 23462, 23435, 23467, 23491, 23507, 23539, 23229, 23363, 23370, 23544, 23542, 23666, 23721, 23648, 23507, 23455, 23392, 23694, 23834, 24047, 24050, 23979, 23979, 23839, 23803, 23831, 23774, 23643, 23615, 23658, 23619, 23774, 23762, 23703, 23686, 23734, 23803, 23820, 23751, 23726, 23702, 23646, 23563, 23622, 23658, 23704, 23750, 23662, 23680, 23703, 23479, 23263, 23297, 23350, 23328, 23392, 23336, 23487, 23715, 23483, 23499, 23208, 23271, 23326, 23352, 23305, 23531, 23784, 23746, 23865, 23991, 23790, 23702, 23660, 23673, 23574, 23399, 23199, 23416, 23507, 23618, 23542, 23395, 23281, 23493, 23675, 23640, 23469, 23369, 23511, 23491, 23460, 23349, 23363, 23427, 23327, 23292, 23343, 23443, 23403, 23404, 23524, 23523, 23467, 23439, 23400, 23395, 23367, 23398, 23437, 23535, 23660, 23511, 23523, 23503, 23485, 23435, 23453, 23626, 23634, 23582, 23513, 23436, 23325, 23091, 23267, 23401, 23488, 23407, 23380, 23294, 23343, 23371, 23387, 23309, 23147, 23211, 23179, 23140, 22941, 23113, 23358, 23782, 23807, 23896, 23955, 23895, 23742, 23794, 23770, 23766, 23722, 23720, 23582, 23582, 23578, 23542, 23635, 23607, 23539, 23531, 23407, 23493, 23670, 23638, 23525, 23309, 23237, 23379, 23597, 23596, 23614, 23460, 23336, 23367, 23523, 23483, 23507, 23678, 23630, 23546, 23379, 23179, 23483, 23583, 23455, 23435], [23317, 23420, 23531, 23608, 23550, 23654, 23728, 23710, 23582, 23499, 23315, 23384, 23463, 23451, 23375, 23499, 23467, 23305, 23283, 23305, 23388, 23403, 23187, 23195, 23359, 23366, 23361, 23333, 23243, 23320, 23339, 23347, 23280, 23237, 23115, 23219, 23237, 23296, 23308, 23331, 23271, 23224, 23367, 23446, 23376, 23355, 23257, 23287, 23163, 23174, 23403, 23404, 23359, 23275, 23275, 23327, 23319, 23215, 23133, 23081, 23195, 23562, 23542, 23283, 23251, 23191, 23281, 23373, 23339, 23312, 23287, 23244, 23263, 23275, 23298, 23275, 23287, 23293, 23175, 23099, 23251, 23151, 22931, 23435, 23419, 23195, 23388, 23329, 23411, 23427, 23535, 23395, 23459, 23443, 23467, 23472, 23470, 23535, 23529, 23477, 23558, 23518, 23459, 23363, 23235, 23508, 23509, 23349, 23244, 23324, 23323, 23361, 23427, 23578, 23480, 23483, 23495, 23467, 23347, 23499, 23429, 23380, 23331, 23305, 23211, 23253, 23339, 23284, 23491, 23384, 23355, 23188, 23171, 23208, 23355, 23499, 23447, 23369, 23267, 23068, 23131, 23269, 23219, 23219, 23355, 23459, 23758, 23879, 23552, 23191, 23323, 23163, 23267, 23301, 23176, 23355, 23550, 23622, 23477, 23315, 23291, 23301, 23481, 23499, 23706, 23718, 23641, 23622, 23238, 23395, 23487, 23507, 23479, 23554, 23480, 23280, 23115, 23179, 23499, 23863, 23959, 23620, 23279, 23287, 23343, 23197, 23451, 23156, 23440, 23587, 23608, 23539, 23381, 23355, 23399, 23356, 23331, 23444, 23390, 23688, 23766, 23826, 23738, 23558, 23523, 23483, 23512, 23487, 23536, 23540, 23475, 23419, 23195, 22853, 23633, 24336, 24445, 23883, 23903, 24009, 23915, 23752, 23738, 23718, 23792, 23649, 23718, 23810, 23824, 23696, 23688, 23604, 23654, 23654, 23588, 23598, 23718, 23678, 23484, 23507, 23360, 22688, 23531, 24274, 24007, 23903, 23861, 23766, 23684, 23682, 23790, 23734, 23718, 23841, 23871, 23930], [23799, 23736, 23628, 23559, 23710, 23672, 23682, 23738, 23770, 23782, 23678, 23587, 23550, 23405, 23275, 23340, 23427, 23223, 23140, 23135, 23648, 23921, 23915, 23704, 23493, 23558, 23503, 23447, 23389, 23423, 23523, 23660, 23710, 23766, 23682, 23331, 23292, 23193, 23287, 23351, 23507, 23616, 23678, 23531, 23269, 23283, 23127, 23187, 23235, 23203, 23152, 23239, 23307, 23292, 23381, 23351, 23161, 23199, 23275, 23363, 23656, 23846, 23921, 23954, 23133, 23221, 23509, 23927, 24186, 24182, 24076, 23979, 23913, 23680, 23654, 23630, 23519, 23679, 23869, 23644, 23574, 23447, 23329, 23279, 23519, 23674, 23655, 23443, 23335, 23499, 23626, 23572, 23578, 23682, 23525, 23491, 23435, 23411, 23203, 23111, 22977, 23172, 23570, 23935, 24124, 24274, 24170, 24040, 23768, 23525, 23640, 23770, 23762, 23528, 23317, 23395, 23277, 23327, 23419, 23467, 23373, 23279, 23276, 23379, 23333, 23373, 23477, 23355, 23407, 23642, 23762, 23516, 23267, 23189, 23383, 23535, 23631, 23784, 24067, 23983, 23793, 23606, 23639, 23679, 23542, 23275, 23499, 23737, 23770, 23642, 23607, 23419, 23403, 23475, 23492, 23383, 23351, 23427, 23528, 23496, 23546, 23585, 23547, 23283, 23203, 23315, 23307, 23428, 23463, 23235, 23176, 23294, 23638, 23799, 23960, 23944, 23536, 23492, 23503, 23447, 23531, 23369, 23017, 23231, 23808, 24423, 24611, 24246, 24067, 23986, 23887, 23916, 23895, 23809, 23772, 23746, 23690, 23630, 23602, 23588, 23654, 23638, 23550, 23496, 23491, 23467, 23348, 23550, 23459, 23550, 23647, 23553, 23379, 23339, 23267, 23319, 23391, 23438, 23416, 23221, 23150, 23059, 23141, 23319, 23327, 23428, 23451, 23553, 23627, 23525, 23501, 23175, 23363, 23541, 23646, 23463, 23328, 23257, 23275, 23129, 23211, 23487, 23774, 23750, 23718, 23674, 23610, 23317, 23328, 23483, 23443, 23508, 23540, 23507, 23333, 23227], [23492, 23379, 23025, 23421, 23620, 23469, 23473, 23421, 23467, 23387, 23467, 23594, 23399, 23419, 23428, 23396, 23503, 23550, 23423, 23403, 23464, 23383, 23347, 23257, 23156, 22913, 22959, 23784, 24411, 24866, 24787, 24394, 24082, 23911, 23746, 23663, 23658, 23770, 23662, 23615, 23538, 23539, 23674, 23752, 23782, 23728, 23617, 23427, 23321, 23511, 23622, 23726, 23752, 23684, 23706, 23805, 23867, 23760, 23483, 23471, 23562, 23569, 23622, 23634, 23507, 23559, 23694, 23634, 23642, 23569, 23480, 23496, 23531, 23543, 23375, 23437, 23469, 23443, 23211, 23001, 23035, 23103, 23423, 23554, 23416, 23031, 22874, 23211, 24017, 24478, 24625, 24532, 24190, 23746, 23887, 23610, 23859, 23952, 23881, 23895, 23937, 23947, 23844, 23559, 23616, 23843, 23994, 24035, 23848, 23808, 23706, 23628, 23735, 23772, 23805, 23742, 23654, 23686, 23686, 23758, 23863, 23835, 23738, 23712, 23623, 23662, 23750, 23770, 23606, 23542, 23491, 23762, 23846, 23721, 23660, 23758, 23734, 23508, 23606, 23638, 23514, 23455, 23477, 23509, 23503, 23356, 23147, 23518, 23576, 23578, 23561, 23559, 23492, 23484, 23436, 23397, 23395, 23541, 23380, 23307, 23430, 23550, 23566, 23523, 23485, 23499, 23427, 23385, 23478, 23468, 23419, 23387, 23323, 23509, 23531, 23455, 23445, 23539, 23578, 23589, 23567, 23427, 23444, 23451, 23392, 23389, 23329, 23351, 23427, 23503, 23658, 23726, 23758, 23622, 23491, 23407, 23403, 23314, 23347, 23383, 23432, 23546, 23542, 23471, 23455, 23556, 23491, 23459, 23395, 23415, 23448, 23411, 23079, 23664, 23969, 23883, 23642, 23790, 23750, 23554, 23413, 23459, 23543, 23598, 23646, 23638, 23617, 23584, 23446, 23488, 23456, 23455, 23355, 23411, 23483, 23390, 23371, 23369, 23387, 23388, 23460, 23421, 23376, 23416, 23467, 23419, 23360, 23380, 23408, 23436, 23512, 23424, 23331, 23652, 23642, 23601], [23435, 23483, 23600, 23403, 22977, 23646, 24017, 24080, 23885, 23790, 23687, 23351, 23598, 23414, 23475, 23508, 23598, 23675, 23606, 23531, 23341, 23372, 23400, 23325, 23375, 23492, 23590, 23726, 23571, 23467, 23399, 23393, 23427, 23443, 23375, 23335, 23419, 23507, 23463, 23404, 23392, 23475, 23702, 23639, 23542, 23499, 23387, 23251, 23309, 23195, 23483, 23553, 23328, 23198, 23376, 23487, 23550, 23515, 23301, 23291, 23345, 23400, 23312, 23336, 23308, 23416, 23411, 23452, 23088, 23159, 23310, 23267, 23275, 23445, 23403, 23179, 23199, 23179, 23171, 23331, 23568, 23606, 23375, 23284, 23294, 23228, 23166, 23111, 23151, 23379, 23582, 23674, 23396, 23626, 23704, 23484, 23421, 23396, 23411, 23379, 23355, 23056, 23024, 23123, 23341, 23620, 23760, 23798, 23742, 23636, 23335, 23364, 23334, 23443, 23508, 23520, 23563, 23624, 23591, 23500, 23439, 23467, 23429, 23219, 23236, 23475, 23550, 23556, 23558, 23622, 23588, 23459, 23452, 23403, 23582, 23678, 23718, 23707, 23429, 23435, 23349, 23378, 23443, 23607, 23708, 23770, 23586, 23601, 23326, 23384, 23606, 23694, 23583, 23459, 23395, 23427, 23283, 23203, 23237, 23206, 23139, 23039, 22877, 22805, 23111, 23427, 23523, 23592, 23670, 23704, 23750, 23847, 23796, 23646, 23327, 23139, 22863, 23291, 23622, 23591, 23427, 23435, 23539, 23550, 23413, 23188, 23086, 23235, 23406, 23347, 23216, 23061, 22811, 22747, 23205, 23975, 24635, 25015, 24727, 24181, 23799, 23642, 23758, 23558, 23475, 23387, 23435, 23566, 23481, 23395, 23323, 23342, 23316, 23391, 23507, 23512, 23427, 23395, 23292, 23391, 23235, 23081, 23536, 23864, 23901, 23606, 23464, 22575, 23339, 24058, 24380, 24510, 24651, 24490, 24027, 23939, 23610, 23742, 23835, 23979, 24058, 23927, 23703, 23339, 23403, 23408, 23519, 23454, 23301, 23184, 23340, 23187, 22933, 23168, 23666, 24290], [24484, 24058, 23688, 23401, 23484, 23477, 23459, 23541, 23440, 23443, 23379, 23181, 22563, 23272, 24035, 24606, 24663, 24290, 24190, 24355, 24154, 24162, 24066, 24025, 23987, 23932, 23904, 23895, 23742, 23909, 24032, 24017, 23808, 23844, 23879, 23869, 23953, 23915, 23895, 23895, 23963, 23983, 23937, 24023, 24020, 23953, 23836, 23771, 23979, 24082, 24082, 24098, 23979, 23953, 23794, 23798, 23778, 23710, 23734, 23663, 23606, 23603, 23663, 23795, 23762, 23695, 23751, 23955, 23736, 23686, 23680, 23712, 23704, 23646, 23728, 23642, 23575, 23623, 23784, 23872, 23837, 23738, 23582, 23726, 23819, 23939, 23879, 23892, 23895, 23903, 23927, 23917, 23907, 23614, 23696, 23588, 23730, 23762, 23800, 23919, 23983, 23948, 23874, 23814, 23706, 23656, 23704, 23790, 23792, 23779, 23726, 23710, 23678, 23736, 23702, 23745, 23807, 23807, 23758, 23775, 23849, 23850, 23799, 23849, 23893, 23899, 23967, 23730, 23712, 23652, 23550, 23799, 23887, 23908, 23726, 23666, 23379, 23666, 23413, 23413, 23782, 24018, 24027, 23932, 23650, 23706, 23774, 23772, 23730, 23554, 23608, 23631, 23774, 23794, 23630, 23702, 23694, 23648, 23655, 23634, 23510, 23424, 23435, 23502, 23594, 23626, 23475, 23546, 23487, 23491, 23487, 23568, 23562, 23448, 23475, 23511, 23444, 23582, 23652, 23663, 23651, 23582, 23420, 23259, 23283, 23621, 24007, 23799, 23540, 23503, 23721, 23524, 23678, 23608, 23509, 23499, 23558, 23627, 23564, 23628, 23782, 23833, 23778, 23782, 23678, 23499, 23339, 23303, 23256, 23287, 23452, 23427, 23467, 23449, 23219, 22841, 23025, 23869, 24635, 24903, 25047, 24916, 24735, 24715, 24508, 24135, 24187, 24270, 24364, 24310, 24320, 24364, 24304, 24067, 24090, 23799, 23841, 23912, 24088, 23821, 23799, 23815, 23735, 23748, 23670, 23654, 23570, 23799, 23871, 23794, 23803, 23758, 23963, 23977, 23927, 23897], [23891, 23858, 23848, 23702, 23590, 23420, 23714, 23935, 24047, 24043, 23929, 23855, 23786, 23821, 23863, 23851, 23891, 23698, 23544, 23508, 23526, 23574, 23602, 23667, 23608, 23578, 23568, 23455, 23494, 23395, 23447, 23516, 23492, 23471, 23535, 23578, 23815, 23804, 23863, 23841, 23895, 23888, 23875, 23759, 23578, 23662, 23503, 23566, 23670, 23647, 23619, 23562, 23315, 23287, 23429, 23569, 23291, 23532, 23535, 23646, 23524, 23647, 23638, 23518, 23480, 23512, 23630, 23698, 23638, 23568, 23455, 23495, 23566, 23625, 23596, 23626, 23632, 23578, 23574, 23570, 23606, 23565, 23508, 23566, 23407, 23383, 23317, 22811, 23267, 23872, 24410, 24827, 24905, 24460, 24031, 23726, 23517, 22897, 23267, 23859, 24414, 24418, 23983, 23866, 23455, 22729, 23478, 24246, 24875, 24748, 23961, 23836, 23655, 23710, 23782, 23794, 23730, 23686, 23719, 23827, 23818, 23323, 23131, 23336, 23586, 23550, 23306, 22821, 24286, 24934, 25198, 25109, 24511, 24066, 23991, 24166, 24190, 24090, 23891, 23847, 23930, 23975, 23888, 23932, 23935, 23903, 23905, 23774, 23646, 23720, 23758, 23642, 23428, 23203, 23620, 23798, 23566, 23744, 23718, 23718, 23654, 23627, 23546, 23375, 23419, 23578, 23582, 23622, 23516, 23622, 23470, 23647, 23798, 23611, 23507, 23544, 23503, 23387, 23351, 23507, 23475, 23430, 23299, 23254, 23438, 23387, 23325, 23195, 23248, 23414, 23299, 23059, 23670, 24188, 24450, 24428, 24110, 23714, 23507, 23742, 23754, 23794, 23670, 23415, 23297, 23392, 23340, 23375, 23432, 23531, 23739, 23503, 23553, 23503, 23451, 23275, 22643, 23491, 24291, 24942, 25103, 24443, 23953, 23895, 23871, 23806, 23718, 23630, 23658, 23794, 23795, 23883, 23911, 23668, 23610, 23953, 24182, 24180, 24058, 23943, 23793, 23708, 23730, 23702, 23710, 23824, 23815, 23587, 23596, 23432, 22971, 23231, 23946, 24639, 25051, 24896], [24494, 24134, 23795, 23816, 23758, 23752, 23622, 23405, 23355, 23385, 23313, 23251, 22571, 23411, 24190, 24861, 24939, 24711, 24453, 24238, 24194, 24047, 23820, 23863, 24019, 24090, 24007, 24048, 24128, 24060, 23883, 23793, 23795, 23664, 23730, 23499, 23459, 23539, 23674, 23803, 23905, 23668, 23480, 23491, 23568, 23502, 23132, 23395, 23620, 23643, 23654, 23802, 23800, 23711, 23598, 23617, 23566, 23367, 23257, 23211, 23102, 22873, 23316, 23911, 24423, 24424, 24039, 23782, 23752, 23857, 23909, 23871, 23673, 23471, 23365, 23492, 23584, 23492, 23147, 23190, 23171, 23075, 23131, 22770, 23213, 23511, 23713, 24210, 24348, 24218, 23936, 23638, 23387, 23423, 23674, 23766, 23574, 23570, 23582, 23492, 23488, 23375, 23313, 23355, 23284, 23088, 22899, 23163, 23742, 24307, 24859, 24763, 24716, 24590, 24058, 23871, 23627, 23444, 23359, 23463, 23446, 23298, 23075, 23189, 23562, 23884, 24146, 24454, 23815, 23694, 23535, 23095, 23076, 23461, 23957, 24386, 24591, 24727, 24420, 24379, 24148, 23845, 23881, 23770, 23539, 22961, 23456, 24034, 24532, 24739, 24542, 24147, 24118, 23967, 23807, 23702, 23557, 23467, 23543, 23553, 23455, 23291, 23135, 22829, 23256, 23791, 24418, 24511, 24300, 24220, 24082, 23967, 23777, 23484, 23531, 23424, 23253, 23074, 22735, 22989, 23666, 24442, 25081, 25475, 25397, 25178, 24999, 24615, 24438, 24247, 24226, 24074, 24113, 24276, 24306, 24514, 24599, 24498, 24482, 24349, 24266, 24315, 24252, 24175, 24266, 24307, 24306, 24250, 24166, 24132, 24035, 24011, 23971, 23967, 23987, 23983, 23999, 23959, 23951, 23951, 23955, 24051, 24116, 24007, 24000, 24138, 24154, 24138, 23964, 23863, 23899, 23911, 23815, 23751, 23936, 24044, 23991, 23795, 23907, 23995, 24043, 23999, 23909, 23891, 23899, 23931, 23770, 23664, 23551, 23594, 23639, 23569, 23493, 23686, 23791, 23833], [23863, 23879, 23816, 23727, 23586, 23542, 23663, 23815, 23817, 23582, 23479, 23435, 23455, 23355, 23232, 22715, 23031, 23543, 24292, 25035, 25599, 25734, 25269, 24843, 24660, 24703, 24466, 24206, 24182, 24074, 24070, 24106, 24228, 24282, 24138, 24043, 24023, 24115, 24190, 24222, 24066, 23975, 23979, 23861, 23793, 23841, 23999, 24109, 24157, 24134, 24146, 24058, 24170, 23991, 23674, 23670, 23644, 23663, 23879, 23881, 23970, 23967, 23847, 23771, 23738, 23674, 23674, 23884, 23993, 23983, 24020, 24007, 24027, 23931, 23752, 23718, 23766, 23897, 23847, 23850, 23742, 23558, 23624, 23758, 23754, 24007, 24155, 24170, 24048, 23782, 23786, 23916, 23945, 23876, 23895, 23848, 23675, 23726, 23633, 23730, 23758, 23742, 23690, 23624, 23694, 23655, 23596, 23526, 23570, 23746, 23718, 23686, 23640, 23543, 23414, 23475, 23511, 23551, 23598, 23507, 23567, 23542, 23475, 23554, 23678, 23798, 23750, 23698, 23674, 23654, 23684, 23646, 23582, 23686, 23808, 23726, 23728, 23730, 23707, 23726, 23799, 23467, 23511, 23670, 23727, 23831, 23697, 23638, 23614, 23550, 23591, 23624, 23616, 23568, 23539, 23610, 23614, 23539, 23411, 23403, 23483, 23499, 23460, 23411, 23391, 23403, 23284, 23166, 22703, 22977, 23751, 24482, 25019, 25405, 25575, 25245, 24751, 24348, 24000, 23895, 23889, 23999, 24157, 24021, 24025, 23859, 23801, 23734, 23698, 23728, 23859, 23945, 23961, 23943, 23904, 23799, 23873, 23939, 23850, 23742, 23736, 23679, 23686, 23626, 23880, 23963, 23905, 23840, 23758, 23826, 23920, 23855, 23799, 23696, 23566, 23596, 23531, 23507, 23363, 23427, 23375, 23575, 23799, 23977, 24098, 24074, 23967, 23694, 23507, 22885, 23267, 23847, 24234, 24226, 24322, 24314, 24132, 23969, 23702, 23628, 23133, 22493, 23384, 24218, 25007, 25698, 26238, 26260, 26164, 25659, 25367, 25407, 25463, 25274, 25023, 24675], [24707, 24691, 24803, 24795, 24828, 24695, 24701, 24556, 24620, 24458, 24426, 24540, 24774, 24635, 24522, 24514, 24506, 24482, 24390, 24306, 24338, 24352, 24332, 24314, 24322, 24482, 24444, 24363, 24298, 24148, 24290, 24576, 24775, 24620, 24421, 24298, 24314, 24238, 24213, 24254, 24357, 24355, 24372, 24370, 24322, 24279, 24206, 24258, 24164, 24228, 24251, 24230, 24292, 24298, 24306, 24319, 24170, 24197, 24122, 24196, 24215, 24212, 24090, 24236, 24031, 24082, 24148, 24130, 24093, 24062, 24039, 24059, 24027, 24048, 24162, 24278, 24368, 24376, 24346, 24419, 24460, 24435, 24419, 24364, 24262, 24196, 24222, 24210, 24106, 24126, 24210, 24290, 24254, 24186, 24203, 24244, 24160, 24222, 24183, 23979, 23978, 24001, 23887, 23905, 23999, 24083, 24138, 24054, 24242, 24206, 24066, 24048, 24150, 24172, 24198, 24171, 24173, 24180, 24202, 24050, 24102, 24090, 24136, 23782, 23944, 24146, 24116, 24054, 24016, 23983, 23977, 23999, 23979, 24054, 24122, 24083, 24136, 24076, 24050, 24156, 24039, 24058, 24090, 24140, 24122, 24077, 24059, 24050, 24106, 24262, 24368, 24306, 24282, 24206, 24187, 24142, 24266, 24262, 24068, 24104, 24007, 23839, 23897, 23943, 24050, 24160, 24170, 24141, 24114, 24020, 24025, 23838, 23863, 23940, 23975, 24050, 24094, 23967, 23955, 23967, 24031, 23824, 23718, 23795, 23859, 23849, 23762, 23773, 23849, 23937, 23980, 24041, 24015, 24004, 24090, 24032, 24015, 24102, 24164, 24172, 24093, 24060, 24066, 24062, 24032, 23907, 23871, 23817, 23882, 24058, 24066, 24179, 24008, 23811, 23766, 23753, 23746, 23919, 24090, 24170, 24250, 24212, 24174, 24098, 24015, 24083, 24196, 24234, 24096, 24066, 24108, 24040, 23866, 23759, 23905, 23964, 23953, 23961, 23951, 24011, 24031, 24058, 23987, 24007, 24135, 24122, 24083, 24076, 24027, 23999, 23963, 23916, 23951, 23919, 23919, 23900], [23951, 23943, 23919, 24058, 24050, 23875, 23840, 24064, 24116, 24123, 24070, 24058, 23976, 24027, 24066, 24032, 23970, 23943, 23881, 23750, 23864, 23935, 23915, 23943, 24033, 24002, 23758, 23798, 23742, 23658, 23704, 23847, 24031, 24061, 24023, 23967, 23866, 23707, 23515, 23895, 24186, 24290, 24266, 24274, 24207, 24132, 24102, 24138, 23975, 23976, 23955, 23935, 23923, 23984, 24102, 24047, 23972, 23841, 23815, 23831, 23920, 23592, 23678, 23743, 23574, 23710, 23654, 23562, 23324, 23873, 23882, 24126, 24246, 24150, 24090, 24138, 23263, 23215, 23078, 23879, 24637, 25249, 25766, 25921, 25866, 25809, 25761, 25628, 25320, 25143, 25012, 24781, 24813, 24723, 24607, 24604, 24627, 24542, 24546, 24494, 24613, 24653, 24663, 24522, 24474, 24556, 24715, 24687, 24583, 24663, 24776, 24885, 24967, 24971, 24868, 24811, 24731, 24588, 24535, 24458, 24487, 24514, 24554, 24518, 24160, 24190, 24218, 24204, 24275, 24178, 24059, 24130, 24237, 24234, 24248, 24254, 24226, 24210, 24154, 24180, 24282, 24362, 24388, 24374, 24262, 24214, 24164, 24023, 24098, 24091, 24061, 24039, 24112, 24138, 24023, 24039, 24070, 24041, 23905, 23642, 23805, 24252, 24514, 24418, 24366, 24490, 24563, 24492, 24362, 24250, 24222, 24179, 24134, 24015, 23850, 23993, 24104, 23935, 24032, 23815, 23841, 24031, 24099, 24092, 24156, 24096, 24025, 23915, 23829, 23734, 23991, 24247, 24410, 24476, 24250, 24051, 24047, 24003, 23836, 23963, 23969, 23694, 24082, 24323, 24426, 24286, 24178, 24284, 24482, 24588, 24583, 24530, 24442, 24001, 23863, 23851, 23969, 23964, 23904, 24118, 24092, 24126, 24189, 24236, 24277, 24274, 24182, 24160, 24094, 24048, 23937, 23766, 23790, 23817, 23784, 23807, 23968, 24011, 24141, 24250, 24323, 24326, 24127, 23881, 23642, 23726, 23706, 23742, 23674, 23686, 23831, 24077, 24074, 23925, 23702, 23919], [24048, 23979, 23883, 23808, 23895, 24015, 24000, 23891, 23794, 23718, 23599, 23673, 23782, 23799, 23872, 23905, 23710, 23632, 23667, 23632, 23571, 23425, 23416, 23657, 23852, 23681, 23495, 23854, 23871, 24318, 24615, 24827, 24903, 24830, 24695, 24522, 24041, 24090, 24214, 24326, 24298, 24250, 24172, 24104, 24058, 23932, 24001, 24080, 24058, 23991, 23883, 23887, 23879, 23813, 23596, 24011, 23955, 24167, 24290, 24346, 24298, 24258, 24155, 23975, 23435, 23628, 23943, 24150, 24138, 23726, 23666, 23649, 23647, 23758, 23734, 23379, 23525, 23544, 23640, 23658, 23720, 23622, 23452, 23379, 23379, 23325, 23136, 23198, 23774, 24274, 24627, 24811, 24944, 24956, 24995, 25109, 25197, 24987, 24607, 24422, 24226, 24118, 23961, 23903, 23927, 24039, 24064, 24122, 24074, 24027, 24047, 24138, 23993, 23827, 23815, 23772, 23480, 23523, 23742, 23778, 23704, 23835, 23792, 23873, 23979, 24022, 23863, 23911, 23738, 23523, 23557, 23662, 23851, 23938, 23903, 23714, 23595, 23624, 23629, 23622, 23507, 23451, 23533, 23612, 23687, 23766, 23662, 23587, 23525, 23526, 23525, 23443, 23411, 23199, 23655, 24001, 24039, 23907, 23708, 23670, 23632, 23413, 23361, 23255, 23582, 23801, 23887, 23683, 23602, 23808, 23718, 23640, 23480, 23469, 23707, 23859, 24027, 24048, 23975, 23903, 23750, 23646, 23600, 23531, 23468, 23459, 23591, 23610, 23670, 23654, 23554, 23412, 23307, 23343, 23574, 23059, 23267, 23501, 23817, 24058, 24366, 24571, 24610, 24346, 23985, 23459, 23598, 23702, 23798, 23867, 23959, 24003, 23994, 23911, 23848, 23662, 23476, 23355, 23554, 23718, 23742, 23421, 23387, 23487, 23499, 23568, 23678, 23820, 23871, 23857, 23920, 23959, 24051, 24106, 24007, 23831, 23718, 23687, 23702, 23698, 23602, 23694, 23811, 23895, 23903, 23888, 23924, 23905, 23828, 23702, 23698, 23211, 23539, 23803, 24138, 24406], [24448, 24434, 24170, 23843, 23817, 23852, 23959, 23829, 23766, 23746, 23646, 23664, 23681, 23652, 23711, 23708, 23488, 23517, 23646, 23702, 23679, 23416, 23275, 23183, 23095, 23235, 23373, 23590, 23859, 24226, 24474, 24763, 24959, 25109, 25130, 24787, 23884, 23646, 23494, 23325, 23372, 23448, 23587, 23611, 23531, 23213, 23283, 23392, 23151, 23067, 23606, 24022, 24402, 24610, 24432, 23847, 23897, 23917, 23694, 23662, 23658, 23403, 23212, 23243, 23508, 23726, 24142, 24438, 24685, 24829, 25089, 25347, 25567, 25717, 25649, 25409, 25087, 24855, 24442, 23969, 23562, 23598, 23598, 23614, 23615, 23707, 23864, 23979, 24074, 24210, 24218, 24212, 24172, 24048, 23826, 23672, 23478, 23292, 23065, 23258, 23807, 24254, 24663, 24860, 24498, 24027, 23726, 23446, 23323, 23824, 24274, 24611, 24893, 25151, 25328, 25361, 25290, 24991, 24174, 23411, 23347, 23009, 23368, 23686, 23840, 23843, 23231, 23339, 23663, 23570, 23456, 23303, 23187, 22937, 23139, 23427, 23805, 23905, 23363, 23438, 23714, 24154, 24573, 24983, 25221, 25273, 25205, 24134, 23650, 23435, 23224, 23091, 22969, 23327, 23710, 24154, 24466, 24868, 25271, 25629, 26001, 26292, 26652, 26655, 26435, 25903, 25584, 25363, 24851, 24362, 24346, 24176, 24114, 23979, 23686, 23515, 23323, 23387, 23199, 23450, 23540, 23387, 23187, 23185, 23159, 23188, 23307, 23421, 23782, 23855, 23558, 23220, 23726, 24315, 24647, 24835, 24910, 24751, 24442, 23742, 23379, 23477, 23578, 23451, 23507, 23604, 23744, 23754, 23704, 23501, 23468, 23610, 23582, 23088, 23147, 23607, 23915, 24058, 23795, 23380, 23345, 23443, 23533, 23623, 23730, 23620, 23203, 23211, 23308, 23568, 23793, 23450, 23083, 23198, 23427, 23721, 23927, 24039, 24064, 23849, 23440, 23420, 23284, 23211, 23383, 23714, 23892, 24090, 24298, 24556, 24853, 25223, 25568, 25826, 25806, 25969], [26355, 26530, 26593, 26669, 26816, 26863, 26708, 26212, 25721, 25237, 25053, 24767, 24450, 24266, 24130, 24082, 23887, 23710, 23730, 24041, 24242, 24338, 24470, 24587, 24484, 24214, 23995, 23891, 23834, 23935, 23987, 24002, 23790, 23620, 23662, 23794, 23697, 23736, 23638, 23731, 23759, 23710, 23790, 23841, 23811, 23760, 23752, 23435, 23303, 23558, 23667, 23618, 23219, 23377, 23782, 24118, 24426, 24412, 24134, 23863, 23440, 23325, 23342, 23329, 23372, 23630, 23819, 23816, 23558, 23477, 23173, 23527, 23820, 24082, 24308, 24088, 23467, 23047, 23276, 23622, 24199, 24805, 25417, 26027, 26621, 27160, 27160, 27276, 26865, 26776, 26236, 26098, 25841, 25373, 25387, 25233, 25347, 25601, 25475, 25317, 25189, 25102, 24817, 24519, 24236, 23979, 24067, 24059, 23939, 23790, 23975, 24102, 24162, 24138, 23868, 23641, 23816, 24174, 24307, 24447, 24458, 24466, 24370, 24007, 23895, 24021, 24138, 24125, 24007, 24118, 24186, 24238, 23949, 23610, 23824, 24082, 24134, 24074, 24218, 23976, 23614, 23887, 24140, 24266, 24298, 24326, 24348, 24398, 24484, 24334, 24170, 24156, 24097, 23972, 23799, 23754, 23719, 23804, 23840, 23728, 23794, 23650, 23648, 23866, 24027, 24142, 24086, 23889, 23790, 23680, 23437, 23550, 23668, 24008, 24250, 24242, 24298, 23912, 23566, 23345, 23562, 23828, 24016, 24120, 24267, 24368, 24350, 24258, 23991, 23977, 24115, 24354, 24597, 24830, 25059, 25281, 25677, 26160, 26708, 27272, 27697, 27908, 27912, 27380, 27220, 27128, 27201, 26854, 26446, 26073, 25861, 25431, 25117, 24833, 24483, 24506, 24723, 25005, 25133, 25257, 25209, 25213, 24987, 24701, 24571, 24575, 24593, 24671, 24647, 24574, 24564, 24562, 24574, 24725, 24647, 24458, 24360, 24394, 24401, 24407, 24364, 24450, 24402, 24442, 24292, 24090, 23999, 24032, 24106, 24219, 24192, 23936, 23722, 23656, 23675, 23758], [23714, 23595, 23887, 23943, 24082, 24262, 24538, 24749, 25134, 25583, 26025, 26502, 27132, 27620, 27684, 27255, 26352, 25859, 25721, 25593, 25370, 25178, 25023, 24875, 24603, 24609, 24532, 24404, 24356, 24346, 24020, 24026, 24342, 24359, 24554, 24591, 24378, 24122, 23843, 23823, 23863, 23804, 24142, 24174, 23967, 23742, 23393, 23816, 24203, 24428, 24771, 24591, 24522, 24651, 24790, 24845, 25012, 25269, 25666, 26184, 26873, 27598, 28000, 27968, 28258, 27823, 27421, 27105, 27017, 26897, 26662, 26620, 26460, 26196, 26026, 25906, 25855, 25746, 25563, 25367, 25353, 25415, 24975, 25239, 25327, 25439, 25583, 25681, 25649, 25511, 25497, 25375, 25182, 24947, 24855, 24805, 24803, 24431, 24827, 25027, 25117, 24482, 24171, 24490, 24597, 24741, 24743, 24330, 24422, 24603, 24887, 25078, 25298, 25399, 25471, 25417, 25303, 25086, 24988, 24779, 24659, 24467, 24474, 24510, 24388, 24243, 24258, 24251, 24159, 24238, 24339, 24247, 23827, 24352, 24652, 24878, 24894, 24767, 24426, 24130, 24166, 24258, 24155, 24007, 24106, 24276, 24585, 24715, 24609, 24675, 24595, 24619, 24733, 24679, 24514, 24363, 24266, 24198, 24035, 24019, 24002, 23863, 23873, 23931, 24130, 24246, 24402, 24284, 23892, 23728, 23554, 23855, 24074, 24444, 24873, 25325, 25726, 26174, 26761, 27286, 27806, 27846, 27794, 27480, 26417, 25698, 25390, 25405, 25326, 25205, 24955, 24827, 24841, 24659, 24450, 24564, 24795, 24911, 24919, 24891, 24789, 24927, 25012, 24847, 24717, 24691, 24619, 24446, 24563, 24596, 24467, 24396, 24395, 24575, 24743, 24577, 24534, 24506, 24254, 24234, 24123, 24298, 24556, 24486, 24191, 24107, 24086, 24125, 24039, 23876, 24039, 24098, 23988, 24041, 24238, 24322, 24328, 24422, 24526, 24530, 23936, 23805, 23795, 23742, 23944, 24234, 24619, 24975, 25320, 25579, 25884, 26367, 26939, 27484, 28002, 27099], [26200, 25745, 25077, 25263, 25019, 25113, 25348, 25443, 25438, 25455, 25297, 24907, 24811, 24759, 24740, 24739, 24891, 24975, 25036, 25061, 24771, 24593, 24583, 24407, 24354, 24651, 24669, 24595, 24246, 24130, 24009, 24147, 24048, 24026, 23915, 23815, 24009, 24206, 24276, 24224, 24318, 24226, 24324, 24139, 23915, 23871, 23867, 23970, 24174, 24015, 23927, 23892, 23881, 24047, 24058, 24017, 23927, 23750, 23503, 23658, 24059, 24446, 24763, 24926, 25028, 25138, 24863, 24410, 24107, 23944, 23851, 23915, 24027, 23971, 23542, 23754, 24418, 25045, 25662, 26304, 26941, 27552, 28154, 28402, 27204, 26697, 26497, 26489, 25971, 26089, 25869, 26085, 26041, 25729, 25339, 25335, 24947, 25097, 24542, 24454, 24572, 24250, 24346, 24267, 24378, 24326, 24498, 24319, 24514, 24655, 24731, 24466, 24360, 24387, 24307, 24396, 24446, 24358, 24358, 24284, 24155, 23662, 23904, 24466, 24989, 25391, 25658, 25905, 26911, 27413, 27750, 27904, 28036, 27842, 27154, 26764, 26530, 26273, 25858, 25306, 25189, 24950, 24707, 24691, 24430, 24615, 24735, 24676, 24835, 24925, 25023, 25023, 25089, 25285, 25261, 25069, 24853, 24647, 24424, 24186, 24612, 24793, 24819, 24603, 24611, 24274, 24263, 24395, 24321, 24170, 24334, 24292, 24292, 24090, 24090, 24162, 23911, 23815, 23804, 23938, 24266, 24191, 24396, 24326, 24258, 24188, 24106, 24047, 23734, 23850, 23932, 23868, 23991, 24058, 24118, 24108, 24043, 23956, 23746, 23790, 24032, 24282, 24452, 24590, 24668, 24617, 24175, 23903, 24011, 24047, 24402, 24739, 25109, 25507, 25907, 26301, 26545, 26577, 26414, 25985, 25159, 24418, 23719, 23711, 24274, 24563, 24615, 24306, 23571, 24074, 24514, 24775, 25059, 24893, 24699, 24405, 24366, 24250, 23999, 23805, 23805, 23447, 23791, 24362, 24865, 25305, 25560, 25661, 25794, 25709, 24479, 23680, 23662, 24275, 24747, 25051], [25749, 26220, 26741, 27051, 27302, 27706, 28066, 28117, 28270, 27972, 26869, 26184, 26066, 25861, 25607, 25207, 24972, 24651, 24787, 24841, 24833, 24852, 24979, 25035, 24675, 24470, 24423, 24290, 24186, 24150, 24226, 24427, 24450, 24306, 24090, 23999, 24064, 24168, 24218, 24398, 24583, 24979, 25173, 25359, 25575, 25758, 25977, 26057, 26100, 25589, 25395, 25094, 24724, 24219, 23988, 23975, 24163, 24351, 24571, 24560, 24458, 24334, 24110, 24130, 24202, 24130, 24063, 23991, 24007, 23967, 24058, 24186, 24322, 24476, 24603, 24486, 24563, 24442, 24450, 24314, 24226, 24194, 23975, 23758, 23834, 24196, 24166, 24571, 24957, 25145, 25253, 25385, 25615, 25885, 25996, 26005, 26215, 26434, 26853, 27348, 27886, 28260, 28535, 28510, 28124, 28036, 28012, 28104, 28330, 28530, 28580, 27955, 27384, 27078, 26111, 25205, 25336, 25537, 25699, 25675, 25527, 25304, 25181, 24963, 24904, 24955, 24877, 24835, 25029, 25003, 24844, 24620, 24662, 24476, 24542, 24771, 24833, 24678, 24637, 24627, 24604, 24530, 24460, 24518, 24541, 24595, 24803, 24872, 24875, 24866, 24813, 24647, 24611, 24709, 24821, 24836, 24829, 24823, 24851, 24979, 25113, 25213, 25266, 25224, 25067, 24727, 24346, 24292, 24364, 24526, 24815, 25004, 25019, 25019, 24815, 24653, 24631, 24644, 24725, 24631, 24650, 24629, 24442, 24435, 24452, 24542, 24595, 24647, 24667, 24727, 24815, 24669, 24414, 24298, 24346, 24310, 24286, 24258, 24274, 24202, 24186, 24330, 24358, 24435, 24460, 24506, 24454, 24404, 24054, 23995, 24434, 24623, 24843, 25052, 25086, 24863, 24715, 24222, 23969, 23722, 24333, 24989, 25639, 26292, 26934, 27544, 28028, 28516, 28774, 28494, 27452, 27148, 27201, 27222, 26969, 26669, 26216, 26229, 26393, 26453, 26438, 26417, 26304, 26196, 26178, 26240, 26212, 26216, 26124, 25946, 26072, 26190, 25937, 25713, 25614, 25443], [25660, 25531, 25265, 25019, 25087, 25206, 25199, 25146, 25181, 25218, 25043, 24900, 24606, 24790, 25019, 25214, 25225, 25059, 24965, 24787, 24619, 24486, 24411, 24404, 24420, 24399, 24546, 24631, 24641, 24422, 24204, 24302, 24384, 24445, 24502, 24506, 24534, 24484, 24478, 24500, 24374, 24301, 24182, 24143, 24262, 24379, 24560, 24707, 24852, 24903, 24908, 24752, 24573, 24202, 24151, 24218, 24123, 23940, 23566, 23871, 23730, 24394, 25135, 25882, 26616, 27584, 28294, 28950, 28846, 28794, 29050, 29143, 28878, 28790, 28495, 28104, 27892, 27623, 27806, 27886, 27822, 27916, 27924, 27846, 27980, 28188, 28202, 28278, 28294, 28268, 28186, 28114, 27643, 27596, 27465, 27295, 27075, 26933, 26605, 26154, 25893, 25769, 25773, 25785, 25519, 25325, 25521, 25515, 25551, 25649, 25890, 26104, 26108, 25793, 25569, 25669, 25941, 26154, 26348, 26554, 26640, 26638, 26630, 26732, 26632, 26541, 26401, 26097, 25771, 25785, 25846, 25841, 25777, 25641, 25559, 25465, 25295, 25285, 25383, 25433, 25475, 25621, 25849, 25825, 25714, 25579, 25617, 25586, 25717, 25801, 25882, 25937, 25949, 26065, 26164, 25979, 25717, 25367, 25162, 25369, 25603, 25833, 26098, 26204, 26340, 26489, 26636, 26808, 26950, 26833, 26868, 26862, 26561, 26532, 25915, 25467, 25475, 25682, 25842, 25972, 26159, 26240, 26361, 26348, 26176, 26033, 25935, 25770, 25429, 25293, 25143, 25151, 25207, 25238, 25253, 25186, 25187, 25229, 25269, 25407, 25085, 24869, 25117, 25325, 25379, 25185, 25109, 25112, 25379, 25444, 25465, 25583, 25621, 25423, 25507, 25665, 25857, 26050, 26188, 26312, 26399, 26357, 26141, 26249, 26371, 26498, 26565, 26716, 26881, 26969, 27137, 27401, 27540, 27750, 27890, 27847, 27826, 27696, 27588, 27457, 27118, 26937, 26844, 26868, 26727, 26465, 26268, 25967, 25845, 25839, 25837, 25881, 25761, 25641, 25479, 25317], [25277, 25357, 25329, 25265, 25367, 25495, 25289, 25149, 25047, 25113, 25277, 25157, 25160, 25077, 24955, 24819, 24959, 25127, 25293, 25265, 25222, 25189, 24944, 24851, 24811, 24863, 24971, 25043, 24980, 24969, 24923, 24803, 24691, 24623, 24619, 24482, 24430, 24523, 24641, 24705, 24647, 24561, 24739, 24948, 25111, 25224, 25237, 25327, 25431, 25519, 25588, 25625, 25611, 25585, 25205, 24975, 24797, 24771, 24683, 24699, 24715, 24796, 24749, 24763, 24733, 25023, 25237, 25403, 25085, 24490, 24546, 24655, 24832, 25027, 25153, 25129, 24955, 24859, 24727, 24627, 24384, 24358, 24422, 24490, 24671, 24859, 25020, 25043, 25117, 25109, 24763, 24712, 24563, 24567, 24603, 24649, 24661, 24643, 24542, 24354, 24356, 24194, 24431, 24723, 24997, 25133, 25302, 25320, 25313, 25279, 25141, 24789, 24701, 24530, 24230, 24370, 24490, 24542, 24707, 24835, 24923, 24971, 24983, 25162, 25152, 25222, 25075, 25005, 24903, 24776, 24728, 24791, 24819, 24741, 24561, 24426, 24498, 24540, 24571, 24486, 24478, 24635, 24833, 24887, 24860, 24711, 24583, 24556, 24475, 24362, 24320, 24573, 24747, 24743, 24707, 24719, 24723, 24743, 24693, 24756, 24781, 24603, 24470, 24426, 24482, 24430, 24413, 24314, 24250, 24234, 24260, 24469, 24615, 24677, 24699, 24739, 24813, 24811, 24685, 24498, 24356, 24269, 24300, 24320, 24302, 24431, 24494, 24571, 24661, 24708, 24571, 24435, 24194, 24132, 24202, 24392, 24564, 24747, 24813, 24893, 24856, 24813, 24590, 24172, 24418, 24624, 24663, 24732, 24635, 24627, 24538, 24146, 24314, 24536, 24757, 24871, 24943, 25028, 25037, 24980, 24823, 24657, 24518, 24476, 24500, 24444, 24322, 24279, 24267, 24316, 24302, 24514, 24686, 24867, 24919, 24864, 24799, 24803, 24816, 24739, 24647, 24655, 24667, 24583, 24444, 24341, 24352, 24379, 24371, 24358, 24342, 24482, 24571, 24302, 24036, 23821], [25039, 25700, 26377, 27065, 27720, 28435, 28990, 29421, 29682, 29966, 29973, 29848, 29522, 29062, 28460, 27796, 27117, 26518, 26764, 26434, 26344, 26236, 26361, 26348, 26130, 25837, 25747, 25854, 25279, 25423, 25575, 26035, 26467, 26937, 27013, 26700, 26493, 26505, 26417, 26465, 26547, 26620, 26672, 26750, 26652, 26561, 26508, 26465, 26411, 26152, 26049, 26133, 26342, 26537, 26405, 25982, 25828, 25593, 25369, 25654, 25881, 25811, 25809, 25871, 25853, 25472, 25201, 25309, 25363, 25419, 25601, 25801, 26051, 26244, 26373, 26521, 26634, 26664, 26748, 26208, 26019, 25869, 25731, 25456, 25375, 25367, 25335, 25277, 25129, 25145, 25176, 25154, 25169, 25317, 25496, 25706, 25734, 25628, 25612, 25713, 25714, 25645, 25553, 25447, 25166, 25095, 25053, 25173, 25031, 24897, 24844, 24985, 25223, 25373, 25423, 25347, 25233, 24959, 24843, 24392, 24596, 25081, 25343, 25497, 25667, 25813, 25953, 25969, 25411, 25285, 25222, 25249, 25157, 24933, 24811, 25019, 25224, 25237, 25007, 24959, 24625, 24442, 24763, 24980, 25126, 25310, 25367, 25473, 25410, 25078, 24667, 24528, 24460, 24563, 24811, 25089, 25229, 25200, 24763, 24771, 24218, 24426, 24765, 24779, 25039, 25367, 25551, 24871, 24868, 24552, 24554, 24891, 25215, 25432, 25618, 25417, 25309, 25141, 24983, 24739, 24592, 24648, 24370, 24583, 24691, 24813, 24995, 25101, 25193, 25075, 24629, 24266, 24397, 24781, 25052, 25093, 25125, 24915, 24510, 24276, 24406, 24562, 24823, 24546, 24883, 25233, 25515, 25786, 26065, 26408, 26609, 26772, 26789, 26868, 26746, 26622, 26271, 25937, 25360, 24691, 24741, 24491, 24397, 24556, 24779, 24883, 24883, 24731, 24771, 24564, 24326, 24603, 24927, 25165, 25225, 25358, 25255, 24939, 24603, 24506, 24414, 24442, 24354, 24262, 24134, 24178, 24310, 24066, 24330, 24631, 24887, 24859, 24951, 24650, 24593, 24442], [24329, 24530, 24891, 25048, 25355, 25658, 25898, 26102, 26029, 25874, 25095, 24407, 24571, 24684, 24587, 24348, 24530, 24435, 24072, 24058, 23915, 24238, 24587, 24707, 24767, 24739, 24667, 24773, 24709, 24589, 24571, 24188, 24418, 24516, 24338, 24203, 24124, 23795, 24186, 24546, 24795, 24949, 24845, 24683, 24677, 24915, 25004, 24975, 24823, 24711, 24502, 24278, 24178, 24156, 24206, 24298, 24403, 24502, 24312, 23963, 23758, 23819, 23951, 23935, 23586, 24017, 24402, 24572, 24931, 25471, 26050, 26700, 27300, 27886, 28532, 29130, 29828, 30521, 30937, 30226, 29297, 29353, 29313, 29144, 29046, 29060, 29094, 29146, 29118, 28934, 28782, 28522, 28420, 28394, 28330, 28242, 28254, 28253, 28194, 28116, 28150, 28187, 27928, 27556, 27556, 27410, 27228, 27181, 26764, 26756, 26713, 26736, 26748, 27156, 27434, 27366, 27332, 27334, 27420, 27416, 27388, 27324, 27085, 27128, 27095, 26957, 26937, 26773], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], []]
 
+# or load a DUMP from stmV2.1.py saved to a file (same rows as the printed list,
+# the unused half of the first/last row is just zeros):
+#raw = open("image.bin", "rb").read()
+#data = np.frombuffer(raw[raw.index(b"\n") + 1:], dtype='<u2').reshape(-1, 256).tolist()
 
 print(len(data), len(data[0]), len(data[1]), len(data[2]),len(data[3]))
 
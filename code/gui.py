@@ -3,8 +3,9 @@ from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import numpy as np
-import time
-import threading, queue, time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import struct, binascii, re, sys
 import serial
 
 
@@ -13,39 +14,184 @@ def _from_rgb(rgb):
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
-class SerialReader(threading.Thread):
+# Binary frame: SYNC (AA 55) | N (uint16 LE) | N x float32 LE samples | CRC16 (uint16 LE)
+# CRC is CRC-16/CCITT (binascii.crc_hqx, init 0xFFFF) over the N field + samples.
+FRAME_SYNC = b'\xAA\x55'
+MAX_FRAME = 4096  # largest N accepted (also the FrameRing slot size)
+
+
+def parse_binary_frames(buf, dt=0.005):
+    """
+    parse_fn for SerialReader: pull every complete binary frame out of buf.
+    Samples are viewed with np.frombuffer (no per-sample Python work); x is the
+    time base of the frame, ending at 0 s with dt between samples.
+    Returns (list[(x, y)], remaining_buf).
+    """
+    frames = []
+    pos = 0
+    while True:
+        start = buf.find(FRAME_SYNC, pos)
+        if start < 0:
+            # keep a trailing AA: it may be the first half of the next sync word
+            return frames, bytearray(buf[-1:] if buf[-1:] == FRAME_SYNC[:1] else b'')
+        if len(buf) - start < 4:
+            break
+        (n,) = struct.unpack_from('<H', buf, start + 2)
+        if n == 0 or n > MAX_FRAME:
+            pos = start + 1  # implausible N: false sync, don't wait for its "payload"
+            continue
+        end = start + 4 + 4 * n + 2
+        if len(buf) < end:
+            break
+        (crc,) = struct.unpack_from('<H', buf, end - 2)
+        with memoryview(buf) as mv:
+            ok = binascii.crc_hqx(mv[start + 2:end - 2], 0xFFFF) == crc
+        if not ok:
+            pos = start + 1  # false sync or corrupted frame: resync after it
+            continue
+        # copy out of buf (one memcpy) so the reader can keep growing its buffer
+        y = np.frombuffer(buf, dtype='<f4', count=n, offset=start + 4).copy()
+        x = np.arange(-n, 0) * dt
+        frames.append((x, y))
+        pos = end
+    return frames, buf[start:]
+
+
+_LINE_OK_RE = re.compile(rb'^\s*LINE\s+OK\b', re.IGNORECASE)
+_N_RE = re.compile(rb'\bN=(\d+)')
+_ENC_B64U16_RE = re.compile(rb'\bENC=b64u16\b', re.IGNORECASE)
+_B64_STRICT = {"strict_mode": True} if sys.version_info >= (3, 11) else {}
+
+
+def parse_b64u16_lines(buf, dt=0.005):
+    """
+    parse_fn for SerialReader, text protocol: a 'LINE OK N=.. ENC=b64u16' header
+    followed by one base64 line (raw uint16 LE ADC codes) becomes one frame.
+    Every other line is skipped; a payload that doesn't decode to exactly N codes
+    is dropped. Returns (list[(x, y)], remaining_buf).
+    """
+    frames = []
+    pos = 0
+    while True:
+        nl = buf.find(b'\n', pos)
+        if nl < 0:
+            break
+        line = bytes(buf[pos:nl])
+        n = _N_RE.search(line)
+        if not (_LINE_OK_RE.match(line) and n and _ENC_B64U16_RE.search(line)):
+            pos = nl + 1
+            continue
+        end = buf.find(b'\n', nl + 1)
+        if end < 0:
+            break  # payload not complete yet: keep the header for next time
+        payload = bytes(buf[nl + 1:end]).strip()
+        pos = end + 1
+        try:
+            codes = np.frombuffer(binascii.a2b_base64(payload, **_B64_STRICT), dtype='<u2')
+        except (binascii.Error, ValueError):
+            continue
+        if codes.size != int(n.group(1)):
+            continue
+        y = (codes.astype(np.float32) - 32768.0) * (1.0 / 4096.0)
+        x = np.arange(-y.size, 0) * dt
+        frames.append((x, y))
+    return frames, buf[pos:]
+
+
+class FrameRing:
     """
-    Background serial reader.
-    Reads from a serial port and pushes (x_array, y_array) to a queue.
+    Shared-memory ring of float32 frames, SerialReader process -> GUI process.
+    The writer fills slot head % nframes, then bumps head. The GUI only takes the
+    newest frame and remembers it in tail, so when it falls behind the stale
+    frames are simply overwritten (never blocks the reader).
     """
-    def __init__(self, port, baud, out_queue, stop_event, parse_fn, *, timeout=0.5):
+    def __init__(self, nframes=8, max_frame=MAX_FRAME, dt=0.005):
+        self.nframes, self.max_frame, self.dt = nframes, max_frame, dt
+        self.shm = shared_memory.SharedMemory(create=True, size=4 * nframes * max_frame)
+        self.lens = mp.Array('I', nframes, lock=False)
+        self.head = mp.Value('Q', 0)
+        self.tail = mp.Value('Q', 0)
+        self._view()
+
+    def _view(self):
+        self.buf = np.ndarray((self.nframes, self.max_frame), dtype=np.float32, buffer=self.shm.buf)
+
+    def __getstate__(self):
+        # sent to the reader process: re-attach to the shared block there, don't copy it
+        state = self.__dict__.copy()
+        del state["buf"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._view()
+
+    def put(self, y):
+        """Writer side (one process only)."""
+        n = min(len(y), self.max_frame)
+        h = self.head.value
+        slot = h % self.nframes
+        self.buf[slot, :n] = y[:n]
+        self.lens[slot] = n
+        self.head.value = h + 1
+
+    def latest(self):
+        """GUI side: newest unseen frame as (x, y) copies, or None."""
+        h = self.head.value
+        if h == self.tail.value:
+            return None
+        slot = (h - 1) % self.nframes
+        n = self.lens[slot]
+        y = self.buf[slot, :n].copy()
+        if self.head.value - h >= self.nframes - 1:
+            return None  # writer lapped us mid-copy; the next poll takes a newer one
+        self.tail.value = h
+        return np.arange(-n, 0) * self.dt, y
+
+    def close(self, unlink=False):
+        del self.buf
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class SerialReader(mp.Process):
+    """
+    Background serial reader, in its own process so parsing never competes with
+    the GUI for the GIL. Reads from a serial port and writes every parsed frame's
+    y array into a FrameRing.
+    """
+    def __init__(self, port, baud, ring, stop_event, parse_fn, *, timeout=0.5):
         super().__init__(daemon=True)
-        self.q = out_queue
+        self.port, self.baud, self.timeout = port, baud, timeout
+        self.ring = ring
         self.stop_event = stop_event
-        self.parse_fn = parse_fn
-        self.ser = serial.Serial(port=port, baudrate=baud, timeout=timeout)
+        self.parse_fn = parse_fn  # module-level function, so it pickles for spawn
 
     def run(self):
+        # opened here, in the child: a Serial handle can't be passed between processes
+        ser = serial.Serial(port=self.port, baudrate=self.baud, timeout=self.timeout)
+        if hasattr(ser, "set_buffer_size"):
+            # Windows only: a bigger driver RX buffer so bursts aren't dropped between reads
+            ser.set_buffer_size(rx_size=1 << 17)
         buf = bytearray()
         try:
             while not self.stop_event.is_set():
-                # Blocking read with timeout
-                chunk = self.ser.read(1024)
+                # Take everything already waiting in one call; when nothing is,
+                # block (up to timeout) for one byte, so no sleep is needed
+                chunk = ser.read(max(ser.in_waiting, 1))
                 if chunk:
                     buf.extend(chunk)
                     # Try to parse as many complete frames as available
                     frames, buf = self.parse_fn(buf)  # returns list[(x, y)], remaining_buf
-                    for x_arr, y_arr in frames:
-                        # push newest frame only (optional: push all)
-                        self.q.put((x_arr, y_arr))
-                else:
-                    # No data this cycle; small sleep to avoid tight loop
-                    time.sleep(0.005)
+                    for _, y in frames:
+                        self.ring.put(y)
         finally:
             try:
-                self.ser.close()
+                ser.close()
             except Exception:
                 pass
+            self.ring.close()
 
 
 class STMApp:
@@ -54,6 +200,13 @@ class STMApp:
         self.m.title("Scanning Tunneling Microscope Control")
         self.m.geometry("1400x800")
 
+        # Serial frames -> GUI through shared memory; the GUI only ever takes the newest
+        self.ring = FrameRing()
+        self.stop_ev = mp.Event()
+        self.reader = None
+        #self.reader = SerialReader("COM8", 115200, self.ring, self.stop_ev, parse_binary_frames)
+        #self.reader.start()
+
         # ----------------- LAYOUT -----------------------
         self.side_bar = Frame(self.m, bg='lightgrey', relief='sunken', borderwidth=2)
         self.side_bar.pack(expand=False, fill='y', side='left', anchor='nw')
@@ -71,21 +224,38 @@ class STMApp:
         # Example data
         self.x = np.linspace(-30, 0, 100)
         self.y = np.random.normal(-5, 5, size=100)
-        self.Z = np.random.rand(100, 100)
+        self._rng = np.random.default_rng()
+        self.Z = self._rng.random((100, 100), dtype=np.float32)
 
-        self.ax1.pcolormesh(self.Z)
+        # one image artist for the whole session; grid changes go through set_data
+        self.im1 = self.ax1.imshow(self.Z, origin='lower', interpolation='nearest',
+                                   extent=(0, 100, 0, 100), vmin=0, vmax=1)
         self.ax2.grid()
         self.ax2.set_ylim(-12, 12)
         self.ax2.set_xlim(-30, 0)
-        (self.line2,) = self.ax2.plot(self.x, self.y, label="y vs time")
-
-        # histogram (normalised to max=5)
-        self.hist_patches = []
+        # line + histogram bars are animated: left out of full draws and blitted
+        # over a cached background in update_line_data
+        (self.line2,) = self.ax2.plot(self.x, self.y, label="y vs time", animated=True)
+
+        # histogram (normalised to max=5): fixed bins over the ax2 y-range, bars
+        # created once here and only resized by update_histogram
+        self._hist_bins = np.linspace(-12, 12, 21)
+        # equal-width bins: bin index = (y + off) * scale, counted with bincount
+        self._hist_off = 12.0
+        self._hist_scale = 20 / 24.0
+        self._hist_rects = self.ax2_hist.barh(
+            0.5 * (self._hist_bins[:-1] + self._hist_bins[1:]), np.zeros(20),
+            height=np.diff(self._hist_bins), alpha=0.7, color="tab:red", animated=True
+        ).patches
+        self.ax2_hist.xaxis.set_visible(False)
+        self.ax2_hist.set_ylim(self.ax2.get_ylim())
         self.update_histogram(self.y, norm_max=1)
 
         self.fig.tight_layout(pad=0.0)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.main_area)
+        self._bg2 = None  # ax2 background (ax2_hist is its twin: same bbox)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.toolbar = NavigationToolbar2Tk(self.canvas, self.main_area)
         self.toolbar.update()
@@ -101,6 +271,10 @@ class STMApp:
 
         self.display_duration = 10 # seconds
 
+        # trailing-edge debounce: Tk after() ids of pending grid / time-window updates
+        self._pending_grid = None
+        self._pending_time = None
+
         Label(self.side_bar, text="", bg='lightgrey').pack(pady=5)
 
         # Vertical Stepper Control
@@ -170,6 +344,11 @@ class STMApp:
         # Z-stability
         self.zstab_label = Label(self.side_bar, text="Z-Stability: ", bg='lightgrey', font=("Arial", 12))
         self.zstab_label.pack(pady=5)
+        # per-frame label values are parked here and applied by _flush_labels (<= 5 Hz)
+        self._zstab_std = None
+        self._last_zstab_str = None
+        self._last_zstab_color = None
+        self._labels_pending = False
         self.update_zstab_label(float(np.std(self.y)))
 
         # Progress + Start
@@ -180,6 +359,10 @@ class STMApp:
                                    font=("Arial", 16), command=self.toggle_scan)
         self.start_button.pack(pady=5, ipadx=10, ipady=5, side='bottom')
 
+        # GUI polling of serial frames (~60 Hz cap) + clean exit
+        self.m.after(16, self._poll_serial)
+        self.m.protocol("WM_DELETE_WINDOW", self._on_close)
+
 
         
 
@@ -196,28 +379,38 @@ class STMApp:
         self.update_histogram(self.y, norm_max=5)
 
         self.update_zstab_label(float(np.std(self.y)))
-        self.redraw()
+        self._blit_ax2()
+
+    def _on_draw(self, event):
+        """Re-cache the ax2 background after every full draw (resize, layout, zoom)."""
+        if event.canvas is not self.canvas or self.canvas.is_saving():
+            return  # savefig draws animated artists itself
+        self._bg2 = self.canvas.copy_from_bbox(self.ax2.bbox)
+        self._draw_ax2_artists()
+
+    def _draw_ax2_artists(self):
+        for rect in self._hist_rects:
+            self.ax2_hist.draw_artist(rect)
+        self.ax2.draw_artist(self.line2)
+
+    def _blit_ax2(self):
+        """Repaint only ax2: restore background, draw line + histogram, blit."""
+        if self._bg2 is None:
+            return
+        self.canvas.restore_region(self._bg2)
+        self._draw_ax2_artists()
+        self.canvas.blit(self.ax2.bbox)
 
     def update_histogram(self, y, norm_max=5):
-        """Draw/refresh histogram of y along shared y-axis, normalised so tallest bin == norm_max."""
-        # clear old hist artists from ax2_hist
-        self.ax2_hist.cla()
-        counts, bins, patches = self.ax2_hist.hist(
-            y, bins=20, orientation="horizontal", alpha=0.7, color="tab:red"
-        )
-        if len(counts):
-            max_count = max(counts.max(), 1.0)
-            scale = float(norm_max) / max_count
-            # scale patch widths
-            for rect in patches:
-                rect.set_width(rect.get_width() * scale)
-            self.ax2_hist.set_xlim(0, norm_max)
-        else:
-            self.ax2_hist.set_xlim(0, norm_max)
-
-        # styling & alignment with main y-range
-        self.ax2_hist.xaxis.set_visible(False)
-        self.ax2_hist.set_ylim(self.ax2.get_ylim())
+        """Refresh histogram of y along shared y-axis, normalised so tallest bin == norm_max."""
+        # bin counts in one pass (fixed grid, no edge search); the cached bars just get
+        # new widths (no cla(), no new patches). Out-of-range samples land in the end bins.
+        idx = np.clip(((np.asarray(y) + self._hist_off) * self._hist_scale).astype(np.int32), 0, 19)
+        counts = np.bincount(idx, minlength=20)
+        scale = float(norm_max) / max(counts.max(), 1)
+        for rect, c in zip(self._hist_rects, counts):
+            rect.set_width(c * scale)
+        self.ax2_hist.set_xlim(0, norm_max)
 
     def set_time_window(self, seconds):
         """Adjust the time window on ax2 (x-axis)."""
@@ -225,11 +418,13 @@ class STMApp:
 
 
     def update_scan_grid(self, N):
-        """Regenerate the pcolormesh grid size on ax1 to N x N."""
+        """Resize the ax1 image grid to N x N (reuses the imshow artist)."""
         #print(N)
-        self.ax1.clear()
-        self.Z = np.random.rand(N, N)
-        self.ax1.pcolormesh(self.Z)
+        if self.Z.shape[0] == N:
+            return
+        self.Z = self._rng.random((N, N), dtype=np.float32)
+        self.im1.set_data(self.Z)
+        self.im1.set_extent((0, N, 0, N))
 
     def redraw(self, tight=True):
         if tight:
@@ -252,15 +447,32 @@ class STMApp:
         print(f"[CB] Stepper action -> {action}")
 
     def on_resolution_change(self):
-        self.update_scan_label()
+        self._schedule_scan_label()
 
     def on_zoom_change(self):
+        self._schedule_scan_label()
+
+    def _schedule_scan_label(self):
+        # rapid clicks only rebuild the grid once, 100 ms after the last one
+        if self._pending_grid is not None:
+            self.m.after_cancel(self._pending_grid)
+        self._pending_grid = self.m.after(100, self._apply_scan_label)
+
+    def _apply_scan_label(self):
+        self._pending_grid = None
         self.update_scan_label()
 
     def on_time_scale_drag(self, val):
-        # live drag feedback (no tight_layout to keep it responsive)
+        # live drag feedback (no tight_layout to keep it responsive), coalesced
+        # so a drag across many ticks redraws once it pauses
         self.display_duration = float(val)
-        self.set_time_window(float(val))
+        if self._pending_time is not None:
+            self.m.after_cancel(self._pending_time)
+        self._pending_time = self.m.after(100, self._apply_time_scale)
+
+    def _apply_time_scale(self):
+        self._pending_time = None
+        self.set_time_window(self.display_duration)
         self.canvas.draw_idle()
 
     def on_time_scale_change(self):
@@ -269,6 +481,10 @@ class STMApp:
         self.redraw()
 
     def toggle_scan(self):
+        if self._pending_grid is not None:
+            # a debounced resolution/zoom change is still queued: apply it first
+            self.m.after_cancel(self._pending_grid)
+            self._apply_scan_label()
         if self.start_button.cget('text') == 'Start Scan':
             self.start_button.config(text='Stop Scan', bg='red')
             # self.progress_bar.start()  # real scan would start
@@ -299,9 +515,40 @@ class STMApp:
         self.time_label.config(text=f"Estimated Scan Time: {minutes} min {seconds} s")
         self.redraw()
 
+    def _poll_serial(self):
+        """Take the newest frame from the shared ring, if any, and draw it once (Tk thread)."""
+        last = self.ring.latest()
+        if last is not None:
+            x, y = last
+            self.update_line_data(x, y)
+        self.m.after(16, self._poll_serial)
+
+    def _on_close(self):
+        self.stop_ev.set()
+        if self.reader is not None:
+            self.reader.join(timeout=1.0)
+        self.ring.close(unlink=True)
+        self.m.destroy()
+
     def update_zstab_label(self, std):
-        self.zstab_label.config(text=f"Z-Stability: {std:.2f}")
-        self.zstab_label.config(fg='green' if std < 0.5 else 'red')
+        # called every frame: just remember the value, Tk sees it at most every 200 ms
+        self._zstab_std = std
+        if not self._labels_pending:
+            self._labels_pending = True
+            self.m.after(200, self._flush_labels)
+
+    def _flush_labels(self):
+        self._labels_pending = False
+        std = self._zstab_std
+        text = f"Z-Stability: {std:.2f}"
+        color = 'green' if std < 0.5 else 'red'
+        # only touch the widget when something visible changed (each config re-lays out)
+        if text != self._last_zstab_str:
+            self.zstab_label.config(text=text)
+            self._last_zstab_str = text
+        if color != self._last_zstab_color:
+            self.zstab_label.config(fg=color)
+            self._last_zstab_color = color
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
-from machine import Pin, SPI
+from machine import Pin, SoftSPI
+from array import array
 import time
+import sys
 
 
 stepOut = Pin(0, Pin.OUT)
@@ -11,18 +13,18 @@ stepUp = Pin(4, Pin.IN)
 stepDown = Pin(5, Pin.IN)
 
 dacCS = Pin(17, Pin.OUT)
-sck = Pin(18, Pin.OUT)
-mosi = Pin(19, Pin.OUT)
-
 adcCS = Pin(20, Pin.OUT)
-adcSDO = Pin(21, Pin.IN)
+
+# DAC (LTC2654) and ADC (MCP33131) share SCK and are both SPI mode 0.
+# SoftSPI shifts the bits in C instead of a Python loop per bit. Hardware SPI0
+# would need the ADC SDO on GP16/GP20 (GP21 can only be SPI0 CSn).
+spi = SoftSPI(baudrate=10_000_000, polarity=0, phase=0,
+              sck=Pin(18), mosi=Pin(19), miso=Pin(21))
+adcBuf = bytearray(2)
+dacBuf = bytearray(3)    # reused for every 24-bit DAC packet (no allocation per write)
 
 dacCS.value(1)
 adcCS.value(0)
-sck.value(0)
-mosi.value(0)
-
-image = []
 
 
 # pin change interrupt handler for stepPulses, steupUp and stepDown
@@ -52,16 +54,11 @@ stepUp.irq(trigger=Pin.IRQ_RISING, handler=stepUpPulseHandler)
 stepDown.irq(trigger=Pin.IRQ_RISING, handler=stepDownPulseHandler)
 
 def dacShiftOut(value):
+    dacBuf[0] = (value >> 16) & 0xFF
+    dacBuf[1] = (value >> 8) & 0xFF
+    dacBuf[2] = value & 0xFF
     dacCS.value(0)
-    time.sleep_us(1)
-    for i in range(24):
-        bit = (value >> (23 - i)) & 0x01
-        mosi.value(bit)
-        time.sleep_us(1)
-        sck.value(1)
-        time.sleep_us(1)
-        sck.value(0)
-        time.sleep_us(1)
+    spi.write(dacBuf)
     dacCS.value(1)
 
 
@@ -77,16 +74,8 @@ def setDac(value, channel):
     dacShiftOut(packet)
 
 def adcShiftIn():
-    value = 0
-    for i in range(16):
-        sck.value(1)
-        #time.sleep_us(1)
-        bit = adcSDO.value()
-        value = (value << 1) | bit
-        sck.value(0)
-        #time.sleep_us(1)
-    #adcCS.value(1)
-    return value
+    spi.readinto(adcBuf)
+    return (adcBuf[0] << 8) | adcBuf[1]
 
 def getADC():
     # start conversion
@@ -99,47 +88,58 @@ def getADC():
     return value
 
 downScaling = 512
+N = 65536 // downScaling    # pixels per sweep (rasterZoom also does 128)
+
+# Preallocated image, 2 bytes per sample. Same layout the old list of lists had:
+# row r = [backward sweep at Y=r | forward sweep at Y=r], N samples each
+# (row 0 only has a forward sweep, row N only a backward one).
+rowLen = 2 * N
+rows = N + 1
+image = array('H', bytes(2 * rows * rowLen))
+
+def scanRow(buf, base, x0, step, n):
+    # one X sweep of n pixels from DAC code x0, samples stored in sweep order
+    x = x0
+    for k in range(n):
+        setDac(x, 0)
+        time.sleep_us(2)
+        buf[base + k] = getADC()
+        x += step
+
 def raster():
-    for i in range(0, 65536, downScaling):
+    for k in range(N):
+        i = k * downScaling
         print(i)
         setDac(i, 1)
-        image.append([])
-        for j in range(0, 65536, downScaling):
-            setDac(j, 0)
-            time.sleep_us(2)
-            image[i//downScaling].append(getADC())
+        scanRow(image, k * rowLen + N, 0, downScaling, N)
 
-        i += downScaling
-
-        setDac(i, 1)
-        image.append([])
-
-        for j in range(65535, -1, -downScaling):
-            setDac(j, 0)
-            time.sleep_us(2)
-
-            image[i//downScaling].append(getADC())
+        setDac(i + downScaling, 1)
+        scanRow(image, (k + 1) * rowLen, 65535, -downScaling, N)
 
 def rasterZoom():
-    for i in range(65536//2 - 64, 65536//2 + 64, 1):
+    y0 = 65536//2 - 64
+    for k in range(N):
+        i = y0 + k
         print(i)
         setDac(i, 1)
-        image.append([])
-        for j in range(65536//2 - 64, 65536//2 + 64, 1):
-            setDac(j, 0)
-            time.sleep_us(2)
-            image[i - (65536//2 - 64)].append(getADC())
+        scanRow(image, k * rowLen + N, 65536//2 - 64, 1, N)
 
-        i += 1
-
-        setDac(i, 1)
-        image.append([])
+        setDac(i + 1, 1)
+        scanRow(image, (k + 1) * rowLen, 65536//2 + 64, -1, N)
 
-        for j in range(65536//2 + 64, 65536//2 - 64, -1):
-            setDac(j, 0)
-            time.sleep_us(2)
+def printImage():
+    # same text as printing the old list of lists, so it can be pasted into dataProcessor.py
+    print('[', end='')
+    for r in range(rows):
+        lo = r * rowLen + (N if r == 0 else 0)
+        hi = r * rowLen + (N if r == rows - 1 else rowLen)
+        print(list(image[lo:hi]), end=', ' if r < rows - 1 else '')
+    print(']')
 
-            image[i - (65536//2 - 64)].append(getADC())
+def dumpImage():
+    # whole buffer in one binary write: header line, then rows*rowLen uint16 LE
+    print('IMAGE ROWS=%d COLS=%d' % (rows, rowLen))
+    sys.stdout.buffer.write(image)
 
 setDac(32767, 0)
 setDac(32767, 1)
@@ -151,11 +151,15 @@ print("Ready to raster. Make sure tip is over sample.")
 print("Rastering...")
 #raster()
 rasterZoom()
-print(image)
+printImage()
 
+# send DUMP for the raw image (much faster than the printed list), PRINT to reprint
 while True:
-    pass
-    #
+    cmd = sys.stdin.readline().strip().upper()
+    if cmd == 'DUMP':
+        dumpImage()
+    elif cmd == 'PRINT':
+        printImage()
 
 #while True:
     #raster()
@@ -1,7 +1,11 @@
 from machine import Pin
+import rp2
 import time
 import sys
 import uselect
+import ubinascii
+import ure
+from array import array
 
 # ---------------- GPIO / DAC / ADC wiring ----------------
 stepOut = Pin(0, Pin.OUT)
@@ -12,17 +16,12 @@ stepPulses  = Pin(1, Pin.IN)
 stepUp      = Pin(4, Pin.IN)
 stepDown    = Pin(5, Pin.IN)
 
-dacCS = Pin(17, Pin.OUT)
-sck   = Pin(18, Pin.OUT)
-mosi  = Pin(19, Pin.OUT)
-
-adcCS = Pin(20, Pin.OUT)
-adcSDO= Pin(21, Pin.IN)
-
-dacCS.value(1)
-adcCS.value(0)
-sck.value(0)
-mosi.value(0)
+# DAC (LTC2654) + ADC (MCP33131) share SCK=18, both SPI mode 0; MOSI=19, ADC SDO=21,
+# DAC CS=17, ADC CNV=20. All of them are driven by the PIO state machine below.
+DAC_CS_PIN = 17
+SCK_PIN    = 18
+MOSI_PIN   = 19
+ADC_SDO_PIN = 21
 
 # ---------------- Config / State ----------------
 # DAC channels: 0:X, 1:Y, 2:spare, 3:Bias
@@ -39,6 +38,9 @@ bias_code = 20000      # default (constant unless BIAS command)
 # Timing
 PIXEL_SETTLE_US = 150  # settle after setting DAC before ADC read
 POINT_RATE_US   = 200  # time between POINT samples
+PIO_FREQ = 10_000_000  # PIO clock: SCK is 5 MHz on the DAC write, ~3.3 MHz on the ADC read
+# settle delay done inside PIO, in 16-cycle loops (max 255 -> ~400 us at 10 MHz)
+SETTLE_LOOPS = min(255, PIXEL_SETTLE_US * (PIO_FREQ // 1_000_000) // 16)
 
 # ---------------- Stepper IRQs (your existing helpers) ----------------
 def stepPulseHandler(pin):
@@ -57,41 +59,90 @@ stepPulses.irq(trigger=Pin.IRQ_RISING, handler=stepPulseHandler)
 stepUp.irq(trigger=Pin.IRQ_RISING, handler=stepUpPulseHandler)
 stepDown.irq(trigger=Pin.IRQ_RISING, handler=stepDownPulseHandler)
 
-# ---------------- Low-level DAC/ADC ----------------
-def dacShiftOut(value):
-    dacCS.value(0)
-    for i in range(24):
-        mosi.value((value >> (23 - i)) & 1)
-        time.sleep_us(1)
-        sck.value(1)
-        time.sleep_us(1)
-        sck.value(0)
-        time.sleep_us(1)
-    dacCS.value(1)
-
-def setDac(code16, channel):
+# ---------------- Low-level DAC/ADC (PIO) ----------------
+# One PIO pass per TX word = one pixel: DAC CS low, clock out the 24-bit DAC
+# packet, CS high (DAC updates), wait the settle loops, pulse CNV, clock in the
+# 16-bit ADC result and autopush it to the RX FIFO. Python just does put()/get().
+# TX word: [31:8] DAC packet, [7:0] settle loops.
+# set pins (base 17): bit0 DAC CS, bit1 SCK, bit2 MOSI, bit3 ADC CNV; side-set = SCK.
+@rp2.asm_pio(set_init=(rp2.PIO.OUT_HIGH, rp2.PIO.OUT_LOW, rp2.PIO.OUT_LOW, rp2.PIO.OUT_LOW),
+             out_init=rp2.PIO.OUT_LOW, sideset_init=rp2.PIO.OUT_LOW,
+             out_shiftdir=rp2.PIO.SHIFT_LEFT, in_shiftdir=rp2.PIO.SHIFT_LEFT,
+             autopush=True, push_thresh=16)
+def dac_adc_pio():
+    pull(block)             .side(0)
+    set(pins, 0b0000)       .side(0)        # DAC CS low
+    set(x, 23)              .side(0)
+    label("dac")
+    out(pins, 1)            .side(0)        # MOSI changes while SCK low
+    jmp(x_dec, "dac")       .side(1)        # DAC latches on the rising edge
+    set(pins, 0b0001)       .side(0)        # DAC CS high -> write & update
+    out(y, 8)               .side(0)
+    label("settle")
+    jmp(y_dec, "settle")    .side(0) [15]
+    set(pins, 0b1001)       .side(0) [15]   # CNV high: start conversion
+    nop()                   .side(0) [15]
+    set(pins, 0b0001)       .side(0) [3]    # CNV low: MSB on SDO
+    set(x, 15)              .side(0)
+    label("adc")
+    nop()                   .side(1)
+    in_(pins, 1)            .side(1)        # sample SDO with SCK high (mode 0)
+    jmp(x_dec, "adc")       .side(0)
+
+sm = rp2.StateMachine(0, dac_adc_pio, freq=PIO_FREQ,
+                      set_base=Pin(DAC_CS_PIN), out_base=Pin(MOSI_PIN),
+                      sideset_base=Pin(SCK_PIN), in_base=Pin(ADC_SDO_PIN))
+sm.active(1)
+
+DAC_NOP_WORD = (0b1111 << 20) << 8  # LTC2654 no-op: ADC read without touching the DAC
+
+def dac_packet(code16, channel):
     # command (0011 = write & update), 4-bit address, 16-bit data
-    packet = (0b0011 << 20) | ((channel & 0xF) << 16) | (code16 & 0xFFFF)
-    dacShiftOut(packet)
+    return (0b0011 << 20) | ((channel & 0xF) << 16) | (code16 & 0xFFFF)
 
-def adcShiftIn():
-    val = 0
-    for _ in range(16):
-        sck.value(1)
-        val = (val << 1) | adcSDO.value()
-        sck.value(0)
-    return val
+def pio_word(code16, channel, settle):
+    return (dac_packet(code16, channel) << 8) | settle
+
+def setDac(code16, channel):
+    sm.put(dac_packet(code16, channel) << 8)
+    sm.get()  # every pass also converts; drop the sample
 
 def getADC():
-    adcCS.value(1)
-    time.sleep_us(2)
-    adcCS.value(0)
-    return adcShiftIn()
+    sm.put(DAC_NOP_WORD)
+    return sm.get()
+
+# Two DMA channels feed a whole line through the state machine: one copies the
+# precomputed X words into the TX FIFO, the other copies each ADC result from the
+# RX FIFO into the row buffer. Paced by the PIO0 SM0 DREQs; the CPU only waits.
+PIO0_TXF0 = 0x50200010
+PIO0_RXF0 = 0x50200020
+DREQ_PIO0_TX0 = 0
+DREQ_PIO0_RX0 = 4
+
+dma_tx = rp2.DMA()
+dma_rx = rp2.DMA()
+DMA_TX_CTRL = dma_tx.pack_ctrl(size=2, inc_read=True, inc_write=False, treq_sel=DREQ_PIO0_TX0)
+DMA_RX_CTRL = dma_rx.pack_ctrl(size=1, inc_read=False, inc_write=True, treq_sel=DREQ_PIO0_RX0)
+
+def sweep_dma(words, codes, n):
+    """Run n pixels (PIO words) through the state machine; ADC codes land in codes[0..n-1]."""
+    dma_rx.config(read=PIO0_RXF0, write=codes, count=n, ctrl=DMA_RX_CTRL, trigger=True)
+    dma_tx.config(read=words, write=PIO0_TXF0, count=n, ctrl=DMA_TX_CTRL, trigger=True)
+    while dma_rx.active():
+        pass
+
+# bias channel command/address bits are fixed; only the 16-bit code varies
+BIAS_PKT = (0b0011 << 20) | (BIAS_CH << 16)
+_bias_word = None  # last PIO word sent on the bias channel
 
 def set_bias(code):
-    global bias_code
+    global bias_code, _bias_word
     bias_code = int(code) & 0xFFFF
-    setDac(bias_code, BIAS_CH)
+    word = (BIAS_PKT | bias_code) << 8
+    if word != _bias_word:  # the DAC holds its output, so only re-send on change
+        sm.put(word)
+        sm.get()
+        _bias_word = word
 
 # ---------------- Helpers ----------------
 def clamp_u16(x): return 0 if x < 0 else (65535 if x > 65535 else int(x))
@@ -101,6 +152,25 @@ def lin_code(pos, N):
     if N <= 1: return 0
     return clamp_u16((pos * 65535) // (N - 1))
 
+# lin_code for every pixel of the current N, rebuilt only when N changes,
+# plus the matching PIO words for both sweep directions (X write + settle + ADC
+# read, in acquisition order) and the row buffer the DMA fills
+_x_codes = array('H')
+_x_words_fwd = array('I')
+_x_words_rev = array('I')
+_row_codes = array('H')
+_x_codes_N = 0
+
+def code_table(N):
+    global _x_codes, _x_words_fwd, _x_words_rev, _row_codes, _x_codes_N
+    if N != _x_codes_N:
+        _x_codes = array('H', [lin_code(i, N) for i in range(N)])
+        _x_words_fwd = array('I', [pio_word(c, X_CH, SETTLE_LOOPS) for c in _x_codes])
+        _x_words_rev = array('I', reversed(_x_words_fwd))
+        _row_codes = array('H', bytes(2 * N))
+        _x_codes_N = N
+    return _x_codes
+
 def read_height_avg(samples=1):
     """Return one height reading as float; simple average of 'samples' ADC reads."""
     acc = 0
@@ -114,8 +184,8 @@ def read_height_avg(samples=1):
 # ---------------- Protocol (Text/CSV) ----------------
 # Commands supported:
 #   START N=<int>
-#   LINE N=<int> IDX=<int>
-#   POINT COUNT=<int>
+#   LINE N=<int> IDX=<int> [BIN=1 | ENC=b64u16]
+#   POINT COUNT=<int> [BIN=1]
 #   BIAS CODE=<int>
 #   STATUS
 #
@@ -124,45 +194,65 @@ def read_height_avg(samples=1):
 #   <csv of N floats>
 #   POINT OK COUNT=..
 #   <csv of COUNT floats>
+# With BIN=1 the header also carries BIN=1 and is followed by the raw
+# float32 little-endian samples (N*4 or COUNT*4 bytes, no newline).
+# With ENC=b64u16 (LINE only) the header carries ENC=b64u16 and the payload is
+# one base64 line of the raw ADC codes as uint16 LE; height = (code-32768)/4096.
 #   OK MSG="..."
 #   ERR CODE=<int> MSG="..."
+#
+# Parsing: one precompiled regex for the command word, one per key (keys may
+# come in any order; unknown keys are ignored, as before).
+_RX_CMD = ure.compile(r'^\s*(\w+)')
+_RX_KEY = {k: ure.compile(r'\s' + k + r'=(\S+)') for k in ('N', 'IDX', 'COUNT', 'CODE', 'BIN', 'ENC')}
+
+def arg(line, key):
+    """Value of KEY=... in the (uppercased) command line, or None."""
+    m = _RX_KEY[key].search(line)
+    return m.group(1) if m else None
+
+def send_floats(ys, binary):
+    """Emit a LINE/POINT payload: CSV text line, or raw float32 LE bytes."""
+    if binary:
+        sys.stdout.buffer.write(array('f', ys))
+    else:
+        # one CSV line; print adds '\n' and is flushed by the REPL transport
+        print(','.join('%.6f' % y for y in ys))
 
-def parse_kv(parts):
-    kv = {}
-    for p in parts:
-        if '=' in p:
-            k, v = p.split('=', 1)
-            kv[k.strip().upper()] = v.strip()
-    return kv
+def code_to_height(code):
+    return (code - 32768.0) / 4096.0
 
-def cmd_START(kv):
+def cmd_START(line):
     global frame_N, cur_line_idx, cur_dir
-    if 'N' not in kv:
+    n = arg(line, 'N')
+    if n is None:
         print('ERR CODE=10 MSG="START requires N"')
         return
-    n = int(kv['N'])
+    n = int(n)
     if n < 2 or n > 4096:
         print('ERR CODE=11 MSG="N out of range"'); return
     frame_N = n
     cur_line_idx = 0
     cur_dir = +1
+    code_table(n)
     print('OK MSG="start-ready"')
 
-def cmd_BIAS(kv):
-    if 'CODE' not in kv:
+def cmd_BIAS(line):
+    code = arg(line, 'CODE')
+    if code is None:
         print('ERR CODE=20 MSG="BIAS requires CODE"'); return
     try:
-        code = int(kv['CODE'])
+        code = int(code)
     except:
         print('ERR CODE=21 MSG="BIAS CODE invalid"'); return
     set_bias(code)
     print('OK MSG="bias-set"')
 
-def cmd_STATUS():
+def cmd_STATUS(line):
     print('OK MSG="ready" N=%d IDX=%d DIR=%+d BIAS_CODE=%d' % (frame_N, cur_line_idx, cur_dir, bias_code))
 
-def cmd_POINT(kv):
-    cnt = int(kv.get('COUNT', '200'))
+def cmd_POINT(line):
+    cnt = int(arg(line, 'COUNT') or '200')
     cnt = 1 if cnt < 1 else (4096 if cnt > 4096 else cnt)
 
     ys = []
@@ -170,16 +260,18 @@ def cmd_POINT(kv):
         time.sleep_us(POINT_RATE_US)
         ys.append(read_height_avg(1))
 
-    print('POINT OK COUNT=%d' % cnt)
-    # one CSV line; print adds '\n' and is flushed by the REPL transport
-    print(','.join('%.6f' % y for y in ys))
+    binary = arg(line, 'BIN') == '1'
+    print('POINT OK COUNT=%d%s' % (cnt, ' BIN=1' if binary else ''))
+    send_floats(ys, binary)
 
-def cmd_LINE(kv):
+def cmd_LINE(line):
     global frame_N, cur_line_idx, cur_dir
-    if 'N' not in kv or 'IDX' not in kv:
+    N = arg(line, 'N')
+    IDX = arg(line, 'IDX')
+    if N is None or IDX is None:
         print('ERR CODE=30 MSG="LINE requires N and IDX"'); return
-    N = int(kv['N'])
-    IDX = int(kv['IDX'])
+    N = int(N)
+    IDX = int(IDX)
     if N < 2 or N > 4096:
         print('ERR CODE=31 MSG="N out of range"'); return
     if IDX < 0 or IDX >= N:
@@ -191,29 +283,25 @@ def cmd_LINE(kv):
     # Device chooses zig-zag: even rows forward, odd rows reverse
     cur_dir = +1 if (IDX % 2 == 0) else -1
 
-    # Move Y to the correct row position
-    y_code = lin_code(IDX, N)
-    setDac(y_code, Y_CH)
-    # Ensure bias is set (sticky)
-    setDac(bias_code, BIAS_CH)
+    x_codes = code_table(N)
 
-    # Sweep X across the line with chosen direction
-    ys = []
-    if cur_dir > 0:
-        x_iter = range(N)
-    else:
-        x_iter = range(N-1, -1, -1)
+    # Move Y to the correct row position (same grid as X)
+    setDac(x_codes[IDX], Y_CH)
+    # (bias is sticky on the DAC: set once by set_bias, not rewritten per line)
 
-    for i in x_iter:
-        x_code = lin_code(i, N)
-        setDac(x_code, X_CH)
-        time.sleep_us(PIXEL_SETTLE_US)
-        ys.append(read_height_avg(1))
+    # Sweep X across the line with chosen direction; raw ADC codes, in acquisition
+    # order. X write, PIXEL_SETTLE_US and ADC read all happen in PIO, fed by DMA.
+    codes = _row_codes
+    sweep_dma(_x_words_fwd if cur_dir > 0 else _x_words_rev, codes, N)
 
-    # after acquiring ys (in acquisition order):
-    print('LINE OK N=%d IDX=%d DIR=%+d' % (N, IDX, cur_dir))
-    # one CSV line
-    print(','.join('%.6f' % y for y in ys))
+    if (arg(line, 'ENC') or '').lower() == 'b64u16':
+        # no float conversion or formatting on the device; b2a_base64 adds the '\n'
+        print('LINE OK N=%d IDX=%d DIR=%+d ENC=b64u16' % (N, IDX, cur_dir))
+        sys.stdout.write(ubinascii.b2a_base64(codes).decode())
+        return
+    binary = arg(line, 'BIN') == '1'
+    print('LINE OK N=%d IDX=%d DIR=%+d%s' % (N, IDX, cur_dir, ' BIN=1' if binary else ''))
+    send_floats([code_to_height(c) for c in codes], binary)
 
 # ---------------- Main loop: non-blocking serial ----------------
 setDac(32767, X_CH)
@@ -224,26 +312,28 @@ set_bias(bias_code)
 spoll = uselect.poll()
 spoll.register(sys.stdin, uselect.POLLIN)
 
+_DISPATCH = {
+    'START': cmd_START,
+    'LINE': cmd_LINE,
+    'POINT': cmd_POINT,
+    'BIAS': cmd_BIAS,
+    'STATUS': cmd_STATUS,
+}
+
 def handle_line(line):
-    parts = [p for p in line.strip().split() if p]
-    if not parts:
+    if not line.strip():
         return
-    cmd = parts[0].upper()
-    kv = parse_kv(parts[1:])
+    line = line.upper()
+    m = _RX_CMD.match(line)
+    if m is None:
+        print('ERR CODE=1 MSG="unknown command"'); return
 
     try:
-        if cmd == 'START':
-            cmd_START(kv)
-        elif cmd == 'LINE':
-            cmd_LINE(kv)
-        elif cmd == 'POINT':
-            cmd_POINT(kv)
-        elif cmd == 'BIAS':
-            cmd_BIAS(kv)
-        elif cmd == 'STATUS':
-            cmd_STATUS()
-        else:
+        fn = _DISPATCH.get(m.group(1))
+        if fn is None:
             print('ERR CODE=1 MSG="unknown command"')
+        else:
+            fn(line)
     except Exception as e:
         print('ERR CODE=99 MSG="exception: %s"' % str(e))
 
@@ -251,17 +341,23 @@ try:
     # Optional: send a hello once
     print('OK MSG="pico-ready"')
 
-    buf = ""
+    rxbuf = bytearray(256)   # current command line (longer lines are truncated)
+    rx1 = bytearray(1)
+    pos = 0
     while True:
-        # Non-blocking read of a line
-        if spoll.poll(0):
-            ch = sys.stdin.read(1)
-            if ch:
-                if ch == '\n':
-                    handle_line(buf)
-                    buf = ""
-                else:
-                    buf += ch
+        # Non-blocking: drain every byte already waiting into the preallocated
+        # line buffer. One byte per readinto, since a bigger readinto on stdin
+        # blocks until it's full.
+        while spoll.poll(0):
+            if not sys.stdin.buffer.readinto(rx1):
+                break
+            b = rx1[0]
+            if b == 10:  # '\n'
+                handle_line(str(rxbuf[:pos], 'utf-8'))
+                pos = 0
+            elif pos < len(rxbuf):
+                rxbuf[pos] = b
+                pos += 1
 
         # You can put low-priority background tasks here (e.g., watchdog)
         # time.sleep_ms(1)